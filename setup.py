@@ -118,6 +118,7 @@ translatescripts = [
         ('xliff2oo', 'translate.convert.xliff2oo:main'),
         ('xliff2po', 'translate.convert.xliff2po:main'),
         ('yaml2po', 'translate.convert.yaml2po:main'),
+        ('translate-pipeline', 'translate.convert.pipeline:main'),
         ('pofilter', 'translate.filters.pofilter:main'),
         ('tmserver', 'translate.services.tmserver:main'),
         ('build_tmdb', 'translate.tools.build_tmdb:main'),
@@ -166,6 +166,16 @@ def test_odf2xliff2_inline():
     assert reference_xlf == generated_xlf_toolkit
 
 
+def test_odf2xliff_jobs():
+    """The parts extracted in several processes make the same XLIFF."""
+    reference_xlf = factory.getobject(REFERENCE_XLF)
+
+    odf2xliff.main(args(SOURCE_ODF, GENERATED_XLF_TOOLKIT, jobs=2))
+    generated_xlf_toolkit = factory.getobject(GENERATED_XLF_TOOLKIT)
+    print_diff(reference_xlf, generated_xlf_toolkit)
+    assert reference_xlf == generated_xlf_toolkit
+
+
 def remove(filename):
     """Removes the file if it exists."""
     if os.path.exists(filename):
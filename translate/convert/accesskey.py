@@ -32,24 +32,32 @@ class UnitMixer:
     def __init__(self, labelsuffixes, accesskeysuffixes):
         self.labelsuffixes = labelsuffixes
         self.accesskeysuffixes = accesskeysuffixes
+        #: The label suffixes by their length, to find the suffixes of an
+        #: entity without trying all of them
+        self._labelsuffixindex = {}
+        for labelsuffix in labelsuffixes:
+            self._labelsuffixindex.setdefault(
+                len(labelsuffix), set()).add(labelsuffix)
+
+    def labelbases(self, entity):
+        """Returns the entity without each label suffix it ends with."""
+        return [entity[:-length]
+                for length, suffixes in self._labelsuffixindex.items()
+                if 0 < length <= len(entity) and entity[-length:] in suffixes]
 
     def match_entities(self, index):
         """Populates mixedentities from the index."""
         #: Entities which have a .label/.title and .accesskey combined
         mixedentities = {}
         for entity in index:
-            for labelsuffix in self.labelsuffixes:
-                if entity.endswith(labelsuffix):
-                    entitybase = entity[:entity.rfind(labelsuffix)]
-                    # see if there is a matching accesskey in this line,
-                    # making this a mixed entity
-                    for akeytype in self.accesskeysuffixes:
-                        if (entitybase + akeytype) in index:
-                            # add both versions to the list of mixed entities
-                            mixedentities[entity] = {}
-                            mixedentities[entitybase+akeytype] = {}
-                    # check if this could be a mixed entity (labelsuffix and
-                    # ".accesskey")
+            for entitybase in self.labelbases(entity):
+                # see if there is a matching accesskey in this line,
+                # making this a mixed entity
+                for akeytype in self.accesskeysuffixes:
+                    if (entitybase + akeytype) in index:
+                        # add both versions to the list of mixed entities
+                        mixedentities[entity] = {}
+                        mixedentities[entitybase+akeytype] = {}
         return mixedentities
 
     def mix_units(self, label_unit, accesskey_unit, target_unit):
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the speed of converters on a generated corpus.
+
+The corpus is a documentation page with the given number of sections, with
+headings, paragraphs with inline markup and entities, lists, tables, images
+and comments.  html2po extracts it, po2html merges a translation of every
+string into it::
+
+    python -m translate.convert.benchmark --sections 1000 po2html
+
+The template converters po2prop, po2dtd and po2php merge a translation into
+Java/Mozilla .properties, Mozilla .dtd and PHP files with the given number of
+sections, each with labels and their accesskeys, comments and plain strings.
+
+With ``--corpus DIR`` the page, the files and their translations are written
+to DIR, to run the converters on them from the command line.
+"""
+
+import os
+import sys
+import timeit
+from argparse import ArgumentParser
+from io import BytesIO
+
+from translate.convert import (dtd2po, html2po, php2po, po2dtd, po2html,
+                               po2php, po2prop, prop2po)
+from translate.storage import po
+
+
+DEFAULT_SECTIONS = 200
+"""The default number of sections of the generated page"""
+
+SECTION = u"""<!-- Section %(number)d -->
+<h2 id="section-%(number)d">Section %(number)d: Installing the &quot;toolkit&quot;</h2>
+<p>Download the <a href="download-%(number)d.html" title="Download page %(number)d">latest release</a>
+and unpack it.  Run <code>setup.py install</code> as <em>root</em> &amp; restart
+the &lt;server&gt; &mdash; see section %(number)d.</p>
+<img src="screenshot-%(number)d.png" alt="Screenshot %(number)d of the installer" />
+<ul>
+<li>Step one of %(number)d</li>
+<li><strong>Step two</strong> of %(number)d&nbsp;is optional</li>
+</ul>
+<table summary="Options of section %(number)d">
+<tr><th>Option</th><th>Meaning %(number)d</th></tr>
+<tr><td>--force</td><td>Overwrite existing files &copy; %(number)d</td></tr>
+</table>
+<pre>translate --section %(number)d</pre>
+<div class="note">Note %(number)d: <br />unpacking needs write access.</div>
+"""
+
+
+def samplehtml(sections):
+    """Returns a generated HTML page with the given number of sections, as
+    bytes.
+    """
+    body = u"".join(SECTION % {"number": number}
+                    for number in range(sections))
+    return (u"""<!DOCTYPE html>
+<html>
+<head>
+<meta http-equiv="Content-Type" content="text/html; charset=UTF-8" />
+<title>Benchmark documentation</title>
+<meta name="description" content="A generated documentation page" />
+</head>
+<body>
+%s</body>
+</html>
+""" % body).encode("utf-8")
+
+
+PROPERTIES_SECTION = u"""# LOCALIZATION NOTE (menu%(number)d.label): Menu %(number)d
+menu%(number)d.label=Open file %(number)d
+menu%(number)d.accesskey=O
+message%(number)d=Saved %(number)d files in %%S
+tooltip%(number)d.title=Close tab %(number)d
+tooltip%(number)d.accesskey=C
+"""
+
+DTD_SECTION = u"""<!-- LOCALIZATION NOTE (menu%(number)d.label): Menu %(number)d -->
+<!ENTITY menu%(number)d.label "Open file %(number)d">
+<!ENTITY menu%(number)d.accesskey "O">
+<!ENTITY message%(number)d "Saved %(number)d files in &brandShortName;">
+<!ENTITY tooltip%(number)d.title "Close tab %(number)d">
+<!ENTITY tooltip%(number)d.accesskey "C">
+"""
+
+PHP_SECTION = u"""// Section %(number)d
+$lang['menu%(number)d'] = 'Open file %(number)d';
+$lang['message%(number)d'] = 'Saved %(number)d files in %%s';
+$messages = array(
+    'tooltip%(number)d' => 'Close tab %(number)d',
+);
+"""
+
+
+def sampletemplates(sections):
+    """Returns generated .properties, .dtd and PHP files with the given number
+    of sections, as bytes keyed on the file name.
+    """
+    def generate(section):
+        return u"".join(section % {"number": number}
+                        for number in range(sections))
+    return {
+        "sample.properties": generate(PROPERTIES_SECTION).encode("utf-8"),
+        "sample.dtd": generate(DTD_SECTION).encode("utf-8"),
+        "sample.php": (u"<?php\n" + generate(PHP_SECTION)).encode("utf-8"),
+    }
+
+
+def translate(store):
+    """Returns the store with a translation of every string, as bytes."""
+    for unit in store.units:
+        if not unit.isheader():
+            unit.target = unit.source.upper()
+    return bytes(store)
+
+
+def samplepo(htmlsource):
+    """Returns a PO file with a translation of every string of the page, as
+    bytes.
+    """
+    return translate(extract(htmlsource))
+
+
+def _convert(converter, inputsource, templatesource=None, **kwargs):
+    inputfile = BytesIO(inputsource)
+    inputfile.name = "sample"
+    outputfile = BytesIO()
+    templatefile = None
+    if templatesource is not None:
+        templatefile = BytesIO(templatesource)
+    converter(inputfile, outputfile, templatefile, **kwargs)
+    return outputfile.getvalue()
+
+
+#: The template converters with the file name of their template and the
+#: converter that extracts it
+TEMPLATE_CONVERTERS = [
+    ("po2prop", "sample.properties", prop2po.convertmozillaprop,
+     po2prop.convertmozillaprop),
+    ("po2dtd", "sample.dtd", dtd2po.convertdtd, po2dtd.convertdtd),
+    ("po2php", "sample.php", php2po.run_converter, po2php.convertphp),
+]
+
+
+def sampletranslations(templates):
+    """Returns a PO file with a translation of every string of each template,
+    as bytes keyed on the file name of the template.
+    """
+    translations = {}
+    for name, filename, extractor, converter in TEMPLATE_CONVERTERS:
+        posource = _convert(extractor, templates[filename])
+        translations[filename] = translate(po.pofile(BytesIO(posource)))
+    return translations
+
+
+def mergetemplate(converter, posource, templatesource):
+    """Merges the translation into the template with the converter."""
+    return _convert(converter, posource, templatesource)
+
+
+def extract(htmlsource):
+    """Extracts the strings of the page like html2po."""
+    return html2po.html2po().convertfile(BytesIO(htmlsource), "sample.html")
+
+
+def merge(posource, htmlsource):
+    """Merges the translation into the page like po2html."""
+    outputfile = BytesIO()
+    po2html.converthtml(BytesIO(posource), outputfile, BytesIO(htmlsource))
+    return outputfile.getvalue()
+
+
+def measure(function, number=3, repeat=3):
+    """Returns the fastest time in seconds of calling the function number
+    times.
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+def writecorpus(directory, files):
+    """Writes the files, keyed on their names, to the directory."""
+    os.makedirs(directory, exist_ok=True)
+    for name, content in files.items():
+        with open(os.path.join(directory, name), "wb") as corpusfile:
+            corpusfile.write(content)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("names", metavar="NAME", nargs="*",
+                        help="converters to measure: html2po, po2html, "
+                             "po2prop, po2dtd, po2php (default: all)")
+    parser.add_argument("--sections", type=int, default=DEFAULT_SECTIONS,
+                        help="sections of the generated files "
+                             "(default: %(default)s)")
+    parser.add_argument("--number", type=int, default=3,
+                        help="conversions per measurement "
+                             "(default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of measurements, the fastest is used "
+                             "(default: %(default)s)")
+    parser.add_argument("--corpus", metavar="DIR",
+                        help="write the files and their translations to "
+                             "DIR")
+    args = parser.parse_args()
+
+    htmlsource = samplehtml(args.sections)
+    posource = samplepo(htmlsource)
+    templates = sampletemplates(args.sections)
+    translations = sampletranslations(templates)
+    if args.corpus:
+        files = {"sample.html": htmlsource, "sample.html.po": posource}
+        files.update(templates)
+        files.update((name + ".po", translation)
+                     for name, translation in translations.items())
+        writecorpus(args.corpus, files)
+    print("%d bytes of HTML, %d strings" %
+          (len(htmlsource), len(extract(htmlsource).units) - 1))
+    converters = [
+        ("html2po", lambda: extract(htmlsource)),
+        ("po2html", lambda: merge(posource, htmlsource)),
+    ]
+    for name, filename, extractor, converter in TEMPLATE_CONVERTERS:
+        converters.append((name, lambda converter=converter,
+                           filename=filename: mergetemplate(
+                               converter, translations[filename],
+                               templates[filename])))
+    for name, function in converters:
+        if args.names and name not in args.names:
+            continue
+        seconds = measure(function, args.number, args.repeat)
+        print("%-10s %9.3fms per conversion" %
+              (name, seconds * 1000 / args.number))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
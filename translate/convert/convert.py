@@ -21,6 +21,7 @@
 :mod:`translate.convert` tools).
 """
 
+import logging
 import os.path
 from io import BytesIO
 
@@ -41,7 +42,12 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser, object):
                                                   allowmissingtemplate=allowmissingtemplate,
                                                   description=description)
         self.usepots = usepots
+        #: The :class:`~translate.convert.manifest.ConversionManifest` of
+        #: ``--manifest``, if enabled
+        self.manifest = None
+        self._optionshashes = {}
         self.settimestampoption()
+        self.setmanifestoption()
         self.setpotoption()
         self.set_usage()
 
@@ -162,6 +168,16 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser, object):
         )
         self.define_option(timestampopt)
 
+    def setmanifestoption(self):
+        """Sets ``--manifest`` option."""
+        manifestopt = optparse.Option(
+            "", "--manifest",
+            action="store_true", dest="manifest", default=False,
+            help="skip conversion of files that didn't change since the "
+                 "previous run, using a manifest in the output directory"
+        )
+        self.define_option(manifestopt)
+
     def verifyoptions(self, options):
         """Verifies that the options are valid (required options are present,
         etc).
@@ -177,16 +193,88 @@ class ConvertOptionParser(optrecurse.RecursiveOptionParser, object):
             self.verifyoptions(options)
         except Exception as e:
             self.error(str(e))
+        if self.capture is not None:
+            # Before archives and manifests are opened by recursiveprocess
+            self.capture.append((self, options))
+            return
         self.recursiveprocess(options)
 
+    def openmanifest(self, options):
+        """Returns the manifest of the output directory, or None if the
+        input or output is not a directory.
+        """
+        if not (isinstance(options.input, str) and
+                os.path.isdir(options.input) and options.output and
+                not os.path.isfile(options.output)):
+            self.warning("--manifest needs an input and output directory, "
+                         "converting all files")
+            return None
+        from translate.convert import manifest
+        # Make the summary visible with the default logging setup of the tools
+        manifest.logger.setLevel(logging.INFO)
+        return manifest.ConversionManifest(options.output)
+
+    def recursiveprocess(self, options):
+        """Recurse through directories and convert files, skipping unchanged
+        files with ``--manifest``.
+        """
+        self.manifest = None
+        if getattr(options, "manifest", False):
+            self.manifest = self.openmanifest(options)
+        super().recursiveprocess(options)
+        if self.manifest is not None:
+            self.manifest.removestale()
+            self.manifest.save()
+            self.manifest.logsummary()
+
+    def getoptionshash(self, options, fileprocessor):
+        """Returns the hash of the converter and options of the manifest."""
+        if fileprocessor not in self._optionshashes:
+            from translate.convert import manifest
+            passthroughoptions = self.getpassthroughoptions(options)
+            # The number of processes doesn't change the output
+            passthroughoptions.pop("jobs", None)
+            self._optionshashes[fileprocessor] = manifest.optionshash(
+                fileprocessor, passthroughoptions)
+        return self._optionshashes[fileprocessor]
+
     def processfile(self, fileprocessor, options, fullinputpath,
                     fulloutputpath, fulltemplatepath):
         if options.timestamp and _output_is_newer(fullinputpath, fulloutputpath):
             return False
 
-        return super().processfile(
-            fileprocessor, options, fullinputpath, fulloutputpath,
-            fulltemplatepath)
+        if self.manifest is None or not fulloutputpath:
+            return super().processfile(
+                fileprocessor, options, fullinputpath, fulloutputpath,
+                fulltemplatepath)
+
+        entry = self.manifest.entry(
+            fullinputpath, fulltemplatepath,
+            self.getoptionshash(options, fileprocessor))
+        if self.manifest.isuptodate(fulloutputpath, entry):
+            return False
+        try:
+            success = super().processfile(
+                fileprocessor, options, fullinputpath, fulloutputpath,
+                fulltemplatepath)
+        except Exception:
+            self.manifest.discard(fulloutputpath)
+            raise
+        if success:
+            self.manifest.record(fulloutputpath, entry)
+        else:
+            self.manifest.discard(fulloutputpath)
+        return success
+
+    def getworkerstats(self, options):
+        """Returns the changes to the manifest made by a worker process."""
+        if self.manifest is None:
+            return None
+        return self.manifest.popchanges()
+
+    def addworkerstats(self, options, stats):
+        if self.manifest is not None and stats is not None:
+            self.manifest.addchanges(stats)
 
 
 def copyinput(inputfile, outputfile, templatefile, **kwargs):
@@ -405,6 +493,24 @@ class ArchiveConvertOptionParser(ConvertOptionParser):
         else:
             return super().openoutputfile(options, fulloutputpath)
 
+    def openmanifest(self, options):
+        """Archives have no manifest."""
+        if any(self.isarchive(getattr(options, filepurpose), filepurpose)
+               for filepurpose in ("input", "output", "template")
+               if getattr(options, filepurpose, None)):
+            self.warning("--manifest can't be used with archives, "
+                         "converting all files")
+            return None
+        return super().openmanifest(options)
+
+    def canprocessinpool(self, options):
+        """Archives are read and written in the main process only."""
+        if any(self.isarchive(getattr(options, filepurpose), filepurpose)
+               for filepurpose in ("input", "output", "template")
+               if getattr(options, filepurpose, None)):
+            return False
+        return super().canprocessinpool(options)
+
     def recursiveprocess(self, options):
         """Recurse through directories and convert files."""
         if hasattr(options, "multifilestyle"):
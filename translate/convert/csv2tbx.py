@@ -72,7 +72,7 @@ def convertcsv(inputfile, outputfile, templatefile, charset=None,
     return 1
 
 
-def main():
+def main(argv=None):
     from translate.convert import convert
     formats = {
         ("csv", "tbx"): ("tbx", convertcsv),
@@ -88,7 +88,7 @@ def main():
         help="specify the order and position of columns (comment,source,target)")
     parser.passthrough.append("charset")
     parser.passthrough.append("columnorder")
-    parser.run()
+    parser.run(argv)
 
 
 if __name__ == '__main__':
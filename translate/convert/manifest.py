@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""A manifest of the files written by a converter.
+
+With ``--manifest`` the converters record a hash of the input, the template,
+the conversion options and the output of every output file in
+``.translate-manifest.json`` in the output directory.  The next run skips the
+files where none of them changed, and removes the outputs of inputs that no
+longer exist.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from translate import __version__ as toolkitversion
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".translate-manifest.json"
+"""The name of the manifest in the output directory"""
+
+
+def _hashfile(digest, path):
+    with open(path, "rb") as hashedfile:
+        for block in iter(lambda: hashedfile.read(1 << 16), b""):
+            digest.update(block)
+
+
+def filehash(path):
+    """Returns a hash of the content of the file, or None if there is no such
+    file.
+    """
+    if not path or not os.path.isfile(path):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    _hashfile(digest, path)
+    return digest.hexdigest()
+
+
+def optionshash(fileprocessor, options):
+    """Returns a hash of the converter and the options passed to it.
+
+    Options that name files or directories, like a translation memory, are
+    hashed with the content of the files.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(("%s %s\0" % (toolkitversion.sver,
+                                toolkitversion.build)).encode("utf-8"))
+    digest.update(("%s.%s\0" % (fileprocessor.__module__,
+                                fileprocessor.__qualname__)).encode("utf-8"))
+    # The state of objects like convert.Replacer changes the output
+    instance = getattr(fileprocessor, "__self__", None)
+    if instance is not None:
+        digest.update(repr(sorted(vars(instance).items())).encode("utf-8"))
+    for name, value in sorted(options.items()):
+        digest.update(("%s=%r\0" % (name, value)).encode("utf-8"))
+        for path in value if isinstance(value, list) else [value]:
+            if not isinstance(path, str):
+                continue
+            if os.path.isfile(path):
+                _hashfile(digest, path)
+            elif os.path.isdir(path):
+                for dirpath, dirnames, filenames in os.walk(path):
+                    dirnames.sort()
+                    for filename in sorted(filenames):
+                        digest.update(filename.encode("utf-8",
+                                                      "surrogateescape"))
+                        _hashfile(digest, os.path.join(dirpath, filename))
+    return digest.hexdigest()
+
+
+class ConversionManifest:
+    """The hashes of the inputs, templates, options and outputs of the files
+    written to an output directory.
+
+    The manifest is read when it is created and written by :meth:`save`.
+    Worker processes of ``--jobs`` hand their changes to the main process
+    with :meth:`popchanges` and :meth:`addchanges`.
+    """
+
+    #: The version of the manifest format, other versions are ignored
+    version = 1
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        self.filename = os.path.join(self.directory, MANIFEST_FILENAME)
+        #: The recorded entries, keyed by the output path relative to the
+        #: output directory
+        self.entries = {}
+        #: Entries changed since :meth:`popchanges`, None for removed entries
+        self._changes = {}
+        #: Files written, unchanged files skipped and stale files removed
+        self.converted = 0
+        self.skipped = 0
+        self.removed = 0
+        self.load()
+
+    def load(self):
+        """Reads the manifest, an unreadable manifest is started over."""
+        try:
+            with open(self.filename) as manifestfile:
+                manifest = json.load(manifestfile)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable manifest %s: %s",
+                           self.filename, e)
+            return
+        if manifest.get("version") == self.version:
+            self.entries = manifest.get("outputs", {})
+
+    def save(self):
+        """Writes the manifest, replacing the previous one at once."""
+        if not os.path.isdir(self.directory):
+            return
+        temporary = self.filename + ".tmp"
+        with open(temporary, "w") as manifestfile:
+            json.dump({"version": self.version, "outputs": self.entries},
+                      manifestfile, indent=1, sort_keys=True)
+            manifestfile.write("\n")
+        os.replace(temporary, self.filename)
+
+    def _key(self, path):
+        return os.path.relpath(os.path.abspath(path),
+                               self.directory).replace(os.sep, "/")
+
+    def _path(self, key):
+        return os.path.join(self.directory, key.replace("/", os.sep))
+
+    def entry(self, fullinputpath, fulltemplatepath, optionshash):
+        """Returns the entry describing a conversion of the input with the
+        template and options.
+        """
+        return {
+            "inputpath": self._key(fullinputpath),
+            "input": filehash(fullinputpath),
+            "template": filehash(fulltemplatepath),
+            "options": optionshash,
+        }
+
+    def isuptodate(self, fulloutputpath, entry):
+        """Returns whether the output was written by the conversion described
+        by entry, and wasn't changed since.
+        """
+        recorded = self.entries.get(self._key(fulloutputpath))
+        if recorded is None or entry["input"] is None:
+            return False
+        if any(recorded.get(name) != value for name, value in entry.items()):
+            return False
+        if recorded.get("output") != filehash(fulloutputpath):
+            return False
+        self.skipped += 1
+        return True
+
+    def record(self, fulloutputpath, entry):
+        """Records that the conversion described by entry wrote the output."""
+        key = self._key(fulloutputpath)
+        self.entries[key] = self._changes[key] = dict(
+            entry, output=filehash(fulloutputpath))
+        self.converted += 1
+
+    def discard(self, fulloutputpath):
+        """Forgets the output, for example when its conversion failed."""
+        key = self._key(fulloutputpath)
+        if self.entries.pop(key, None) is not None:
+            self._changes[key] = None
+
+    def popchanges(self):
+        """Returns the changes and counts since the previous call."""
+        changes = (self._changes, self.converted, self.skipped)
+        self._changes = {}
+        self.converted = self.skipped = 0
+        return changes
+
+    def addchanges(self, changes):
+        """Adds the result of :meth:`popchanges` of another process."""
+        entries, converted, skipped = changes
+        for key, entry in entries.items():
+            if entry is None:
+                self.entries.pop(key, None)
+            else:
+                self.entries[key] = entry
+        self.converted += converted
+        self.skipped += skipped
+
+    def removestale(self):
+        """Removes the outputs of inputs that no longer exist."""
+        for key, entry in list(self.entries.items()):
+            if os.path.isfile(self._path(entry["inputpath"])):
+                continue
+            path = self._path(key)
+            if os.path.isfile(path):
+                os.remove(path)
+                self.removed += 1
+            del self.entries[key]
+
+    def logsummary(self):
+        """Logs the number of converted, skipped and removed files."""
+        logger.info("%d files converted, %d unchanged files skipped, "
+                    "%d stale files removed",
+                    self.converted, self.skipped, self.removed)
@@ -25,16 +25,39 @@ for examples and usage instructions.
 
 from io import BytesIO
 
+from lxml import etree
+
 from translate.convert import convert
 from translate.storage import factory
 from translate.storage.odf_io import open_odf
 from translate.storage.odf_shared import (inline_elements,
                                           no_translate_content_elements)
-from translate.storage.xml_extract.extract import ParseState, build_store
+from translate.storage.xliff import xlifffile
+from translate.storage.xml_extract.extract import (ParseState,
+                                                   build_store_incrementally)
+
+
+def extract_part(data, store):
+    """Add the units of an ODF part, like content.xml, to the store."""
+    parse_state = ParseState(no_translate_content_elements, inline_elements)
+    build_store_incrementally(BytesIO(data), store, parse_state)
+
+
+def _extract_part_units(data):
+    """Return the units of an ODF part as serialized XLIFF elements, in a
+    worker process.
+    """
+    store = xlifffile()
+    extract_part(data, store)
+    return [etree.tostring(unit.xmlelement) for unit in store.units]
+
 
+def convertodf(inputfile, outputfile, templates, jobs=1):
+    """Convert an ODF package to XLIFF.
 
-def convertodf(inputfile, outputfile, templates):
-    """Convert an ODF package to XLIFF."""
+    :param jobs: The number of processes that extract the parts of the ODF
+                 package.
+    """
 
     store = factory.getobject(outputfile)
 
@@ -44,9 +67,16 @@ def convertodf(inputfile, outputfile, templates):
         print("couldn't set origin filename")
 
     contents = open_odf(inputfile)
-    for data in contents.values():
-        parse_state = ParseState(no_translate_content_elements, inline_elements)
-        build_store(BytesIO(data), store, parse_state)
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(min(jobs, len(contents))) as pool:
+            for units in pool.map(_extract_part_units, contents.values()):
+                for unit in units:
+                    store.addunit(store.UnitClass.createfromxmlElement(
+                        etree.fromstring(unit)))
+    else:
+        for data in contents.values():
+            extract_part(data, store)
 
     store.save()
     return True
@@ -91,6 +121,7 @@ def main(argv=None):
         "oth": ("xliff", convertodf),  # Web page template
     }
     parser = convert.ConvertOptionParser(formats, description=__doc__)
+    parser.passthrough.append("jobs")
     parser.run(argv)
 
 
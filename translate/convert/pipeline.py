@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Runs several converters on files without writing the files in between.
+
+Every stage is a converter with its options, as on its command line but
+without the input and output.  Every input file goes through all the stages
+in memory, only the output of the last stage is written::
+
+    translate-pipeline en-US af "prop2po -P | pot2po -t af-po | po2prop -t en-US"
+
+See: http://docs.translatehouse.org/projects/translate-toolkit/en/latest/commands/translate-pipeline.html
+for examples and usage instructions.
+"""
+
+import importlib
+import inspect
+import logging
+import os
+import shlex
+import sys
+from argparse import REMAINDER, ArgumentParser
+from io import BytesIO
+
+from translate.misc import optrecurse
+
+
+logger = logging.getLogger(__name__)
+
+STAGE_SEPARATOR = "|"
+"""The argument that separates the stages of a pipeline"""
+
+
+class MemoryFile(BytesIO):
+    """An in-memory file with a name.
+
+    Closing the file rewinds it instead, converters that read a file again
+    after parsing it, like pot2po, get its content again as they would by
+    opening the file by its name.
+    """
+
+    def __init__(self, name, content=b""):
+        super().__init__(content)
+        self.name = name
+
+    def close(self):
+        self.seek(0)
+
+
+class PipelineStage:
+    """A converter of a pipeline, with its parser and options."""
+
+    def __init__(self, name, parser, options):
+        self.name = name
+        self.parser = parser
+        self.options = options
+        self.passthroughoptions = parser.getpassthroughoptions(options)
+
+    @classmethod
+    def fromargs(cls, name, args):
+        """Returns the stage of the converter or tool name with the command
+        line arguments args.
+        """
+        for package in ("translate.convert", "translate.tools"):
+            modulename = "%s.%s" % (package, name)
+            try:
+                module = importlib.import_module(modulename)
+                break
+            except ModuleNotFoundError as e:
+                if e.name != modulename:
+                    raise
+        else:
+            raise ValueError("unknown converter %s" % name)
+        main = getattr(module, "main", None)
+        if main is None or "argv" not in inspect.signature(main).parameters:
+            raise ValueError("%s can't be used in a pipeline" % name)
+        captured = []
+        optrecurse.RecursiveOptionParser.capture = captured
+        try:
+            # The input is given by the pipeline, "-" keeps the parser happy
+            main(list(args) + ["-"])
+        finally:
+            optrecurse.RecursiveOptionParser.capture = None
+        if not captured:
+            raise ValueError("%s can't be used in a pipeline" % name)
+        parser, options = captured[-1]
+        options.recursiveoutput = True
+        options.recursivetemplate = bool(
+            parser.usetemplates and options.template and
+            parser.isrecursive(options.template, 'template'))
+        return cls(name, parser, options)
+
+    def accepts(self, inputname):
+        """Returns whether the converter converts files like inputname, files
+        it doesn't convert are skipped as in a recursive run.
+        """
+        return self.parser.isvalidinputname(inputname)
+
+    def convert(self, inputname, inputfile):
+        """Converts the input file, returns the output file or None if the
+        converter didn't produce any output.
+        """
+        parser, options = self.parser, self.options
+        templatename = parser.gettemplatename(options, inputname)
+        outputformat, fileprocessor = parser.getoutputoptions(
+            options, inputname, templatename)
+        outputname = parser.getoutputname(options, inputname, outputformat)
+        templatefile = parser.opentemplatefile(
+            options, parser.getfulltemplatepath(options, templatename))
+        outputfile = MemoryFile(outputname)
+        if not fileprocessor(inputfile, outputfile, templatefile,
+                             **self.passthroughoptions):
+            return None
+        return outputfile
+
+
+class Pipeline:
+    """Stages that convert files one after the other, in memory."""
+
+    def __init__(self, stages):
+        self.stages = stages
+
+    @classmethod
+    def fromargs(cls, args):
+        """Returns the pipeline of the stages in args, separated by
+        :data:`STAGE_SEPARATOR`.  A single argument is split like a shell
+        command line.
+        """
+        if len(args) == 1:
+            args = shlex.split(args[0])
+        stages = [[]]
+        for arg in args:
+            if arg == STAGE_SEPARATOR:
+                stages.append([])
+            else:
+                stages[-1].append(arg)
+        if not all(stages):
+            raise ValueError("empty pipeline stage")
+        return cls([PipelineStage.fromargs(stage[0], stage[1:])
+                    for stage in stages])
+
+    def getinputfiles(self, inputpath):
+        """Returns the files of the input directory that the first stage
+        converts, relative to the directory.
+        """
+        parser, options = self.stages[0].parser, self.stages[0].options
+        options.input = inputpath
+        return parser.recurseinputfiles(options)
+
+    def convertfile(self, inputname, inputfile):
+        """Runs the stages on the input file, returns the name and content of
+        the output, or None if a stage didn't accept the file or didn't
+        produce any output.
+        """
+        for stage in self.stages:
+            if not stage.accepts(inputname):
+                return None
+            outputfile = stage.convert(inputname, inputfile)
+            if outputfile is None:
+                return None
+            inputname = outputfile.name
+            inputfile = MemoryFile(inputname, outputfile.getvalue())
+        return inputname, inputfile.getvalue()
+
+    def convertpath(self, inputdir, inputname, output, recursive=True):
+        """Converts a file and writes the output, returns whether there was
+        any output.
+        """
+        with open(os.path.join(inputdir, inputname), "rb") as inputfile:
+            result = self.convertfile(
+                inputname, MemoryFile(inputname, inputfile.read()))
+        if result is None:
+            return False
+        outputname, content = result
+        outputpath = os.path.join(output, outputname) if recursive else output
+        outputdir = os.path.dirname(outputpath)
+        if outputdir:
+            os.makedirs(outputdir, exist_ok=True)
+        with open(outputpath, "wb") as outputfile:
+            outputfile.write(content)
+        return True
+
+
+#: The pipeline of a worker process of --jobs
+_pipeline = None
+
+
+def _initworker(pipeline):
+    global _pipeline
+    _pipeline = pipeline
+
+
+def _convertpath(task):
+    """Converts a file in a worker process, returns whether there was any
+    output and the error message if the conversion failed.
+    """
+    try:
+        return _pipeline.convertpath(*task), None
+    except Exception as e:
+        return False, "%s: %s" % (task[1], e)
+
+
+def run(pipeline, inputpath, output, jobs=1, progress="none"):
+    """Converts the file or the files in the directory inputpath with the
+    pipeline and writes the outputs to output.
+
+    :return: The number of files that were converted.
+    """
+    if os.path.isdir(inputpath):
+        inputdir = inputpath
+        inputnames = pipeline.getinputfiles(inputpath)
+        recursive = True
+    else:
+        inputdir, inputname = os.path.split(inputpath)
+        inputnames = [inputname]
+        recursive = os.path.isdir(output)
+    tasks = [(inputdir, inputname, output, recursive)
+             for inputname in inputnames]
+    progress_bar = optrecurse.ProgressBar(progress, inputnames)
+
+    def report(results):
+        converted = 0
+        for task, (success, message) in zip(tasks, results):
+            if message:
+                logger.warning("Error converting %s", message)
+            converted += success
+            progress_bar.report_progress(task[1], success)
+        return converted
+
+    if jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(jobs, initializer=_initworker,
+                                 initargs=(pipeline,)) as pool:
+            return report(pool.map(_convertpath, tasks))
+    _initworker(pipeline)
+    return report(map(_convertpath, tasks))
+
+
+def main(argv=None):
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("input", help="input file or directory")
+    parser.add_argument("output", help="output file or directory")
+    parser.add_argument("stages", metavar="STAGE", nargs=REMAINDER,
+                        help="converters and their options, separated by "
+                             "'%s'" % STAGE_SEPARATOR)
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="convert files in JOBS processes "
+                             "(default: %(default)s)")
+    parser.add_argument("--progress", default="bar",
+                        choices=list(optrecurse.ProgressBar.progress_types),
+                        help="show progress as: %(choices)s "
+                             "(default: %(default)s)")
+    args = parser.parse_args(argv)
+    if not args.stages:
+        parser.error("no pipeline stages given")
+    try:
+        pipeline = Pipeline.fromargs(args.stages)
+    except ValueError as e:
+        parser.error(str(e))
+    run(pipeline, args.input, args.output, args.jobs, args.progress)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
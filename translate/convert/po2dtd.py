@@ -25,7 +25,8 @@
 
 import warnings
 
-from translate.convert import accesskey, convert
+from translate.convert import convert
+from translate.convert.templatemerge import TranslationIndex
 from translate.misc import quote
 from translate.storage import dtd, po
 
@@ -37,7 +38,7 @@ def dtdwarning(message, category, filename, lineno, line=None):
 warnings.formatwarning = dtdwarning
 
 
-def applytranslation(entity, dtdunit, inputunit, mixedentities):
+def applytranslation(entity, dtdunit, inputunit, index):
     """applies the translation for entity in the po unit to the dtd unit"""
     # this converts the po-style string to a dtd-style string
     unquotedstr = inputunit.target
@@ -45,31 +46,8 @@ def applytranslation(entity, dtdunit, inputunit, mixedentities):
     if len(unquotedstr.strip()) == 0:
         return
     # handle mixed entities
-    for labelsuffix in dtd.labelsuffixes:
-        if entity.endswith(labelsuffix):
-            if entity in mixedentities:
-                unquotedstr, akey = accesskey.extract(unquotedstr)
-                break
-    else:
-        for akeytype in dtd.accesskeysuffixes:
-            if entity.endswith(akeytype):
-                if entity in mixedentities:
-                    label, unquotedstr = accesskey.extract(unquotedstr)
-                    if not unquotedstr:
-                        warnings.warn("Could not find accesskey for %s" % entity)
-                        # Use the source language accesskey
-                        label, unquotedstr = accesskey.extract(inputunit.source)
-                    else:
-                        original = dtdunit.source
-                        # For the sake of diffs we keep the case of the
-                        # accesskey the same if we know the translation didn't
-                        # change. Casing matters in XUL.
-                        if unquotedstr == dtdunit.source and original.lower() == unquotedstr.lower():
-                            if original.isupper():
-                                unquotedstr = unquotedstr.upper()
-                            elif original.islower():
-                                unquotedstr = unquotedstr.lower()
-    dtdunit.source = unquotedstr
+    dtdunit.source = index.mixedtranslation(entity, unquotedstr,
+                                            inputunit.source)
 
 
 class redtd:
@@ -77,28 +55,27 @@ class redtd:
 
     def __init__(self, dtdfile, android=False, remove_untranslated=False):
         self.dtdfile = dtdfile
-        self.mixer = accesskey.UnitMixer(dtd.labelsuffixes, dtd.accesskeysuffixes)
         self.android = False
         self.remove_untranslated = remove_untranslated
 
     def convertstore(self, inputstore, includefuzzy=False):
-        for inunit in inputstore.units:
-            self.handleinunit(inunit, includefuzzy)
+        index = TranslationIndex(inputstore, dtd.labelsuffixes,
+                                 dtd.accesskeysuffixes)
+        for entity, dtdunit in self.dtdfile.id_index.items():
+            inunit = index.get(entity)
+            if inunit is not None:
+                self.handleinunit(entity, dtdunit, inunit, index,
+                                  includefuzzy)
         return self.dtdfile
 
-    def handleinunit(self, inunit, includefuzzy):
-        entities = inunit.getlocations()
-        mixedentities = self.mixer.match_entities(entities)
-        for entity in entities:
-            if entity in self.dtdfile.id_index:
-                # now we need to replace the definition of entity with msgstr
-                dtdunit = self.dtdfile.id_index[entity]  # find the dtd
-                if inunit.istranslated() or not bool(inunit.source):
-                    applytranslation(entity, dtdunit, inunit, mixedentities)
-                elif self.remove_untranslated and not (includefuzzy and inunit.isfuzzy()):
-                    dtdunit.entity = None
-                else:
-                    applytranslation(entity, dtdunit, inunit, mixedentities)
+    def handleinunit(self, entity, dtdunit, inunit, index, includefuzzy):
+        # now we need to replace the definition of entity with msgstr
+        if inunit.istranslated() or not bool(inunit.source):
+            applytranslation(entity, dtdunit, inunit, index)
+        elif self.remove_untranslated and not (includefuzzy and inunit.isfuzzy()):
+            dtdunit.entity = None
+        else:
+            applytranslation(entity, dtdunit, inunit, index)
 
 
 class po2dtd:
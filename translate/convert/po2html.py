@@ -32,22 +32,26 @@ class po2html:
     file otherwise will just concat msgstrs
     """
 
-    def lookup(self, string):
-        unit = self.inputstore.sourceindex.get(string, None)
-        if unit is None:
-            return string
-        unit = unit[0]
+    def translation(self, unit):
+        """Returns the text that replaces the source of the unit."""
         if unit.istranslated():
             return unit.target
         if self.includefuzzy and unit.isfuzzy():
             return unit.target
         return unit.source
 
+    def lookup(self, string):
+        return self.translations.get(string, string)
+
     def mergestore(self, inputstore, templatetext, includefuzzy):
         """converts a file to .po format"""
         self.inputstore = inputstore
-        self.inputstore.makeindex()
         self.includefuzzy = includefuzzy
+        # The template is parsed once, every block is looked up in this
+        self.translations = {
+            source: self.translation(units[0])
+            for source, units in self.inputstore.sourceindex.items()
+        }
         output_store = html.htmlfile(inputfile=templatetext, callback=self.lookup)
         return output_store.filesrc
 
@@ -30,12 +30,13 @@ import lxml.etree as etree
 from translate.convert import convert
 from translate.storage import factory
 from translate.storage.idml import (NO_TRANSLATE_ELEMENTS,
-                                    INLINE_ELEMENTS, copy_idml, open_idml)
+                                    INLINE_ELEMENTS, open_idml)
 from translate.storage.xml_extract.extract import (ParseState,
                                                    process_idml_translatable)
 from translate.storage.xml_extract.generate import (apply_translations,
                                                     replace_dom_text)
 from translate.storage.xml_extract.unit_tree import XPathTree, build_unit_tree
+from translate.storage.zip import copymembers
 
 
 def translate_idml(template, input_file, translatable_files):
@@ -136,17 +137,13 @@ def translate_idml(template, input_file, translatable_files):
 
 def write_idml(template_zip, output_file, dom_trees):
     """Write the translated IDML package."""
-    output_zip = ZipFile(output_file, 'w', compression=ZIP_DEFLATED)
-
-    # Copy the IDML package.
-    output_zip = copy_idml(template_zip, output_zip, dom_trees.keys())
-
-    # Replace the translated files in the IDML package.
-    for filename, dom_tree in dom_trees.items():
-        output_zip.writestr(filename, etree.tostring(dom_tree,
-                                                     encoding='UTF-8',
-                                                     xml_declaration=True,
-                                                     standalone='yes'))
+    translated = dict((filename, etree.tostring(dom_tree, encoding='UTF-8',
+                                                xml_declaration=True,
+                                                standalone='yes'))
+                      for filename, dom_tree in dom_trees.items())
+    with ZipFile(output_file, 'w', compression=ZIP_DEFLATED) as output_zip:
+        # Stream the IDML package with the translated files in their place
+        copymembers(template_zip, output_zip, replacements=translated)
 
 
 def convertpo(input_file, output_file, template):
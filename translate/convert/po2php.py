@@ -26,6 +26,7 @@ for examples and usage instructions.
 import re
 
 from translate.convert import convert
+from translate.convert.templatemerge import TranslationIndex
 from translate.misc import quote
 from translate.storage import php, po
 
@@ -48,7 +49,7 @@ class rephp:
 
     def convertstore(self, includefuzzy=False):
         self.includefuzzy = includefuzzy
-        self.inputstore.makeindex()
+        self.index = TranslationIndex(self.inputstore)
         outputlines = []
 
         for line in self.templatefile.readlines():
@@ -124,13 +125,12 @@ class rephp:
                 else:
                     inlinecomment = ""
 
-                if lookupkey in self.inputstore.locationindex:
-                    unit = self.inputstore.locationindex[lookupkey]
+                unit = self.index.get(lookupkey)
+                if unit is not None:
+                    value = unit.target
                     if ((unit.isfuzzy() and not self.includefuzzy) or
-                        len(unit.target) == 0):
+                        len(value) == 0):
                         value = unit.source
-                    else:
-                        value = unit.target
 
                     value = php.phpencode(value, self.quotechar)
                     self.inecho = False
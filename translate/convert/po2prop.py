@@ -23,9 +23,8 @@ See: http://docs.translatehouse.org/projects/translate-toolkit/en/latest/command
 for examples and usage instructions.
 """
 
-import warnings
-
-from translate.convert import accesskey, convert
+from translate.convert import convert
+from translate.convert.templatemerge import TranslationIndex
 from translate.misc import quote
 from translate.storage import po, properties
 
@@ -33,38 +32,6 @@ from translate.storage import po, properties
 eol = u"\n"
 
 
-def applytranslation(key, propunit, inunit, mixedkeys):
-    """applies the translation for key in the po unit to the prop unit"""
-    # this converts the po-style string to a prop-style string
-    value = inunit.target
-    # handle mixed keys
-    for labelsuffix in properties.labelsuffixes:
-        if key.endswith(labelsuffix):
-            if key in mixedkeys:
-                value, akey = accesskey.extract(value)
-                break
-    else:
-        for akeysuffix in properties.accesskeysuffixes:
-            if key.endswith(akeysuffix):
-                if key in mixedkeys:
-                    label, value = accesskey.extract(value)
-                    if not value:
-                        warnings.warn("Could not find accesskey for %s" % key)
-                        # Use the source language accesskey
-                        label, value = accesskey.extract(inunit.source)
-                    else:
-                        original = propunit.source
-                        # For the sake of diffs we keep the case of the
-                        # accesskey the same if we know the translation didn't
-                        # change. Casing matters in XUL.
-                        if value == propunit.source and original.lower() == value.lower():
-                            if original.isupper():
-                                value = value.upper()
-                            elif original.islower():
-                                value = value.lower()
-    return value
-
-
 class reprop:
 
     def __init__(self, templatefile, inputstore, personality, encoding=None,
@@ -76,14 +43,17 @@ class reprop:
         if self.encoding is None:
             self.encoding = self.personality.default_encoding
         self.remove_untranslated = remove_untranslated
-        self.mixer = accesskey.UnitMixer(properties.labelsuffixes,
-                                         properties.accesskeysuffixes)
 
     def convertstore(self, includefuzzy=False):
         self.includefuzzy = includefuzzy
         self.inmultilinemsgid = False
         self.inecho = False
-        self.inputstore.makeindex()
+        if self.personality.name == "mozilla":
+            self.index = TranslationIndex(self.inputstore,
+                                          properties.labelsuffixes,
+                                          properties.accesskeysuffixes)
+        else:
+            self.index = TranslationIndex(self.inputstore)
         if self.personality.name == "gaia":
             self._explode_gaia_plurals()
         outputlines = []
@@ -94,19 +64,6 @@ class reprop:
             outputlines.append(outputstr)
         return u"".join(outputlines).encode(self.encoding)
 
-    def _handle_accesskeys(self, inunit, currkey):
-        value = inunit.target
-        if self.personality.name == "mozilla":
-            keys = inunit.getlocations()
-            mixedkeys = self.mixer.match_entities(keys)
-            for key in keys:
-                if key == currkey and key in self.inputstore.locationindex:
-                    propunit = self.inputstore.locationindex[key]  # find the prop
-                    value = applytranslation(key, propunit, inunit, mixedkeys)
-                    break
-
-        return value
-
     def _explode_gaia_plurals(self):
         """Explode the gaia plurals."""
         from translate.lang import data
@@ -128,10 +85,10 @@ class reprop:
                 new_location = '%s[%s]' % (location, category)
                 new_unit.addlocation(new_location)
                 new_unit.target = text
-                self.inputstore.locationindex[new_location] = new_unit
+                self.index.units[new_location] = new_unit
 
             # We don't want the plural marker to be translated:
-            del self.inputstore.locationindex[location]
+            del self.index.units[location]
 
     def convertline(self, line):
         returnline = u""
@@ -162,16 +119,18 @@ class reprop:
                 postspaceend = len(line[delimiter_pos+1:].lstrip())
                 postspace = line[delimiter_pos+1:delimiter_pos+(postspacestart-postspaceend)+1]
                 delimiter = prespace + delimiter_char + postspace
-            if key in self.inputstore.locationindex:
-                unit = self.inputstore.locationindex[key]
+            if key in self.index:
+                unit = self.index.get(key)
                 if unit is None or not unit.istranslated() and bool(unit.source) and self.remove_untranslated:
                     returnline = u""
                     self.inecho = False
                 else:
-                    if unit.isfuzzy() and not self.includefuzzy or len(unit.target) == 0:
+                    target = unit.target
+                    if unit.isfuzzy() and not self.includefuzzy or len(target) == 0:
                         value = unit.source
                     else:
-                        value = self._handle_accesskeys(unit, key)
+                        value = self.index.mixedtranslation(key, target,
+                                                            unit.source)
                     self.inecho = False
                     assert isinstance(value, str)
                     returnline = "%(key)s%(del)s%(value)s%(term)s%(eol)s" % {
@@ -101,6 +101,8 @@ class tmxmultifile:
 
 
 class TmxOptionParser(convert.ArchiveConvertOptionParser):
+    #: All files are collected in one TMX file by the main process
+    allowjobs = False
 
     def recursiveprocess(self, options):
         if not options.targetlanguage:
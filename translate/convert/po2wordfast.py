@@ -79,6 +79,8 @@ class wfmultifile:
 
 
 class WfOptionParser(convert.ArchiveConvertOptionParser):
+    #: All files are collected in one Wordfast file by the main process
+    allowjobs = False
 
     def recursiveprocess(self, options):
         if not options.targetlanguage:
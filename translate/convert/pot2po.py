@@ -56,11 +56,13 @@ def convertpot(input_file, output_file, template_file, tm=None,
 
 
 def convert_stores(input_store, template_store, temp_store=None, tm=None,
-                   min_similarity=75, fuzzymatching=True, **kwargs):
+                   min_similarity=75, fuzzymatching=True, jobs=1, **kwargs):
     """Actual conversion function, works on stores not files, returns
     a properly initialized pretranslated output store, with structure
     based on input_store, metadata based on template_store, migrates
     old translations from template_store and pretranslating from TM.
+
+    :param jobs: The number of processes that look for fuzzy matches.
     """
     if temp_store is None:
         temp_store = input_store
@@ -86,12 +88,18 @@ def convert_stores(input_store, template_store, temp_store=None, tm=None,
     #initialize store
     _store_pre_merge(input_store, temp_store, template_store)
 
+    fuzzy_matches = None
+    if matchers and jobs > 1:
+        fuzzy_matches = _match_fuzzy_in_pool(temp_store, template_store,
+                                             matchers, input_store.merge_on,
+                                             jobs)
+
     # Do matching
     for input_unit in temp_store.units:
         if input_unit.istranslatable():
             input_unit = pretranslate.pretranslate_unit(
                 input_unit, template_store, matchers, mark_reused=True,
-                merge_on=input_store.merge_on)
+                merge_on=input_store.merge_on, fuzzy_matches=fuzzy_matches)
             _unit_post_merge(input_unit, input_store, temp_store, template_store)
 
     #finalize store
@@ -100,6 +108,52 @@ def convert_stores(input_store, template_store, temp_store=None, tm=None,
     return temp_store
 
 
+#: The fuzzy matchers of a worker process of --jobs
+_matchers = None
+
+
+def _initworker(matchers):
+    global _matchers
+    _matchers = matchers
+
+
+def _match_fuzzy_sources(sources):
+    """Returns the fuzzy matches of the sources, in a worker process."""
+    return [pretranslate.match_fuzzy_source(source, _matchers)
+            for source in sources]
+
+
+def _match_fuzzy_in_pool(store, template_store, matchers, merge_on, jobs):
+    """Looks for the fuzzy matches of the units of the store that have no
+    translation in the template, in jobs processes that each hold the
+    matchers.
+
+    :return: The fuzzy matches keyed on the source text.
+    """
+    sources = []
+    for unit in store.units:
+        if (unit.istranslatable() and
+            pretranslate.needs_fuzzy_match(unit, template_store, merge_on)):
+            sources.append(unit.source)
+    # Every source is matched once, in the order of the store
+    sources = list(dict.fromkeys(sources))
+    if len(sources) < 2:
+        return None
+    jobs = min(jobs, len(sources))
+    # A few batches per process even out slow and fast batches
+    batchsize = -(-len(sources) // (jobs * 4))
+    batches = [sources[start:start + batchsize]
+               for start in range(0, len(sources), batchsize)]
+    from concurrent.futures import ProcessPoolExecutor
+    fuzzy_matches = {}
+    with ProcessPoolExecutor(jobs, initializer=_initworker,
+                             initargs=(matchers,)) as pool:
+        for batch, matches in zip(batches,
+                                  pool.map(_match_fuzzy_sources, batches)):
+            fuzzy_matches.update(zip(batch, matches))
+    return fuzzy_matches
+
+
 ##dispatchers
 def _prepare_merge(input_store, output_store, template_store, **kwargs):
     """Prepare stores & TM matchers before merging."""
@@ -298,6 +352,7 @@ def main(argv=None):
         "--nofuzzymatching", dest="fuzzymatching",
         action="store_false", default=True, help="Disable fuzzy matching")
     parser.passthrough.append("fuzzymatching")
+    parser.passthrough.append("jobs")
 
     parser.run(argv)
 
@@ -61,14 +61,14 @@ def converttbx(inputfile, outputfile, templatefile, charset=None,
     return 1
 
 
-def main():
+def main(argv=None):
     from translate.convert import convert
     formats = {
         ("tbx", None): ("po", converttbx),
     }
     parser = convert.ConvertOptionParser(formats, usetemplates=False,
                                          description=__doc__)
-    parser.run()
+    parser.run(argv)
 
 
 if __name__ == '__main__':
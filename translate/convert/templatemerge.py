@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Merges the translations of a store into a template.
+
+The converters that write a translated file from a template, like po2prop,
+po2dtd and po2php, walk the template once and look up the translation of every
+key in a :class:`TranslationIndex` of the translated store.
+"""
+
+import warnings
+
+from translate.convert import accesskey
+
+
+class TranslationIndex:
+    """The units of a translated store by location.
+
+    Mozilla formats define a label and its accesskey as separate keys, that
+    are combined into one unit like ``&File`` when they are extracted.  With
+    the suffixes of such keys, the index records which locations of a unit
+    are such a pair, so that :meth:`mixedtranslation` can split the
+    translation again.
+    """
+
+    def __init__(self, store, labelsuffixes=(), accesskeysuffixes=()):
+        self.store = store
+        #: The units keyed on location, the first unit is kept for duplicate
+        #: locations
+        self.units = dict(store.locationindex)
+        self.mixer = accesskey.UnitMixer(labelsuffixes, accesskeysuffixes)
+        #: The locations that are a label or an accesskey combined with its
+        #: pair in the same unit
+        self.mixedlocations = set()
+        if labelsuffixes and accesskeysuffixes:
+            for unit in store.units:
+                locations = unit.getlocations()
+                if len(locations) < 2:
+                    continue
+                for location in self.mixer.match_entities(locations):
+                    if self.units.get(location) is unit:
+                        self.mixedlocations.add(location)
+
+    def __contains__(self, location):
+        return location in self.units
+
+    def get(self, location):
+        """Returns the unit for the location, or None."""
+        return self.units.get(location)
+
+    def mixedtranslation(self, location, translation, source):
+        """Returns the part of the translation for the location.
+
+        If the location is a label that was combined with its accesskey, this
+        is the translation without the accesskey marker, if it is the
+        accesskey, the marked character.  A translation without an accesskey
+        gives the accesskey of the source.
+
+        :param translation: The translation of the combined unit.
+        :param source: The source text of the combined unit.
+        """
+        if location not in self.mixedlocations:
+            return translation
+        if self.mixer.labelbases(location):
+            return accesskey.extract(translation)[0]
+        for akeysuffix in self.mixer.accesskeysuffixes:
+            if location.endswith(akeysuffix):
+                akey = accesskey.extract(translation)[1]
+                if not akey:
+                    warnings.warn("Could not find accesskey for %s" % location)
+                    # Use the source language accesskey
+                    akey = accesskey.extract(source)[1]
+                return akey
+        return translation
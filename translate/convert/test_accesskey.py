@@ -111,3 +111,16 @@ def test_accesskey_already_in_text():
     """test that we can combine if the accesskey is already in the text"""
     assert accesskey.combine(u"Mail & Newsgroups", u"N") == u"Mail & &Newsgroups"
     assert accesskey.extract(u"Mail & &Newsgroups") == (u"Mail & Newsgroups", u"N")
+
+
+def test_match_entities():
+    """test that labels are matched with their accesskeys"""
+    mixer = accesskey.UnitMixer((".label", ".title"),
+                                (".accesskey", ".akey"))
+    assert mixer.labelbases(u"open.label") == [u"open"]
+    assert mixer.labelbases(u"open.accesskey") == []
+    mixed = mixer.match_entities([u"open.label", u"open.accesskey",
+                                  u"close.title", u"close.akey",
+                                  u"save.label", u"print.accesskey"])
+    assert sorted(mixed) == [u"close.akey", u"close.title",
+                             u"open.accesskey", u"open.label"]
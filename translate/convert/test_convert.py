@@ -118,8 +118,12 @@ class TestConvertCommand:
         options = self.help_check(options, "-h, --help")
         options = self.help_check(options, "--manpage")
         options = self.help_check(options, "--errorlevel=ERRORLEVEL")
+        if "--jobs=JOBS" in options:
+            # Not offered by converters that collect all files in one
+            options = self.help_check(options, "-j JOBS, --jobs=JOBS")
         options = self.help_check(options, "-i INPUT, --input=INPUT")
         options = self.help_check(options, "-x EXCLUDE, --exclude=EXCLUDE")
         options = self.help_check(options, "-o OUTPUT, --output=OUTPUT")
         options = self.help_check(options, "-S, --timestamp")
+        options = self.help_check(options, "--manifest")
         return options
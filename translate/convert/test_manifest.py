@@ -0,0 +1,89 @@
+import json
+import logging
+
+from translate.convert import manifest, txt2po
+
+
+def convert(inputdir, outputdir, *args):
+    txt2po.main(["--progress=none", "--manifest", str(inputdir),
+                 str(outputdir)] + list(args))
+
+
+def test_filehash(tmpdir):
+    first = tmpdir.join("first.txt")
+    first.write("content")
+    second = tmpdir.join("second.txt")
+    second.write("content")
+    assert manifest.filehash(str(first)) == manifest.filehash(str(second))
+    second.write("changed")
+    assert manifest.filehash(str(first)) != manifest.filehash(str(second))
+    assert manifest.filehash(str(tmpdir.join("missing"))) is None
+    assert manifest.filehash(None) is None
+
+
+def test_optionshash(tmpdir):
+    tm = tmpdir.join("tm.po")
+    tm.write("first")
+    options = {"tm": str(tm), "duplicatestyle": "msgctxt"}
+    original = manifest.optionshash(convert, options)
+    assert manifest.optionshash(convert, dict(options)) == original
+    assert manifest.optionshash(test_filehash, options) != original
+    assert manifest.optionshash(
+        convert, dict(options, duplicatestyle="merge")) != original
+    tm.write("second")
+    assert manifest.optionshash(convert, options) != original
+
+
+def test_manifest(tmpdir, caplog):
+    inputdir = tmpdir.mkdir("input")
+    outputdir = tmpdir.join("output")
+    inputdir.join("a.txt").write("First\n")
+    inputdir.mkdir("sub").join("b.txt").write("Second\n")
+    caplog.set_level(logging.INFO, manifest.__name__)
+    convert(inputdir, outputdir)
+    assert "2 files converted, 0 unchanged files skipped" in caplog.text
+    recorded = json.loads(outputdir.join(manifest.MANIFEST_FILENAME).read())
+    assert sorted(recorded["outputs"]) == ["a.po", "sub/b.po"]
+
+    caplog.clear()
+    convert(inputdir, outputdir)
+    assert "0 files converted, 2 unchanged files skipped" in caplog.text
+
+    # Changed inputs and outputs are converted again
+    caplog.clear()
+    inputdir.join("a.txt").write("Changed\n")
+    outputdir.join("sub", "b.po").write("")
+    convert(inputdir, outputdir)
+    assert "2 files converted, 0 unchanged files skipped" in caplog.text
+    assert "Changed" in outputdir.join("a.po").read()
+    assert "Second" in outputdir.join("sub", "b.po").read()
+
+    # Other options convert all files again
+    caplog.clear()
+    convert(inputdir, outputdir, "--duplicates=merge")
+    assert "2 files converted, 0 unchanged files skipped" in caplog.text
+
+    # The outputs of removed inputs are removed
+    caplog.clear()
+    inputdir.join("a.txt").remove()
+    convert(inputdir, outputdir, "--duplicates=merge")
+    assert ("0 files converted, 1 unchanged files skipped, "
+            "1 stale files removed") in caplog.text
+    assert not outputdir.join("a.po").exists()
+
+
+def test_manifest_jobs(tmpdir, caplog):
+    inputdir = tmpdir.mkdir("input")
+    outputdir = tmpdir.join("output")
+    for name in ("a", "b", "c"):
+        inputdir.join(name + ".txt").write(name.upper() + "\n")
+    caplog.set_level(logging.INFO, manifest.__name__)
+    convert(inputdir, outputdir, "--jobs=2")
+    assert "3 files converted, 0 unchanged files skipped" in caplog.text
+
+    caplog.clear()
+    inputdir.join("b.txt").write("Changed\n")
+    convert(inputdir, outputdir, "--jobs=2")
+    assert "1 files converted, 2 unchanged files skipped" in caplog.text
+    recorded = json.loads(outputdir.join(manifest.MANIFEST_FILENAME).read())
+    assert sorted(recorded["outputs"]) == ["a.po", "b.po", "c.po"]
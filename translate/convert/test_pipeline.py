@@ -0,0 +1,98 @@
+import pytest
+
+from translate.convert import pipeline, po2prop, pot2po, prop2po
+
+
+PO_TRANSLATION = b'''msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+#: hello
+msgid "Hello"
+msgstr "Hallo"
+'''
+
+
+def test_memoryfile():
+    memoryfile = pipeline.MemoryFile("a.po", b"content")
+    assert memoryfile.name == "a.po"
+    assert memoryfile.read() == b"content"
+    # Closing rewinds, the content can be read again
+    memoryfile.close()
+    assert memoryfile.read() == b"content"
+
+
+def test_fromargs():
+    stages = pipeline.Pipeline.fromargs(
+        ["prop2po -P | pot2po --nofuzzymatching"]).stages
+    assert [stage.name for stage in stages] == ["prop2po", "pot2po"]
+    assert stages[0].options.pot
+    assert not stages[1].passthroughoptions["fuzzymatching"]
+    stages = pipeline.Pipeline.fromargs(
+        ["prop2po", "|", "podebug", "--rewrite=xxx"]).stages
+    assert [stage.name for stage in stages] == ["prop2po", "podebug"]
+    assert stages[1].options.rewritestyle == "xxx"
+    with pytest.raises(ValueError):
+        pipeline.Pipeline.fromargs(["prop2po |"])
+    with pytest.raises(ValueError):
+        pipeline.Pipeline.fromargs(["nosuchconverter"])
+    with pytest.raises(ValueError):
+        pipeline.Pipeline.fromargs(["pocount"])
+
+
+def test_convertfile():
+    converter = pipeline.Pipeline.fromargs(
+        ["prop2po | podebug --rewrite=xxx"])
+    outputname, content = converter.convertfile(
+        "sub/a.properties",
+        pipeline.MemoryFile("sub/a.properties", b"hello=Hello\n"))
+    assert outputname == "sub/a.po"
+    assert b'msgstr "xxxHelloxxx"' in content
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run(tmpdir, jobs):
+    """the pipeline writes what the converters write one after the other"""
+    source = tmpdir.mkdir("en-US")
+    source.mkdir("sub").join("a.properties").write("hello=Hello\nbye=Bye\n")
+    source.join("b.properties").write("thing=Thing\n")
+    translations = tmpdir.mkdir("af-po")
+    translations.mkdir("sub").join("a.po").write_binary(PO_TRANSLATION)
+
+    converter = pipeline.Pipeline.fromargs(
+        ["prop2po -P | pot2po -t %s | po2prop -t %s" %
+         (translations, source)])
+    output = tmpdir.join("af")
+    assert pipeline.run(converter, str(source), str(output), jobs=jobs) == 2
+
+    prop2po.main(["--progress=none", "-P", str(source),
+                  str(tmpdir.join("pot"))])
+    pot2po.main(["--progress=none", "-t", str(translations),
+                 str(tmpdir.join("pot")), str(tmpdir.join("po"))])
+    po2prop.main(["--progress=none", "-t", str(source),
+                  str(tmpdir.join("po")), str(tmpdir.join("af-separate"))])
+    for name in ("sub/a.properties", "b.properties"):
+        assert (output.join(name).read() ==
+                tmpdir.join("af-separate", name).read())
+    assert "hello=Hallo" in output.join("sub", "a.properties").read()
+
+
+def test_main_file(tmpdir):
+    tmpdir.join("a.properties").write("hello=Hello\n")
+    pipeline.main(["--progress=none", str(tmpdir.join("a.properties")),
+                   str(tmpdir.join("a.pot")), "prop2po", "-P"])
+    assert 'msgid "Hello"' in tmpdir.join("a.pot").read()
+
+
+def test_run_skips_unaccepted(tmpdir, caplog):
+    """files that a later stage doesn't convert are skipped, not errors"""
+    source = tmpdir.mkdir("en-US")
+    source.join("a.properties").write("hello=Hello\n")
+    source.join("c.html").write("<p>Hello</p>\n")
+    converter = pipeline.Pipeline.fromargs(
+        ["moz2po -P | podebug --rewrite=xxx"])
+    output = tmpdir.join("out")
+    assert pipeline.run(converter, str(source), str(output)) == 1
+    assert "Error" not in caplog.text
+    assert 'msgstr "xxxHelloxxx"' in output.join("a.properties.po").read()
+    assert not output.join("c.html").exists()
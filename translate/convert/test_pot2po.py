@@ -17,7 +17,7 @@ class TestPOT2PO:
     def teardown_method(self, method):
         warnings.resetwarnings()
 
-    def convertpot(self, potsource, posource=None):
+    def convertpot(self, potsource, posource=None, **kwargs):
         """helper that converts pot source to po source without requiring files"""
         potfile = wStringIO.StringIO(potsource)
         if posource:
@@ -25,7 +25,7 @@ class TestPOT2PO:
         else:
             pofile = None
         pooutfile = wStringIO.StringIO()
-        pot2po.convertpot(potfile, pooutfile, pofile)
+        pot2po.convertpot(potfile, pooutfile, pofile, **kwargs)
         pooutfile.seek(0)
         return po.pofile(pooutfile.read())
 
@@ -776,6 +776,45 @@ msgstr ""
         print('Expected:\n%s' % expected)
         assert bytes(newpo).decode('utf-8') == expected
 
+    def test_fuzzy_matching_jobs(self):
+        """Test that fuzzy matching in several processes gives the same
+        output as in one."""
+        potsource = '''#: a.c:1
+msgid "Open the file"
+msgstr ""
+
+#: b.c:2
+msgid "Close the window now"
+msgstr ""
+
+#: c.c:3
+msgid "Save the document"
+msgstr ""
+
+#: d.c:4
+msgid "Something entirely different"
+msgstr ""
+'''
+        posource = '''#: a.c:1
+msgid "Open the file"
+msgstr "Maak die lêer oop"
+
+#: x.c:2
+msgid "Close the window"
+msgstr "Sluit die venster"
+
+#: x.c:3
+msgid "Save the documents"
+msgstr "Stoor die dokumente"
+'''
+        newpo = self.convertpot(potsource, posource)
+        assert newpo.units[2].isfuzzy()
+        assert newpo.units[2].target == "Sluit die venster"
+        assert newpo.units[3].isfuzzy()
+        assert not newpo.units[4].target
+        assert bytes(self.convertpot(potsource, posource,
+                                     jobs=2)) == bytes(newpo)
+
 
 class TestPOT2POCommand(test_convert.TestConvertCommand, TestPOT2PO):
     """Tests running actual pot2po commands on files"""
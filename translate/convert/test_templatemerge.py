@@ -0,0 +1,61 @@
+from io import BytesIO
+
+import pytest
+
+from translate.convert import templatemerge
+from translate.storage import po
+
+
+POSOURCE = b'''#: open.label
+#: open.accesskey
+msgid "&Open"
+msgstr "&Oopen"
+
+#: save.label
+#: save.accesskey
+msgid "&Save"
+msgstr "Stoor"
+
+#: message
+msgid "Message"
+msgstr "Boodskap"
+
+#: message
+msgid "Duplicate"
+msgstr "Duplikaat"
+'''
+
+
+def index(labelsuffixes=(".label",), accesskeysuffixes=(".accesskey",)):
+    return templatemerge.TranslationIndex(po.pofile(BytesIO(POSOURCE)),
+                                          labelsuffixes, accesskeysuffixes)
+
+
+def test_get():
+    translations = index()
+    assert "message" in translations
+    assert translations.get("message").target == "Boodskap"
+    assert translations.get("missing") is None
+    assert translations.mixedlocations == {"open.label", "open.accesskey",
+                                           "save.label", "save.accesskey"}
+
+
+def test_mixedtranslation():
+    translations = index()
+    assert translations.mixedtranslation("open.label", "&Oopen",
+                                         "&Open") == "Oopen"
+    assert translations.mixedtranslation("open.accesskey", "&Oopen",
+                                         "&Open") == "O"
+    assert translations.mixedtranslation("message", "Boodskap",
+                                         "Message") == "Boodskap"
+    # A translation without an accesskey keeps the accesskey of the source
+    with pytest.warns(UserWarning):
+        assert translations.mixedtranslation("save.accesskey", "Stoor",
+                                             "&Save") == "S"
+
+
+def test_unmixed():
+    translations = index((), ())
+    assert not translations.mixedlocations
+    assert translations.mixedtranslation("open.label", "&Oopen",
+                                         "&Open") == "&Oopen"
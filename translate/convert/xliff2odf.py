@@ -30,13 +30,14 @@ import lxml.etree as etree
 
 from translate.convert import convert
 from translate.storage import factory
-from translate.storage.odf_io import copy_odf, open_odf
+from translate.storage.odf_io import open_odf
 from translate.storage.odf_shared import (inline_elements,
                                           no_translate_content_elements)
 from translate.storage.xml_extract.extract import ParseState
 from translate.storage.xml_extract.generate import (apply_translations,
                                                     replace_dom_text)
 from translate.storage.xml_extract.unit_tree import XPathTree, build_unit_tree
+from translate.storage.zip import copymembers
 
 
 def translate_odf(template, input_file):
@@ -101,18 +102,15 @@ def write_odf(template, output_file, dom_trees):
     The resulting ODF package is a copy of the template ODF package, with the
     translatable files replaced by their translated versions.
     """
-    template_zip = zipfile.ZipFile(template, 'r')
-    output_zip = zipfile.ZipFile(output_file, 'w',
-                                 compression=zipfile.ZIP_DEFLATED)
-
-    # Copy the ODF package.
-    output_zip = copy_odf(template_zip, output_zip, dom_trees.keys())
-
-    # Overwrite the translated files to the ODF package.
-    for filename, dom_tree in dom_trees.items():
-        output_zip.writestr(filename, etree.tostring(dom_tree,
-                                                     encoding='UTF-8',
-                                                     xml_declaration=True))
+    translated = dict((filename, etree.tostring(dom_tree, encoding='UTF-8',
+                                                xml_declaration=True))
+                      for filename, dom_tree in dom_trees.items())
+    with zipfile.ZipFile(template, 'r') as template_zip, \
+            zipfile.ZipFile(output_file, 'w',
+                            compression=zipfile.ZIP_DEFLATED) as output_zip:
+        # Stream the ODF package with the translated files in their place,
+        # the uncompressed mimetype stays the first member.
+        copymembers(template_zip, output_zip, replacements=translated)
 
 
 def convertxliff(input_file, output_file, template):
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the speed of the decoration helpers used by the checks.
+
+Every helper of :mod:`translate.filters.decoration` runs on generated strings
+of the given length, with long runs of whitespace and punctuation at both
+ends, and with the punctuation of the given language::
+
+    python -m translate.filters.benchmark --length 10000 --lang fr
+"""
+
+import sys
+import timeit
+from argparse import ArgumentParser
+
+from translate.filters import decoration
+from translate.lang import factory
+
+
+DEFAULT_LENGTH = 10000
+"""The default length of the generated strings"""
+
+
+def samplestrings(length, punctuation):
+    """Returns a list of generated strings of about the given length."""
+    words = (u"The quick brown fox jumps over 3 lazy dogs at 12.5\xb0 "
+             u"using getvalue() and http://example.com/ or info@example.com "
+             u"with &File and %(name)s, ")
+    body = (words * (length // len(words) + 1))[:length // 2]
+    decorations = (punctuation + decoration.whitespace) * (
+        length // 4 // len(punctuation + decoration.whitespace) + 1)
+    decorations = decorations[:length // 4]
+    return [
+        body,
+        decorations + body + decorations,
+        u" " * (length // 2) + body + u"\xa0" * (length // 2),
+        decorations * 4,
+    ]
+
+
+def helpers(lang):
+    """Returns (name, function) tuples of the helpers to measure, every
+    function takes a string.
+    """
+    punctuation = lang.punctuation
+    endpunctuation = lang.sentenceend + u":"
+    return [
+        ("spacestart", decoration.spacestart),
+        ("spaceend", decoration.spaceend),
+        ("puncstart", lambda text: decoration.puncstart(text, punctuation)),
+        ("puncend", lambda text: decoration.puncend(text, endpunctuation)),
+        ("ispurepunctuation", decoration.ispurepunctuation),
+        ("findaccelerators",
+         lambda text: decoration.findaccelerators(text, u"&", u"Ff")),
+        ("findmarkedvariables",
+         lambda text: decoration.findmarkedvariables(text, u"%(", u")s")),
+        ("getnumbers", decoration.getnumbers),
+        ("getfunctions", decoration.getfunctions),
+        ("getemails", decoration.getemails),
+        ("geturls", decoration.geturls),
+    ]
+
+
+def measure(function, strings, number=10, repeat=3):
+    """Returns the fastest time in seconds of calling the function number
+    times on every string.
+    """
+    def run():
+        for text in strings:
+            function(text)
+    return min(timeit.repeat(run, number=number, repeat=repeat))
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("names", metavar="NAME", nargs="*",
+                        help="helpers to measure (default: all)")
+    parser.add_argument("--length", type=int, default=DEFAULT_LENGTH,
+                        help="length of the generated strings "
+                             "(default: %(default)s)")
+    parser.add_argument("--lang", default="en",
+                        help="language of the punctuation "
+                             "(default: %(default)s)")
+    parser.add_argument("--number", type=int, default=10,
+                        help="calls per string and measurement "
+                             "(default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of measurements, the fastest is used "
+                             "(default: %(default)s)")
+    args = parser.parse_args()
+
+    lang = factory.getlanguage(args.lang)
+    strings = samplestrings(args.length, lang.punctuation)
+    for name, function in helpers(lang):
+        if args.names and name not in args.names:
+            continue
+        seconds = measure(function, strings, args.number, args.repeat)
+        print("%-20s %9.3fms per call" %
+              (name, seconds * 1000 / args.number / len(strings)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
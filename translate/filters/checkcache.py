@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""A cache of check results shared between runs of the tools.
+
+The results of :meth:`~translate.filters.checks.UnitChecker.run_filters` only
+depend on the unit and the checker, so the checks only need to run again on
+units that changed since the previous run.  The cache is keyed on a hash of
+the source, target, plural forms, locations and states of the unit, the
+checker classes, filters and :class:`~translate.filters.checks.CheckerConfig`
+and the toolkit version.
+
+The cache is opt-in: use ``pofilter --checkcache``, set the
+``TRANSLATE_CHECK_CACHE`` environment variable to a file, or call
+:func:`set_default_cache`.  The results are kept in an SQLite database that
+holds at most ``maxentries`` results, the least recently used results are
+removed first.
+"""
+
+import atexit
+import logging
+import os
+
+from translate import __version__ as toolkitversion
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENVIRONMENT_VARIABLE = "TRANSLATE_CHECK_CACHE"
+"""The environment variable that enables the default cache"""
+
+DEFAULT_MAXENTRIES = 1000000
+"""The default number of results kept in a cache"""
+
+
+def _strings(value):
+    """Returns the strings of a plain or multistring source or target."""
+    if value is None:
+        return [u""]
+    return [str(string) for string in getattr(value, "strings", [value])]
+
+
+def _configvalue(value):
+    """Returns a stable representation of a config value, languages are
+    represented by their code and dictionaries are sorted.
+    """
+    if hasattr(value, "code") and hasattr(value, "checker"):
+        return "lang:%s" % value.code
+    if isinstance(value, dict):
+        return repr(sorted((repr(key), repr(item))
+                           for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return repr(sorted(repr(item) for item in value))
+    return repr(value)
+
+
+def checkerfingerprint(checker):
+    """Returns a string describing everything about the checker that the
+    results of its checks depend on.
+    """
+    parts = ["%s %s" % (toolkitversion.sver, toolkitversion.build)]
+    for subchecker in getattr(checker, "checkers", [checker]):
+        checkerclass = type(subchecker)
+        parts.append("%s.%s" % (checkerclass.__module__,
+                                checkerclass.__qualname__))
+        parts.append(repr(sorted(getattr(subchecker, "defaultfilters", {}))))
+        config = subchecker.config
+        for name in sorted(config.__dict__):
+            parts.append("%s=%s" % (name, _configvalue(config.__dict__[name])))
+    return "\0".join(parts)
+
+
+class CheckCache:
+    """An SQLite database of check results.
+
+    New results and the use of existing results are written in batches, and
+    when the cache is closed.
+    """
+
+    #: The number of pending changes that are written in one transaction
+    batchsize = 1000
+
+    def __init__(self, filename, maxentries=DEFAULT_MAXENTRIES):
+        self.filename = os.path.abspath(filename)
+        self.maxentries = maxentries
+        self.hits = 0
+        self.misses = 0
+        self._con = None
+        self._run = None
+        self._pending = {}
+        self._used = set()
+        self._fingerprints = {}
+
+    def _connect(self):
+        if self._con is None:
+            from sqlite3 import dbapi2
+            directory = os.path.dirname(self.filename)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            self._con = dbapi2.connect(self.filename, timeout=30)
+            self._con.execute("PRAGMA journal_mode=WAL;")
+            self._con.execute("""CREATE TABLE IF NOT EXISTS results(
+                key BLOB PRIMARY KEY NOT NULL,
+                failures TEXT NOT NULL,
+                lastused INTEGER NOT NULL);""")
+            self._con.execute("""CREATE INDEX IF NOT EXISTS resultslastused
+                ON results(lastused);""")
+            self._con.execute("""CREATE TABLE IF NOT EXISTS meta(
+                name TEXT PRIMARY KEY NOT NULL,
+                value INTEGER NOT NULL);""")
+            # Every run gets a number, results used in a run get its number
+            self._con.execute("""INSERT OR IGNORE INTO meta (name, value)
+                VALUES ('run', 0);""")
+            self._con.execute("""UPDATE meta SET value = value + 1
+                WHERE name = 'run';""")
+            self._run = self._con.execute(
+                "SELECT value FROM meta WHERE name = 'run';").fetchone()[0]
+            self._con.commit()
+        return self._con
+
+    def _fingerprint(self, checker):
+        """Returns the fingerprint of the checker, computed once for every
+        checker and target language.
+        """
+        lang = getattr(checker.config, "lang", None)
+        cached = self._fingerprints.get(id(checker))
+        if cached is None or cached[0] is not checker or cached[1] is not lang:
+            cached = (checker, lang, checkerfingerprint(checker))
+            self._fingerprints[id(checker)] = cached
+        return cached[2]
+
+    def unitkey(self, checker, unit):
+        """Returns the key of the results of the checker for the unit."""
+        import hashlib
+        parts = [self._fingerprint(checker), type(unit).__name__]
+        parts.extend(_strings(unit.source))
+        parts.append(u"\1")
+        parts.extend(_strings(unit.target))
+        parts.append(repr((unit.hasplural(), unit.getlocations(),
+                           unit.isfuzzy(), unit.isreview())))
+        if hasattr(unit, "getalttrans"):
+            for alternative in unit.getalttrans():
+                parts.append(u"\1")
+                parts.extend(_strings(alternative.target))
+        key = u"\0".join(parts).encode("utf-8", "surrogatepass")
+        return hashlib.sha1(key).digest()
+
+    def getresults(self, key):
+        """Returns the categorised failures stored for the key, or None."""
+        import json
+        if key in self._pending:
+            failures = self._pending[key]
+        else:
+            row = self._connect().execute(
+                "SELECT failures FROM results WHERE key = ?;",
+                (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            failures = json.loads(row[0])
+            self._used.add(key)
+            self._changed()
+        self.hits += 1
+        return failures
+
+    def putresults(self, key, failures):
+        """Stores the categorised failures for the key."""
+        self._pending[key] = failures
+        self._changed()
+
+    def _changed(self):
+        if len(self._pending) + len(self._used) >= self.batchsize:
+            self.flush()
+
+    def run_filters(self, checker, unit, categorised=False):
+        """Returns the results of ``checker.run_filters(unit, categorised)``,
+        from the cache if the unit was checked before.
+        """
+        if any(getattr(subchecker, "suggestion_store", None)
+               for subchecker in getattr(checker, "checkers", [checker])):
+            # Suggestions live outside the unit, don't cache their results
+            return checker.run_filters(unit, categorised)
+        key = self.unitkey(checker, unit)
+        failures = self.getresults(key)
+        if failures is None:
+            failures = checker.run_filters(unit, categorised=True)
+            failures = dict((name, {'message': str(info['message']),
+                                    'category': info['category']})
+                            for name, info in failures.items())
+            self.putresults(key, failures)
+        if not categorised:
+            return dict((name, info['message'])
+                        for name, info in failures.items())
+        return dict((name, dict(info)) for name, info in failures.items())
+
+    def flush(self):
+        """Writes the pending results and evicts the least recently used
+        results if the cache is full.
+        """
+        if not (self._pending or self._used):
+            return
+        import json
+        con = self._connect()
+        with con:
+            con.executemany(
+                "INSERT OR REPLACE INTO results (key, failures, lastused) "
+                "VALUES (?, ?, ?);",
+                [(key, json.dumps(failures, sort_keys=True), self._run)
+                 for key, failures in self._pending.items()])
+            con.executemany(
+                "UPDATE results SET lastused = ? WHERE key = ?;",
+                [(self._run, key) for key in self._used])
+            count = con.execute("SELECT COUNT(*) FROM results;").fetchone()[0]
+            if count > self.maxentries:
+                con.execute("""DELETE FROM results WHERE key IN
+                    (SELECT key FROM results ORDER BY lastused LIMIT ?);""",
+                            (count - self.maxentries,))
+        self._pending = {}
+        self._used = set()
+
+    def close(self):
+        """Writes the pending results and closes the database."""
+        self.flush()
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+    def logsummary(self):
+        """Logs the hit rate of the cache."""
+        lookups = self.hits + self.misses
+        if lookups:
+            logger.info("%d of %d units had cached check results (%.0f%%)",
+                        self.hits, lookups, 100.0 * self.hits / lookups)
+
+
+_default_cache = None
+_default_cache_set = False
+
+
+def _closedefault(cache):
+    cache.close()
+    cache.logsummary()
+
+
+def set_default_cache(filename, maxentries=DEFAULT_MAXENTRIES):
+    """Sets the file of the cache used by pofilter and
+    :class:`~translate.storage.statsdb.StatsCache`, None disables the cache.
+    """
+    global _default_cache, _default_cache_set
+    if _default_cache is not None:
+        _default_cache.close()
+        atexit.unregister(_closedefault)
+    _default_cache_set = True
+    if filename:
+        _default_cache = CheckCache(filename, maxentries)
+        atexit.register(_closedefault, _default_cache)
+    else:
+        _default_cache = None
+    return _default_cache
+
+
+def get_default_cache():
+    """Returns the cache used by pofilter and
+    :class:`~translate.storage.statsdb.StatsCache` if it was enabled,
+    otherwise None.
+    """
+    if not _default_cache_set:
+        filename = os.environ.get(CACHE_ENVIRONMENT_VARIABLE)
+        # Make the summary visible with the default logging setup of the tools
+        if filename:
+            logger.setLevel(logging.INFO)
+        set_default_cache(filename)
+    return _default_cache
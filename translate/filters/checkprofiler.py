@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the time spent in every check.
+
+A :class:`CheckProfiler` set on a checker with ``setprofiler()`` counts the
+calls, failures and time of every check that
+:meth:`~translate.filters.checks.UnitChecker.run_filters` runs::
+
+    profiler = CheckProfiler()
+    checker.setprofiler(profiler)
+    ...
+    print(profiler.report())
+"""
+
+from time import perf_counter
+
+
+class CheckProfiler:
+    """Collects the calls, failures and time of checks."""
+
+    def __init__(self):
+        #: [calls, failures, total time, maximum time] lists, keyed by
+        #: (checker class name, check name)
+        self.stats = {}
+
+    def run_test(self, checker, name, test, unit):
+        """Runs ``checker.run_test(test, unit)`` and records its time."""
+        start = perf_counter()
+        failed = True
+        try:
+            result = checker.run_test(test, unit)
+            failed = not result
+            return result
+        finally:
+            self.record(type(checker).__name__, name,
+                        perf_counter() - start, failed)
+
+    def record(self, checkername, name, duration, failed=False):
+        """Adds a call of a check that took duration seconds."""
+        stats = self.stats.get((checkername, name))
+        if stats is None:
+            self.stats[(checkername, name)] = [1, int(failed), duration,
+                                               duration]
+        else:
+            stats[0] += 1
+            stats[1] += failed
+            stats[2] += duration
+            if duration > stats[3]:
+                stats[3] = duration
+
+    def merge(self, stats):
+        """Adds the stats of another profiler, for example of a worker
+        process.
+        """
+        for key, (calls, failures, total, maximum) in stats.items():
+            mine = self.stats.get(key)
+            if mine is None:
+                self.stats[key] = [calls, failures, total, maximum]
+            else:
+                mine[0] += calls
+                mine[1] += failures
+                mine[2] += total
+                mine[3] = max(mine[3], maximum)
+
+    def pop(self):
+        """Returns the stats collected so far and starts over."""
+        stats, self.stats = self.stats, {}
+        return stats
+
+    def checks(self):
+        """Returns the stats of every check as dictionaries, slowest first."""
+        results = []
+        for (checkername, name), (calls, failures, total, maximum) \
+                in self.stats.items():
+            results.append({
+                "checker": checkername,
+                "check": name,
+                "calls": calls,
+                "failures": failures,
+                "total": total,
+                "mean": total / calls,
+                "max": maximum,
+            })
+        results.sort(key=lambda result: (-result["total"], result["check"]))
+        return results
+
+    def checkers(self):
+        """Returns the totals of every checker class as dictionaries, the
+        slowest checkers first.
+        """
+        totals = {}
+        for (checkername, name), (calls, failures, total, maximum) \
+                in self.stats.items():
+            checker = totals.setdefault(checkername, {
+                "checker": checkername, "checks": 0, "calls": 0,
+                "failures": 0, "total": 0.0, "max": 0.0})
+            checker["checks"] += 1
+            checker["calls"] += calls
+            checker["failures"] += failures
+            checker["total"] += total
+            checker["max"] = max(checker["max"], maximum)
+        results = sorted(totals.values(),
+                         key=lambda result: (-result["total"],
+                                             result["checker"]))
+        for result in results:
+            result["mean"] = result["total"] / result["calls"]
+        return results
+
+    def report(self):
+        """Returns a table of the checks and checker classes, times in
+        milliseconds.
+        """
+        header = "%-28s %-22s %8s %8s %10s %8s %8s" % (
+            "check", "checker", "calls", "failures", "total", "mean", "max")
+        lines = [header, "-" * len(header)]
+        for result in self.checks():
+            lines.append("%-28s %-22s %8d %8d %10.1f %8.3f %8.3f" % (
+                result["check"], result["checker"], result["calls"],
+                result["failures"], result["total"] * 1000,
+                result["mean"] * 1000, result["max"] * 1000))
+        lines.append("")
+        header = "%-51s %8s %8s %10s %8s %8s" % (
+            "checker", "calls", "failures", "total", "mean", "max")
+        lines.extend([header, "-" * len(header)])
+        for result in self.checkers():
+            lines.append("%-51s %8d %8d %10.1f %8.3f %8.3f" % (
+                result["checker"], result["calls"], result["failures"],
+                result["total"] * 1000, result["mean"] * 1000,
+                result["max"] * 1000))
+        return "\n".join(lines)
+
+    def writejson(self, fileobj):
+        """Writes the stats of the checks and checker classes as JSON, times
+        in seconds.
+        """
+        import json
+        json.dump({"checks": self.checks(), "checkers": self.checkers()},
+                  fileobj, indent=2, sort_keys=True)
+        fileobj.write("\n")
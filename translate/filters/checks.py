@@ -29,6 +29,7 @@ When adding a new test here, please document and explain their behaviour on the
 :doc:`pofilter tests </commands/pofilter_tests>` page.
 """
 
+import copy
 import logging
 import re
 
@@ -36,7 +37,7 @@ from translate.filters import decoration, helpers, prefilters, spelling
 from translate.filters.decorators import (cosmetic, critical, extraction,
                                           functional)
 from translate.lang import data, factory
-from translate.misc import lru
+from translate.misc import lazyre, lru
 
 
 try:
@@ -54,7 +55,7 @@ logger = logging.getLogger(__name__)
 # Extended to support Python named format specifiers and objective-C special
 # "%@" format specifier
 # (see https://developer.apple.com/library/mac/documentation/Cocoa/Conceptual/Strings/Articles/formatSpecifiers.html)
-printf_pat = re.compile(r'''
+printf_pat = lazyre.compile(r'''
         %(                          # initial %
         (?P<boost_ord>\d+)%         # boost::format style variable order, like %1%
         |
@@ -69,21 +70,40 @@ printf_pat = re.compile(r'''
         )''', re.VERBOSE)
 
 # The name of the XML tag
-tagname_re = re.compile(r"<[\s]*([\w\/]*).*?(/)?[\s]*>", re.DOTALL)
+tagname_re = lazyre.compile(r"<[\s]*([\w\/]*).*?(/)?[\s]*>", re.DOTALL)
 
 # We allow escaped quotes, probably for old escaping style of OOo helpcontent
 #TODO: remove escaped strings once usage is audited
-property_re = re.compile(" (\\w*)=((\\\\?\".*?\\\\?\")|(\\\\?'.*?\\\\?'))")
+property_re = lazyre.compile(" (\\w*)=((\\\\?\".*?\\\\?\")|(\\\\?'.*?\\\\?'))")
 
 # The whole tag
-tag_re = re.compile("<[^>]+>")
+tag_re = lazyre.compile("<[^>]+>")
 
-gconf_attribute_re = re.compile('"[a-z_]+?"')
+gconf_attribute_re = lazyre.compile('"[a-z_]+?"')
 
 # XML/HTML tags in LibreOffice help and readme, exclude short tags
-lo_tag_re = re.compile('''</?(?P<tag>[a-z][a-z_-]+)(?: +[a-z]+="[^"]+")* */?>''')
+lo_tag_re = lazyre.compile('''</?(?P<tag>[a-z][a-z_-]+)(?: +[a-z]+="[^"]+")* */?>''')
 lo_emptytags = frozenset(['br', 'embed', 'embedvar', 'object', 'help-id-missing'])
 
+_invisible_table = dict.fromkeys(map(ord, (
+    # Bidi markers
+    u"\u200e",  # LRM
+    u"\u200f",  # RLM
+    u"\u202b",  # RLE
+    u"\u202a",  # LRE
+    u"\u202e",  # RLO
+    u"\u202d",  # LRO
+    u"\u202c",  # PDF
+    u"\u2069",  # PDI
+    u"\u2068",  # FSI
+    u"\u2067",  # RLI
+    u"\u2066",  # LRI
+    # ZW*
+    u"\u200d",  # ZWJ
+    u"\u200c",  # ZWNJ
+)))
+"""Translation table that removes bidi markers and zero width joiners"""
+
 
 def tagname(string):
     """Returns the name of the XML/HTML tag in string"""
@@ -282,19 +302,31 @@ class CheckerConfig:
                 break
 
 
+_missing = object()
+
+
 def cache_results(f):
+    """Caches the results of a checker method that only depends on its
+    string argument and the configuration of the checker.
+
+    The results are kept across units in the bounded
+    :attr:`UnitChecker.results_cache`, since the same strings are filtered
+    for many units and checks.
+    """
+    name = f.__name__
 
     def cached_f(self, param1):
-        key = (f.__name__, param1)
+        key = (name, param1)
         res_cache = self.results_cache
+        value = res_cache.lookup(key, _missing)
 
-        if key in res_cache:
-            return res_cache[key]
-        else:
+        if value is _missing:
             value = f(self, param1)
             res_cache[key] = value
-            return value
+        return value
 
+    cached_f.__name__ = name
+    cached_f.__doc__ = f.__doc__
     return cached_f
 
 
@@ -305,6 +337,16 @@ class UnitChecker:
 
     preconditions = {}
 
+    _plans = None
+
+    #: The :class:`~translate.filters.checkprofiler.CheckProfiler` that times
+    #: the checks, if any
+    profiler = None
+
+    #: The number of results of prefilters and decoration helpers that are
+    #: cached across units
+    results_cache_size = 10000
+
     def __init__(self, checkerconfig=None, excludefilters=None,
                  limitfilters=None, errorhandler=None):
         self.errorhandler = errorhandler
@@ -328,7 +370,6 @@ class UnitChecker:
                 self.helperfunctions[functionname] = function
 
         self.defaultfilters = self.getfilters(excludefilters, limitfilters)
-        self.results_cache = {}
 
     def getfilters(self, excludefilters=None, limitfilters=None):
         """Returns dictionary of available filters, including/excluding those
@@ -365,6 +406,8 @@ class UnitChecker:
     def setconfig(self, config):
         """Sets the accelerator list."""
         self.config = config
+        # The cached results depend on the configuration
+        self.results_cache = lru.LRUDict(self.results_cache_size)
         self.accfilters = [prefilters.filteraccelerators(accelmarker) for accelmarker in self.config.accelmarkers]
         self.varfilters = [
             prefilters.filtervariables(startmatch, endmatch,
@@ -384,6 +427,12 @@ class UnitChecker:
         if self.suggestion_store:
             self.suggestion_store.require_index()
 
+    def setprofiler(self, profiler):
+        """Sets the :class:`~translate.filters.checkprofiler.CheckProfiler`
+        that times the checks, None stops profiling.
+        """
+        self.profiler = profiler
+
     def filtervariables(self, str1):
         """Filter out variables from ``str1``."""
         return helpers.multifilter(str1, self.varfilters)
@@ -415,6 +464,27 @@ class UnitChecker:
         return tag_re.sub("", str1)
     filterxml = cache_results(filterxml)
 
+    def getfunctions(self, str1):
+        """Returns the functions in ``str1``, see
+        :func:`~translate.filters.decoration.getfunctions`.
+        """
+        return decoration.getfunctions(str1)
+    getfunctions = cache_results(getfunctions)
+
+    def getnumbers(self, str1):
+        """Returns the numbers in ``str1``, see
+        :func:`~translate.filters.decoration.getnumbers`.
+        """
+        return decoration.getnumbers(str1)
+    getnumbers = cache_results(getnumbers)
+
+    def ispurepunctuation(self, str1):
+        """Checks whether ``str1`` is only punctuation, see
+        :func:`~translate.filters.decoration.ispurepunctuation`.
+        """
+        return decoration.ispurepunctuation(str1)
+    ispurepunctuation = cache_results(ispurepunctuation)
+
     def run_test(self, test, unit):
         """Runs the given test on the given unit.
 
@@ -432,6 +502,70 @@ class UnitChecker:
         return list(set(self.config.lang.ignoretests.get(self.checker_name, [])
                         + self.config.lang.ignoretests.get('all', [])))
 
+    def run_filters_batch(self, units, sources=None, targets=None):
+        """Runs all the tests on a batch of units.
+
+        The units are checked by a copy of the checker, so that a checker can
+        check several batches at the same time, for example in the threads
+        of a server.  Prefilter results are shared by the units of the batch.
+
+        :param sources: The normalized sources of the units, if known.
+        :param targets: The normalized targets of the units, if known.
+        :return: The failures of each test, for example::
+
+           {'testname': {'indices': [0, 3], 'messages': [message0, message3],
+                         'category': failure_category}}
+        """
+        checker = self._batchchecker()
+        results = {}
+        for index, failures in enumerate(
+                checker._batchfailures(units, sources, targets)):
+            for name, info in failures.items():
+                column = results.get(name)
+                if column is None:
+                    column = results[name] = {'indices': [], 'messages': [],
+                                              'category': info['category']}
+                column['indices'].append(index)
+                column['messages'].append(info['message'])
+        return results
+
+    def prefetch(self, sources, targets):
+        """Prepares the checks of a batch of units with the given sources and
+        targets, for example by looking up all their words in the spell
+        checker at once.
+        """
+        pass
+
+    def _batchchecker(self):
+        """Returns a copy of the checker for :meth:`run_filters_batch` with
+        its own per unit state and caches.
+        """
+        checker = copy.copy(self)
+        checker._plans = None
+        checker.results_cache = lru.LRUDict(self.results_cache_size)
+        return checker
+
+    def _batchfailures(self, units, sources=None, targets=None):
+        """Yields the categorised failures of every unit of a batch."""
+        for unit in units:
+            yield self.run_filters(unit, categorised=True)
+
+    def _getplan(self):
+        """Returns the :class:`CheckPlan` for the current filters and language
+        of the checker, building it if needed.
+        """
+        if self._plans is None:
+            self._plans = {}
+        filters = self.defaultfilters
+        plan = self._plans.get(id(filters))
+        if plan is None or not plan.isvalid(self):
+            # Checkers only switch between a few sets of filters
+            if len(self._plans) > 8:
+                self._plans.clear()
+            plan = CheckPlan(self)
+            self._plans[id(filters)] = plan
+        return plan
+
     def run_filters(self, unit, categorised=False):
         """Run all the tests in this suite.
 
@@ -440,28 +574,24 @@ class UnitChecker:
 
            {'testname': { 'message': message_or_exception, 'category': failure_category } }
         """
-        self.results_cache = {}
         failures = {}
-        ignores = self.get_ignored_filters()
-        functionnames = self.defaultfilters.keys()
-        priorityfunctionnames = self.preconditions.keys()
-        otherfunctionnames = filter(lambda functionname: functionname not in self.preconditions, functionnames)
+        ignores = set()
+        profiler = self.profiler
 
-        for functionname in list(priorityfunctionnames) + list(otherfunctionnames):
+        plan = self._getplan()
+        for functionname, filterfunction, isdefault, ignoredfunctionnames \
+                in plan.steps:
             if functionname in ignores:
                 continue
 
-            filterfunction = getattr(self, functionname, None)
-
-            # This filterfunction may only be defined on another checker if
-            # using TeeChecker
-            if filterfunction is None:
-                continue
-
             filtermessage = u""
 
             try:
-                filterresult = self.run_test(filterfunction, unit)
+                if profiler is None:
+                    filterresult = self.run_test(filterfunction, unit)
+                else:
+                    filterresult = profiler.run_test(self, functionname,
+                                                     filterfunction, unit)
             except FilterFailure as e:
                 filterresult = False
                 filtermessage = str(e)
@@ -475,22 +605,18 @@ class UnitChecker:
             if not filterresult:
                 if not filtermessage:
                     # Should be quite rare
-                    import pydoc
-                    # Strip out unnecessary whitespace from docstring
-                    filtermessage = pydoc.getdoc(filterfunction)
+                    filtermessage = plan.getmessage(functionname,
+                                                    filterfunction)
                 # We test some preconditions that aren't actually a cause for
                 # failure
-                if functionname in self.defaultfilters:
+                if isdefault:
                     failures[functionname] = {
                         'message': filtermessage,
                         'category': self.categories[functionname],
                     }
 
-                if functionname in self.preconditions:
-                    for ignoredfunctionname in self.preconditions[functionname]:
-                        ignores.append(ignoredfunctionname)
-
-        self.results_cache = {}
+                if ignoredfunctionnames:
+                    ignores.update(ignoredfunctionnames)
 
         if not categorised:
             for name, info in failures.items():
@@ -498,6 +624,54 @@ class UnitChecker:
         return failures
 
 
+class CheckPlan:
+    """The checks that :meth:`UnitChecker.run_filters` runs on every unit.
+
+    The plan is built once for the filters and language of a checker, so that
+    running the checks on a unit doesn't need to look up the filters again.
+    """
+
+    def __init__(self, checker):
+        self.filters = checker.defaultfilters
+        self.filtercount = len(self.filters)
+        self.lang = checker.config.lang
+        self.ignores = set(checker.get_ignored_filters())
+        preconditions = checker.preconditions
+
+        #: (name, function, isdefault, ignored names on failure) tuples, with
+        #: the preconditions first
+        self.steps = []
+        functionnames = list(preconditions) + [
+            functionname for functionname in self.filters
+            if functionname not in preconditions]
+        for functionname in functionnames:
+            if functionname in self.ignores:
+                continue
+            filterfunction = getattr(checker, functionname, None)
+            # This filterfunction may only be defined on another checker if
+            # using TeeChecker
+            if filterfunction is None:
+                continue
+            self.steps.append((functionname, filterfunction,
+                               functionname in self.filters,
+                               preconditions.get(functionname)))
+        self.messages = {}
+
+    def isvalid(self, checker):
+        """Checks that the plan is still up to date for the checker."""
+        return (checker.defaultfilters is self.filters and
+                len(self.filters) == self.filtercount and
+                checker.config.lang is self.lang)
+
+    def getmessage(self, functionname, filterfunction):
+        """Returns the failure message of a check that failed without one."""
+        if functionname not in self.messages:
+            import pydoc
+            # Strip out unnecessary whitespace from docstring
+            self.messages[functionname] = pydoc.getdoc(filterfunction)
+        return self.messages[functionname]
+
+
 class TranslationChecker(UnitChecker):
     """A checker that passes source and target strings to the checks, not the
     whole unit.
@@ -505,6 +679,10 @@ class TranslationChecker(UnitChecker):
     This provides some speedup and simplifies testing.
     """
 
+    #: The normalized (source, target) of the unit that
+    #: :meth:`run_filters_batch` is checking
+    _batchstrings = None
+
     def __init__(self, checkerconfig=None, excludefilters=None,
                  limitfilters=None, errorhandler=None):
         super().__init__(checkerconfig, excludefilters, limitfilters, errorhandler)
@@ -544,13 +722,49 @@ class TranslationChecker(UnitChecker):
         """Do some optimisation by caching some data of the unit for the
         benefit of :meth:`~TranslationChecker.run_test`.
         """
-        self.str1 = data.normalized_unicode(unit.source) or u""
-        self.str2 = data.normalized_unicode(unit.target) or u""
+        if self._batchstrings is None:
+            self.str1 = data.normalized_unicode(unit.source) or u""
+            self.str2 = data.normalized_unicode(unit.target) or u""
+        else:
+            self.str1, self.str2 = self._batchstrings
         self.hasplural = unit.hasplural()
         self.locations = unit.getlocations()
 
         return super().run_filters(unit, categorised)
 
+    def _batchchecker(self):
+        checker = super()._batchchecker()
+        checker.source_spell_cache = lru.LRUCachingDict(
+            256, cullsize=5, aggressive_gc=False)
+        checker.target_spell_cache = lru.LRUCachingDict(
+            512, cullsize=5, aggressive_gc=False)
+        return checker
+
+    def _batchfailures(self, units, sources=None, targets=None):
+        """Checks the units of a batch with the given normalized strings.
+        Units with the same strings and locations are only checked once.
+        """
+        if sources is None:
+            sources = [data.normalized_unicode(unit.source) or u""
+                       for unit in units]
+        if targets is None:
+            targets = [data.normalized_unicode(unit.target) or u""
+                       for unit in units]
+        self.prefetch(sources, [unit.target if unit.hasplural() else target
+                                for unit, target in zip(units, targets)])
+        checked = {}
+        for unit, source, target in zip(units, sources, targets):
+            key = None
+            if not unit.hasplural():
+                key = (source, target, tuple(unit.getlocations()))
+                failures = checked.get(key)
+            if key is None or failures is None:
+                self._batchstrings = (source, target)
+                failures = self.run_filters(unit, categorised=True)
+                if key is not None:
+                    checked[key] = failures
+            yield failures
+
 
 class TeeChecker:
     """A Checker that controls multiple checkers."""
@@ -618,6 +832,31 @@ class TeeChecker:
 
         return failures
 
+    def prefetch(self, sources, targets):
+        """Prepares the checks of all checkers for a batch of units, see
+        :meth:`UnitChecker.prefetch`.
+        """
+        for checker in self.checkers:
+            checker.prefetch(sources, targets)
+
+    def run_filters_batch(self, units, sources=None, targets=None):
+        """Run all the tests in the checker's suites on a batch of units, see
+        :meth:`UnitChecker.run_filters_batch`.
+        """
+        # Normalize the strings once for all the checkers
+        if sources is None:
+            sources = [data.normalized_unicode(unit.source) or u""
+                       for unit in units]
+        if targets is None:
+            targets = [data.normalized_unicode(unit.target) or u""
+                       for unit in units]
+        results = {}
+
+        for checker in self.checkers:
+            results.update(checker.run_filters_batch(units, sources, targets))
+
+        return results
+
     def setsuggestionstore(self, store):
         """Sets the filename that a checker should use for evaluating
         suggestions.
@@ -625,10 +864,36 @@ class TeeChecker:
         for checker in self.checkers:
             checker.setsuggestionstore(store)
 
+    def setprofiler(self, profiler):
+        """Sets the profiler that times the checks of all checkers."""
+        for checker in self.checkers:
+            checker.setprofiler(profiler)
+
 
 class StandardChecker(TranslationChecker):
     """The basic test suite for source -> target translations."""
 
+    def prefetch(self, sources, targets):
+        """Looks up the words of all the sources and targets in the spell
+        checker at once, if :meth:`spellcheck` is used.
+        """
+        if ("spellcheck" not in self.defaultfilters or
+                not self.config.targetlanguage or not spelling.available):
+            return
+        for strings, lang, validaccel in (
+                (sources, self.config.sourcelang.code,
+                 self.config.sourcelang.validaccel),
+                (targets, self.config.targetlanguage,
+                 self.config.lang.validaccel)):
+            texts = []
+            for string in strings:
+                # Plural targets are checked form by form
+                for text in getattr(string, "strings", [string]):
+                    text = data.normalized_unicode(str(text or u""))
+                    texts.append(self.filteraccelerators_by_list(
+                        self.removevariables(text), validaccel))
+            spelling.prefetch(texts, lang)
+
     @extraction
     def untranslated(self, str1, str2):
         """Checks whether a string has been translated at all.
@@ -862,30 +1127,12 @@ class StandardChecker(TranslationChecker):
         # Substitute: nbsp
         str2 = str2.replace(u"\u00a0", u" ")
         # Strip: Bidi markers and ZW* chars
-        str2 = str2.translate(
-            {ord(c): None for c in (
-                # Bidi markers
-                u"\u200e",  # LRM
-                u"\u200f",  # RLM
-                u"\u202b",  # RLE
-                u"\u202a",  # LRE
-                u"\u202e",  # RLO
-                u"\u202d",  # LRO
-                u"\u202c",  # PDF
-                u"\u2069",  # PDI
-                u"\u2068",  # FSI
-                u"\u2067",  # RLI
-                u"\u2066",  # LRI
-                # ZW*
-                u"\u200d",  # ZWJ
-                u"\u200c",  # ZWNJ
-            )})
-
-        for puncchar in self.config.punctuation:
-            plaincount1 = str1.count(puncchar)
+        str2 = str2.translate(_invisible_table)
 
-            if not plaincount1:
-                continue
+        # Only the punctuation that is in the source needs counting
+        punctuation = decoration.charset(self.config.punctuation)
+        for puncchar in punctuation.intersection(str1):
+            plaincount1 = str1.count(puncchar)
 
             plaincount2 = str2.count(puncchar)
 
@@ -1241,7 +1488,7 @@ class StandardChecker(TranslationChecker):
         not translated.
         """
         # We can't just use helpers.funcmatch() since it doesn't ignore order
-        if not set(decoration.getfunctions(str1)).symmetric_difference(set(decoration.getfunctions(str2))):
+        if not set(self.getfunctions(str1)).symmetric_difference(set(self.getfunctions(str2))):
             return True
         else:
             raise FilterFailure(u"Different functions")
@@ -1288,7 +1535,7 @@ class StandardChecker(TranslationChecker):
         """
         str1 = self.config.lang.numbertranslate(str1)
 
-        if helpers.countsmatch(str1, str2, decoration.getnumbers(str1)):
+        if helpers.countsmatch(str1, str2, self.getnumbers(str1)):
             return True
         else:
             raise FilterFailure(u"Different numbers")
@@ -1386,10 +1633,10 @@ class StandardChecker(TranslationChecker):
         be changed.
         """
         # this test is a subset of startandend
-        if (decoration.ispurepunctuation(str1)):
+        if (self.ispurepunctuation(str1)):
             success = str1 == str2
         else:
-            success = not decoration.ispurepunctuation(str2)
+            success = not self.ispurepunctuation(str2)
 
         if success:
             return True
@@ -1888,7 +2135,7 @@ class StandardChecker(TranslationChecker):
         for sentence in sentences2:
             sentence_errors = self.target_spell_cache.get(sentence, None)
             if sentence_errors is None:
-                sentence_errors = spelling.simple_check(sentence, lang=self.config.targetlanguage)
+                sentence_errors = set(spelling.simple_check(sentence, lang=self.config.targetlanguage))
                 self.target_spell_cache[sentence] = sentence_errors
             errors.update(sentence_errors)
 
@@ -2037,7 +2284,7 @@ class LibreOfficeChecker(StandardChecker):
         for location in self.locations:
             if location.endswith(".xrm") or location.endswith(".xhp"):
                 opentags = []
-                match = re.search(lo_tag_re, str2)
+                match = lo_tag_re.search(str2)
                 while match:
                     acttag = match.group(0)
                     if acttag.startswith("</"):
@@ -2057,7 +2304,7 @@ class LibreOfficeChecker(StandardChecker):
                     else:
                         opentags.append(acttag)
                     str2 = str2[match.end(0):]
-                    match = re.search(lo_tag_re, str2)
+                    match = lo_tag_re.search(str2)
                 if len(opentags) != 0:
                     raise FilterFailure(u"There is no close tag for »%s«" % opentags.pop())
         return True
@@ -2124,7 +2371,7 @@ class MozillaChecker(StandardChecker):
 
         return True
 
-    mozilla_dialog_re = re.compile(r"""(                         # option pair "key: value;"
+    mozilla_dialog_re = lazyre.compile(r"""(                     # option pair "key: value;"
                                       (?P<key>[-a-z]+)           # key
                                       :\s+                       # seperator
                                       (?P<number>\d+(?:[.]\d+)?) # number
@@ -2408,6 +2655,7 @@ class L20nChecker(MozillaChecker):
         "variables",
     ]
     complex_unit_pattern = "->"
+    _complexfilters = (None, None)
 
     def __init__(self, **kwargs):
         checkerconfig = kwargs.get("checkerconfig", None)
@@ -2426,10 +2674,14 @@ class L20nChecker(MozillaChecker):
         saved_default_filters = {}
         if is_unit_complex:
             saved_default_filters = self.defaultfilters
-            self.defaultfilters = {
-                key: value for (key, value) in self.defaultfilters.items()
-                if key not in self.excluded_filters_for_complex_units
-            }
+            # Reuse the same filters for every complex unit, so that the
+            # check plan for them is only built once
+            if self._complexfilters[0] is not saved_default_filters:
+                self._complexfilters = (saved_default_filters, {
+                    key: value for (key, value) in self.defaultfilters.items()
+                    if key not in self.excluded_filters_for_complex_units
+                })
+            self.defaultfilters = self._complexfilters[1]
 
         result = MozillaChecker.run_filters(self, unit,
                                             categorised=categorised)
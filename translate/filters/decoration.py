@@ -23,61 +23,83 @@ import re
 import unicodedata
 
 from translate.lang import data
+from translate.misc import lazyre
+
+
+whitespace = (u"\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001"
+              u"\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+              u"\u2028\u2029\u202f\u205f\u3000")
+"""All the characters for which :meth:`str.isspace` is true"""
+
+_alnum_re = lazyre.compile(r"[^\W_]")
+_decomposition_tag_re = lazyre.compile(r"<[^>]+>")
+
+#: Caches of the helpers below, keyed by the punctuation or accelerator lists
+#: of the languages, which are the same for every string that is checked
+_charsets = {}
+_stripchars = {}
+_puncstart_res = {}
+_acceptlists = {}
+
+
+def _cached(cache, key, build):
+    value = cache.get(key)
+    if value is None:
+        # Only languages and user configuration add keys, but stay bounded
+        if len(cache) > 64:
+            cache.clear()
+        value = cache[key] = build(key)
+    return value
+
+
+def charset(chars):
+    """returns the characters of the string as a frozenset, cached for the
+    punctuation lists of the languages
+    """
+    return _cached(_charsets, chars, frozenset)
 
 
 def spacestart(str1):
     """returns all the whitespace from the start of the string"""
-    newstring = u""
-    for c in str1:
-        if c.isspace():
-            newstring += c
-        else:
-            break
-    return newstring
+    return str1[:len(str1) - len(str1.lstrip())]
 
 
 def spaceend(str1):
     """returns all the whitespace from the end of the string"""
-    newstring = u""
-    for n in range(len(str1)):
-        c = str1[-1-n]
-        if c.isspace():
-            newstring = c + newstring
-        else:
-            break
-    return newstring
+    return str1[len(str1.rstrip()):]
+
+
+def _stripcharsof(punctuation):
+    # Punctuation can also be a sequence, only single characters can match
+    return u"".join(c for c in punctuation if len(c) == 1) + whitespace
+
+
+def _puncstart_re(punctuation):
+    return re.compile(u"[%s]*" % re.escape(_stripcharsof(punctuation)))
 
 
 def puncstart(str1, punctuation):
     """returns all the punctuation from the start of the string"""
-    newstring = u""
-    for c in str1:
-        if c in punctuation or c.isspace():
-            newstring += c
-        else:
-            break
-    return newstring
+    if not isinstance(punctuation, str):
+        punctuation = tuple(punctuation)
+    # A character class is faster than stripping with many characters
+    puncstart_re = _cached(_puncstart_res, punctuation, _puncstart_re)
+    return puncstart_re.match(str1).group()
 
 
 def puncend(str1, punctuation):
     """returns all the punctuation from the end of the string"""
-    # An implementation with regular expressions was slightly slower.
-
-    newstring = u""
-    for n in range(len(str1)):
-        c = str1[-1-n]
-        if c in punctuation or c.isspace():
-            newstring = c + newstring
-        else:
-            break
-    return newstring.replace(u"\u00a0", u" ")
+    if not isinstance(punctuation, str):
+        punctuation = tuple(punctuation)
+    # Stripping is faster than regular expressions and character loops
+    stripchars = _cached(_stripchars, punctuation, _stripcharsof)
+    return str1[len(str1.rstrip(stripchars)):].replace(u"\u00a0", u" ")
 
 
 def ispurepunctuation(str1):
     """checks whether the string is entirely punctuation"""
-    for c in str1:
-        if c.isalnum():
-            return False
+    if _alnum_re.search(str1):
+        return False
     return len(str1)
 
 
@@ -97,7 +119,7 @@ def isvalidaccelerator(accelerator, acceptlist=None):
     if len(accelerator) == 0:
         return False
     if acceptlist is not None:
-        acceptlist = data.normalize(acceptlist)
+        acceptlist = _cached(_acceptlists, acceptlist, data.normalize)
         if accelerator in acceptlist:
             return True
         return False
@@ -114,7 +136,7 @@ def isvalidaccelerator(accelerator, acceptlist=None):
         # so let's see if the character can decompose.
         decomposition = unicodedata.decomposition(accelerator)
         # Next we strip out any extra information like <this>
-        decomposition = re.sub("<[^>]+>", "", decomposition).strip()
+        decomposition = _decomposition_tag_re.sub("", decomposition).strip()
         return decomposition.count(" ") == 0
 
 
@@ -281,18 +303,20 @@ def getfunctions(str1):
         return []
 
 
+_email_re = lazyre.compile(r'[\w\.\-]+@[\w\.\-]+')
+_url_re = lazyre.compile(r'https?:[\w/\.:;+\-~\%#\$?=&,()]+|' +
+                         r'www\.[\w/\.:;+\-~\%#\$?=&,()]+|' +
+                         r'ftp:[\w/\.:;+\-~\%#?=&,]+')
+
+
 def getemails(str1):
     """returns the email addresses that are in a string"""
-    return re.findall(r'[\w\.\-]+@[\w\.\-]+', str1)
+    return _email_re.findall(str1)
 
 
 def geturls(str1):
     """returns the URIs in a string"""
-    # TODO turn this into a verbose and compiled regex
-    URLPAT = r'https?:[\w/\.:;+\-~\%#\$?=&,()]+|' + \
-             r'www\.[\w/\.:;+\-~\%#\$?=&,()]+|' + \
-             r'ftp:[\w/\.:;+\-~\%#?=&,]+'
-    return re.findall(URLPAT, str1)
+    return _url_re.findall(str1)
 
 
 def countaccelerators(accelmarker, acceptlist=None):
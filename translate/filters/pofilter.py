@@ -28,9 +28,13 @@ http://docs.translatehouse.org/projects/translate-toolkit/en/latest/commands/pof
 for full descriptions of all tests.
 """
 
+import copy
+import logging
 import os
+import sys
+from collections import Counter
 
-from translate.filters import autocorrect, checks
+from translate.filters import autocorrect, checkcache, checks, spelling
 from translate.misc import optrecurse
 from translate.storage import factory
 from translate.storage.poheader import poheader
@@ -80,8 +84,64 @@ def build_checkerconfig(options):
     return checkerconfig
 
 
+def build_checkfilter(options):
+    """Prepare the check filter for the given options."""
+    if options.filterclass is None:
+        checkerclasses = [checks.StandardChecker, checks.StandardUnitChecker]
+    else:
+        checkerclasses = [options.filterclass, checks.StandardUnitChecker]
+
+    checkerconfig = build_checkerconfig(options)
+    return pocheckfilter(options, checkerclasses, checkerconfig)
+
+
+#: The parser and options of a worker process of pofilter --jobs
+_worker = None
+
+
+def _filterunits(units):
+    """Runs the filters on units in a worker process.
+
+    :return: The results and the stats of the worker, see
+             :meth:`pocheckfilter.getworkerstats`.
+    """
+    parser, options = _worker
+    options.checkfilter.prefetch(units)
+    results = []
+    for unit in units:
+        result = options.checkfilter.filterunit(unit)
+        if result is autocorrect:
+            # The module can't be returned, return the corrected target
+            result = (autocorrect.__name__, unit.target)
+        results.append(result)
+    return results, options.checkfilter.getworkerstats()
+
+
+def formatcachestats(stats):
+    """Returns a report of the hits and misses of the caches in stats, as
+    returned by :meth:`pocheckfilter.getcachestats`.
+    """
+    lines = []
+    for name in ("prefilter", "check cache"):
+        hits = stats[name + " hits"]
+        misses = stats[name + " misses"]
+        if hits or misses:
+            lines.append("%s: %d hits, %d misses (%.0f%% hit rate)" %
+                         (name, hits, misses, 100.0 * hits / (hits + misses)))
+    hits = stats["spelling hits"]
+    misses = stats["spelling misses"]
+    if hits or misses:
+        lines.append("spelling: %d of %d lookups avoided, %d words looked up "
+                     "in the spell checker" % (hits, hits + misses, misses))
+    return "\n".join(lines)
+
+
 class pocheckfilter:
 
+    #: Files with at least twice as many units are filtered in parallel in
+    #: chunks of this many units when a worker pool is available
+    unitchunksize = 500
+
     def __init__(self, options, checkerclasses=None, checkerconfig=None):
         # excludefilters={}, limitfilters=None, includefuzzy=True, includereview=True, autocorrect=False):
         """Builds a checkfilter using the given checker (a list is allowed too)"""
@@ -94,6 +154,22 @@ class pocheckfilter:
                                          checkerclasses=checkerclasses,
                                          languagecode=checkerconfig.targetlanguage)
         self.options = options
+        #: The process pool used to filter the units of large files
+        self.pool = None
+        #: The :class:`~translate.filters.checkcache.CheckCache` of the
+        #: results of previous runs, if enabled
+        self.cache = checkcache.get_default_cache()
+        #: The cache hits and misses of worker processes
+        self.workercachestats = Counter()
+        #: The cache stats that a worker process reported last
+        self._reportedcachestats = Counter()
+        #: The :class:`~translate.filters.checkprofiler.CheckProfiler` of
+        #: ``--profile-checks``, if enabled
+        self.profiler = None
+        if getattr(options, "profilechecks", False):
+            from translate.filters.checkprofiler import CheckProfiler
+            self.profiler = CheckProfiler()
+            self.checker.setprofiler(self.profiler)
 
     def getfilterdocs(self):
         """Lists the docs for filters available on checker."""
@@ -116,7 +192,11 @@ class pocheckfilter:
         if not self.options.includereview and unit.isreview():
             return []
 
-        failures = self.checker.run_filters(unit, categorised=True)
+        if self.cache is not None:
+            failures = self.cache.run_filters(self.checker, unit,
+                                              categorised=True)
+        else:
+            failures = self.checker.run_filters(unit, categorised=True)
 
         if failures and self.options.autocorrect:
             # we can't get away with bad unquoting / requoting if we're going to change the result...
@@ -131,6 +211,107 @@ class pocheckfilter:
 
         return failures
 
+    def filterunits(self, units):
+        """Runs filters on the units, returns the results of
+        :meth:`filterunit` in the same order.
+
+        Units of large files are filtered in the worker processes of
+        :attr:`pool` if one was set up.
+        """
+        if self.pool is None or len(units) < 2 * self.unitchunksize:
+            self.prefetch(units)
+            return [self.filterunit(unit) for unit in units]
+
+        chunks = [units[start:start + self.unitchunksize]
+                  for start in range(0, len(units), self.unitchunksize)]
+        futures = [self.pool.submit(_filterunits, self._detachunits(chunk))
+                   for chunk in chunks]
+        results = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                chunkresults, workerstats = future.result()
+            except Exception:
+                # Units that can't be passed to the workers are filtered here
+                results.extend(self.filterunit(unit) for unit in chunk)
+                continue
+            self.addworkerstats(workerstats)
+            for unit, result in zip(chunk, chunkresults):
+                if isinstance(result, tuple):
+                    unit.target = result[1]
+                    result = autocorrect
+                results.append(result)
+        return results
+
+    def getcachestats(self, since=None):
+        """Returns a :class:`~collections.Counter` of the hits and misses of
+        the prefilter caches of the checkers and of the check cache, less the
+        given stats.
+
+        Pending check results are written first so that other processes can
+        use them.
+        """
+        stats = Counter(self.workercachestats)
+        for checker in self.checker.checkers:
+            stats["prefilter hits"] += checker.results_cache.hits
+            stats["prefilter misses"] += checker.results_cache.misses
+        if self.cache is not None:
+            self.cache.flush()
+            stats["check cache hits"] += self.cache.hits
+            stats["check cache misses"] += self.cache.misses
+        wordcache = spelling.get_word_cache()
+        wordcache.flush()
+        stats["spelling hits"] += wordcache.hits
+        stats["spelling misses"] += wordcache.misses
+        if since is not None:
+            stats.subtract(since)
+        return stats
+
+    def addcachestats(self, stats):
+        """Adds the cache hits and misses of a worker process."""
+        stats = Counter(stats)
+        if self.cache is not None:
+            self.cache.hits += stats.pop("check cache hits", 0)
+            self.cache.misses += stats.pop("check cache misses", 0)
+        self.workercachestats.update(stats)
+
+    def getworkerstats(self):
+        """Returns the stats a worker process reports to the main process:
+        the cache stats and the check times collected since the previous
+        call.
+        """
+        cachestats = self.getcachestats()
+        since, self._reportedcachestats = self._reportedcachestats, \
+            Counter(cachestats)
+        cachestats.subtract(since)
+        profile = self.profiler.pop() if self.profiler is not None else None
+        return cachestats, profile
+
+    def addworkerstats(self, stats):
+        """Adds the stats of a worker process."""
+        cachestats, profile = stats
+        self.addcachestats(cachestats)
+        if profile and self.profiler is not None:
+            self.profiler.merge(profile)
+
+    def prefetch(self, units):
+        """Prepares the checks of the units, see
+        :meth:`~translate.filters.checks.UnitChecker.prefetch`.
+        """
+        self.checker.prefetch([unit.source for unit in units],
+                              [unit.target for unit in units])
+
+    @staticmethod
+    def _detachunits(units):
+        """Returns copies of the units that don't refer to their store, so that
+        they can be passed to a worker without the whole store.
+        """
+        detached = []
+        for unit in units:
+            unit = copy.copy(unit)
+            unit._store = None
+            detached.append(unit)
+        return detached
+
     def filterfile(self, transfile):
         """Runs filters on a translation store object.
 
@@ -142,9 +323,8 @@ class pocheckfilter:
         newtransfile.setsourcelanguage(transfile.getsourcelanguage())
         newtransfile.settargetlanguage(transfile.gettargetlanguage())
 
-        for unit in transfile.units:
-            filter_result = self.filterunit(unit)
-
+        for unit, filter_result in zip(transfile.units,
+                                       self.filterunits(transfile.units)):
             if filter_result:
                 if filter_result != autocorrect:
                     for filter_name in filter_result:
@@ -183,19 +363,22 @@ class FilterOptionParser(optrecurse.RecursiveOptionParser):
         setattr(parser.values, option.dest, kwargs['dest_value'])
         parser.values.input = "-"
 
-    def run(self):
+    def run(self, argv=None):
         """Parses the arguments, and runs recursiveprocess with the resulting
         options.
         """
-        (options, args) = self.parse_args()
-
-        if options.filterclass is None:
-            checkerclasses = [checks.StandardChecker, checks.StandardUnitChecker]
-        else:
-            checkerclasses = [options.filterclass, checks.StandardUnitChecker]
-
-        checkerconfig = build_checkerconfig(options)
-        options.checkfilter = pocheckfilter(options, checkerclasses, checkerconfig)
+        (options, args) = self.parse_args(argv)
+
+        if options.checkcache:
+            checkcache.set_default_cache(options.checkcache)
+            checkcache.logger.setLevel(logging.INFO)
+        elif checkcache.get_default_cache() is not None:
+            options.checkcache = checkcache.get_default_cache().filename
+        if options.profilejson:
+            options.profilechecks = True
+        if options.spellcache:
+            spelling.set_word_cache(options.spellcache)
+        options.checkfilter = build_checkfilter(options)
 
         if not options.checkfilter.checker.combinedfilters:
             self.error("No valid filters were specified")
@@ -204,6 +387,70 @@ class FilterOptionParser(optrecurse.RecursiveOptionParser):
             print(options.checkfilter.getfilterdocs())
         else:
             self.recursiveprocess(options)
+            if options.stats:
+                print(formatcachestats(options.checkfilter.getcachestats()),
+                      file=sys.stderr)
+            profiler = options.checkfilter.profiler
+            if profiler is not None:
+                print(profiler.report(), file=sys.stderr)
+                if options.profilejson:
+                    with open(options.profilejson, "w") as jsonfile:
+                        profiler.writejson(jsonfile)
+
+    def setjobsoptions(self):
+        jobsoption = optrecurse.optparse.Option(
+            "-j", "--jobs", dest="jobs", default=1, type="int",
+            metavar="JOBS",
+            help="check files, or the units of large files, in JOBS processes")
+        self.define_option(jobsoption)
+
+    def getworkeroptions(self, options):
+        """The workers build their own checkers and open their own
+        connections to the caches.
+        """
+        workeroptions = super().getworkeroptions(options)
+        del workeroptions.checkfilter
+        if options.checkfilter.cache is not None:
+            options.checkfilter.cache.close()
+        spelling.get_word_cache().close()
+        return workeroptions
+
+    def initworker(self, options):
+        """Sets up a worker process, the checkers are built once per
+        worker.
+        """
+        global _worker
+        if options.checkcache:
+            # Every worker needs its own connection to the cache
+            checkcache.set_default_cache(options.checkcache)
+        if options.spellcache:
+            spelling.set_word_cache(options.spellcache)
+        options.checkfilter = build_checkfilter(options)
+        _worker = (self, options)
+
+    def getworkerstats(self, options):
+        """See :meth:`pocheckfilter.getworkerstats`."""
+        return options.checkfilter.getworkerstats()
+
+    def addworkerstats(self, options, stats):
+        options.checkfilter.addworkerstats(stats)
+
+    def processinpool(self, options, filetasks, progress_bar):
+        """Filters the files in a pool of ``--jobs`` processes.
+
+        Files are distributed over the workers if there are at least as many
+        files as workers, otherwise the units of large files are.  Output and
+        progress are the same as when filtering in a single process.
+        """
+        filetasks = list(filetasks)
+        if len(filetasks) >= options.jobs:
+            return super().processinpool(options, filetasks, progress_bar)
+        with self.openprocesspool(options) as pool:
+            options.checkfilter.pool = pool
+            try:
+                self.processfiletasks(options, filetasks, progress_bar)
+            finally:
+                options.checkfilter.pool = None
 
 
 def runfilter(inputfile, outputfile, templatefile, checkfilter=None):
@@ -305,15 +552,36 @@ def cmdlineparser():
         default=None, type="string", metavar="FILE",
         help="read list of all valid characters from FILE (must be in UTF-8)")
 
+    parser.add_option(
+        "", "--stats", dest="stats",
+        action="store_true", default=False,
+        help="show the hit rates of the caches used by the checks")
+    parser.add_option(
+        "", "--profile-checks", dest="profilechecks",
+        action="store_true", default=False,
+        help="show the calls, failures and time of every check")
+    parser.add_option(
+        "", "--profile-json", dest="profilejson",
+        default=None, type="string", metavar="FILE",
+        help="write the --profile-checks stats to FILE as JSON")
+    parser.add_option(
+        "", "--checkcache", dest="checkcache",
+        default=None, type="string", metavar="FILE",
+        help="reuse the check results of unchanged units from the cache FILE")
+    parser.add_option(
+        "", "--spellcache", dest="spellcache",
+        default=None, type="string", metavar="FILE",
+        help="keep the verdicts of the spell checker in FILE")
+
     parser.passthrough.append('checkfilter')
     parser.description = __doc__
 
     return parser
 
 
-def main():
+def main(argv=None):
     parser = cmdlineparser()
-    parser.run()
+    parser.run(argv)
 
 
 if __name__ == '__main__':
@@ -18,20 +18,196 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
-"""An API to provide spell checking for use in checks or elsewhere."""
+"""An API to provide spell checking for use in checks or elsewhere.
 
+The spell checker is only asked about every word once: the verdicts are kept
+in a :class:`WordCache`, which can also store them in a file to be reused by
+later runs.  Set the ``TRANSLATE_SPELL_CACHE`` environment variable to a file,
+or call :func:`set_word_cache`, to keep the verdicts.  :func:`prefetch` looks
+up all the words of many strings at once.
+"""
+
+import atexit
 import logging
+import os
+
+from translate.misc import lru
 
 
 logger = logging.getLogger(__name__)
 
+CACHE_ENVIRONMENT_VARIABLE = "TRANSLATE_SPELL_CACHE"
+"""The environment variable that enables the persistent word cache"""
+
 available = False
 
+
+class WordCache:
+    """Spelling verdicts of words per language, kept in memory and optionally
+    in an SQLite file.
+
+    The verdicts in the file are discarded when the dictionary of a language
+    changes.  New verdicts are written in batches, and when the cache is
+    closed.
+    """
+
+    #: The number of verdicts kept in memory per language
+    maxsize = 100000
+
+    #: The number of new verdicts that are written in one transaction
+    batchsize = 1000
+
+    def __init__(self, filename=None):
+        self.filename = filename and os.path.abspath(filename)
+        #: Verdicts that didn't need the spell checker
+        self.hits = 0
+        #: Words the spell checker was asked about
+        self.misses = 0
+        self._verdicts = {}
+        self._pending = []
+        self._con = None
+        self._dictionaries = {}
+
+    def _connect(self):
+        if self._con is None:
+            from sqlite3 import dbapi2
+            directory = os.path.dirname(self.filename)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            self._con = dbapi2.connect(self.filename, timeout=30)
+            self._con.execute("PRAGMA journal_mode=WAL;")
+            self._con.execute("""CREATE TABLE IF NOT EXISTS words(
+                lang TEXT NOT NULL,
+                word TEXT NOT NULL,
+                correct INTEGER NOT NULL,
+                PRIMARY KEY (lang, word));""")
+            self._con.execute("""CREATE TABLE IF NOT EXISTS dictionaries(
+                lang TEXT PRIMARY KEY NOT NULL,
+                dictionary TEXT NOT NULL);""")
+            self._con.commit()
+        return self._con
+
+    def _checkdictionary(self, lang, dictionary):
+        """Discards the stored verdicts of lang if they were given by another
+        dictionary.
+        """
+        if self._dictionaries.get(lang) == dictionary:
+            return
+        con = self._connect()
+        with con:
+            row = con.execute("SELECT dictionary FROM dictionaries "
+                              "WHERE lang = ?;", (lang,)).fetchone()
+            if row is None or row[0] != dictionary:
+                con.execute("DELETE FROM words WHERE lang = ?;", (lang,))
+                con.execute("INSERT OR REPLACE INTO dictionaries "
+                            "(lang, dictionary) VALUES (?, ?);",
+                            (lang, dictionary))
+        self._dictionaries[lang] = dictionary
+
+    def _loadverdicts(self, lang, words):
+        """Returns the stored verdicts of the words."""
+        con = self._connect()
+        verdicts = {}
+        words = list(words)
+        # Stay below the SQLite limit of variables in a statement
+        for start in range(0, len(words), 500):
+            chunk = words[start:start + 500]
+            rows = con.execute(
+                "SELECT word, correct FROM words WHERE lang = ? "
+                "AND word IN (%s);" % ", ".join("?" * len(chunk)),
+                [lang] + chunk)
+            verdicts.update((word, bool(correct)) for word, correct in rows)
+        return verdicts
+
+    def verdicts(self, words, lang, lookup, dictionary=""):
+        """Returns a dictionary with the verdicts of the words, True if a word
+        is spelled correctly.
+
+        :param lookup: A function that returns whether a word is spelled
+                       correctly, called for words without a verdict.
+        :param dictionary: A description of the dictionary of the language,
+                           stored verdicts of other dictionaries are ignored.
+        """
+        cache = self._verdicts.get(lang)
+        if cache is None:
+            cache = self._verdicts[lang] = lru.LRUDict(self.maxsize)
+        results = {}
+        unknown = set()
+        for word in words:
+            if word in results:
+                continue
+            verdict = cache.lookup(word)
+            if verdict is None:
+                unknown.add(word)
+            else:
+                results[word] = verdict
+        if unknown and self.filename:
+            self._checkdictionary(lang, dictionary)
+            stored = self._loadverdicts(lang, unknown)
+            for word, verdict in stored.items():
+                cache[word] = results[word] = verdict
+            unknown.difference_update(stored)
+        self.hits += len(results)
+        self.misses += len(unknown)
+        for word in unknown:
+            cache[word] = results[word] = verdict = bool(lookup(word))
+            if self.filename:
+                self._pending.append((lang, word, int(verdict)))
+        if len(self._pending) >= self.batchsize:
+            self.flush()
+        return results
+
+    def flush(self):
+        """Writes the new verdicts to the file."""
+        if not self._pending:
+            return
+        con = self._connect()
+        with con:
+            con.executemany("INSERT OR REPLACE INTO words (lang, word, "
+                            "correct) VALUES (?, ?, ?);", self._pending)
+        self._pending = []
+
+    def close(self):
+        """Writes the new verdicts and closes the file."""
+        if self.filename:
+            self.flush()
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+
+_word_cache = None
+
+
+def set_word_cache(filename):
+    """Sets the file that keeps the verdicts of the spell checker, None only
+    keeps them in memory.
+    """
+    global _word_cache
+    if _word_cache is not None:
+        _word_cache.close()
+        atexit.unregister(_word_cache.close)
+    _word_cache = WordCache(filename)
+    if filename:
+        atexit.register(_word_cache.close)
+    return _word_cache
+
+
+def get_word_cache():
+    """Returns the :class:`WordCache` used by the spell checking functions."""
+    if _word_cache is None:
+        set_word_cache(os.environ.get(CACHE_ENVIRONMENT_VARIABLE))
+    return _word_cache
+
+
 try:
     # Enchant
     from enchant import checker, Error as EnchantError
+    from enchant.errors import TokenizerNotFoundError
+    from enchant.tokenize import get_tokenizer
     available = True
     checkers = {}
+    tokenizers = {}
 
     def _get_checker(lang):
         if lang not in checkers:
@@ -46,6 +222,25 @@ try:
 
         return checkers[lang]
 
+    def _words(text, lang):
+        """Returns the words of the text that the spell checker checks."""
+        if lang not in tokenizers:
+            try:
+                tokenizers[lang] = get_tokenizer(lang)
+            except TokenizerNotFoundError:
+                # Like the SpellChecker, fall back to the default tokenizer
+                tokenizers[lang] = get_tokenizer()
+        return [word for word, pos in tokenizers[lang](str(text))]
+
+    def _verdicts(words, lang):
+        spellchecker = _get_checker(lang)
+        if not spellchecker:
+            return None
+        dictionary = spellchecker.dict
+        return get_word_cache().verdicts(
+            words, lang, dictionary.check,
+            "%s %s" % (dictionary.provider.name, dictionary.tag))
+
     def check(text, lang):
         spellchecker = _get_checker(lang)
         if not spellchecker:
@@ -55,12 +250,22 @@ try:
             yield err.word, err.wordpos, err.suggest()
 
     def simple_check(text, lang):
-        spellchecker = _get_checker(lang)
-        if not spellchecker:
+        words = _words(text, lang)
+        verdicts = _verdicts(words, lang)
+        if not verdicts:
             return
-        spellchecker.set_text(str(text))
-        for err in spellchecker:
-            yield err.word
+        for word in words:
+            if not verdicts[word]:
+                yield word
+
+    def prefetch(texts, lang):
+        """Looks up all the words of the texts at once, so that checking the
+        texts later only uses the word cache.
+        """
+        words = set()
+        for text in texts:
+            words.update(_words(text, lang))
+        _verdicts(words, lang)
 
 
 except ImportError:
@@ -70,3 +275,6 @@ except ImportError:
 
     def simple_check(text, lang):
         return []
+
+    def prefetch(texts, lang):
+        pass
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+
+from translate.filters import checkcache, checks
+from translate.storage import po
+
+
+def make_unit(source, target, locations=()):
+    unit = po.pounit(source)
+    unit.target = target
+    for location in locations:
+        unit.addlocation(location)
+    return unit
+
+
+class TestCheckCache:
+
+    def setup_method(self, method):
+        """sets up a test directory for the cache"""
+        self.testdir = "%s_testdir" % (self.__class__.__name__)
+        self.teardown_method(method)
+        os.mkdir(self.testdir)
+        self.cachefile = os.path.join(self.testdir, "checks.db")
+        self.cache = checkcache.CheckCache(self.cachefile)
+        self.checker = checks.TeeChecker(
+            checkerclasses=[checks.StandardChecker,
+                            checks.StandardUnitChecker])
+
+    def teardown_method(self, method):
+        """removes the test directory"""
+        cache = getattr(self, "cache", None)
+        if cache is not None:
+            cache.close()
+        if os.path.exists(self.testdir):
+            shutil.rmtree(self.testdir)
+
+    def test_hit(self):
+        unit = make_unit(u"Hello, world", u"hallo wêreld")
+        expected = self.checker.run_filters(unit, categorised=True)
+        assert "startcaps" in expected
+        assert self.cache.run_filters(self.checker, unit, True) == expected
+        assert (self.cache.hits, self.cache.misses) == (0, 1)
+        assert self.cache.run_filters(self.checker, unit, True) == expected
+        assert self.cache.run_filters(self.checker, unit) == \
+            self.checker.run_filters(unit)
+        assert (self.cache.hits, self.cache.misses) == (2, 1)
+
+    def test_persistent(self):
+        unit = make_unit(u"Hello, world", u"hallo wêreld")
+        expected = self.checker.run_filters(unit)
+        self.cache.run_filters(self.checker, unit)
+        self.cache.close()
+        self.cache = checkcache.CheckCache(self.cachefile)
+        assert self.cache.run_filters(self.checker, unit) == expected
+        assert (self.cache.hits, self.cache.misses) == (1, 0)
+
+    def test_key(self):
+        unit = make_unit(u"Hello, world", u"Hallo wêreld", ["a.c:1"])
+        key = self.cache.unitkey(self.checker, unit)
+        assert self.cache.unitkey(self.checker, unit) == key
+        changed = [
+            make_unit(u"Hello, world", u"Hallo, wêreld", ["a.c:1"]),
+            make_unit(u"Hello world", u"Hallo wêreld", ["a.c:1"]),
+            make_unit(u"Hello, world", u"Hallo wêreld", ["b.c:1"]),
+        ]
+        for other in changed:
+            assert self.cache.unitkey(self.checker, other) != key
+        unit.markfuzzy()
+        assert self.cache.unitkey(self.checker, unit) != key
+
+    def test_checker_key(self):
+        unit = make_unit(u"Hello, world", u"Hallo wêreld")
+        key = self.cache.unitkey(self.checker, unit)
+        others = [
+            checks.TeeChecker(checkerclasses=[checks.StandardChecker]),
+            checks.TeeChecker(checkerclasses=[checks.StandardChecker,
+                                              checks.StandardUnitChecker],
+                              excludefilters=["startcaps"]),
+            checks.TeeChecker(
+                checkerconfig=checks.CheckerConfig(notranslatewords=["world"]),
+                checkerclasses=[checks.StandardChecker,
+                                checks.StandardUnitChecker]),
+            checks.TeeChecker(checkerclasses=[checks.StandardChecker,
+                                              checks.StandardUnitChecker],
+                              languagecode="fr"),
+        ]
+        for checker in others:
+            assert self.cache.unitkey(checker, unit) != key
+        same = checks.TeeChecker(checkerclasses=[checks.StandardChecker,
+                                                 checks.StandardUnitChecker])
+        assert self.cache.unitkey(same, unit) == key
+
+    def test_eviction(self):
+        self.cache.close()
+        self.cache = checkcache.CheckCache(self.cachefile, maxentries=2)
+        units = [make_unit(u"Test %d" % i, u"toets %d" % i) for i in range(3)]
+        for unit in units[:2]:
+            self.cache.run_filters(self.checker, unit)
+        self.cache.close()
+        # A new run uses the first unit, the second is the least recently used
+        self.cache = checkcache.CheckCache(self.cachefile, maxentries=2)
+        self.cache.run_filters(self.checker, units[0])
+        self.cache.run_filters(self.checker, units[2])
+        self.cache.close()
+        self.cache = checkcache.CheckCache(self.cachefile, maxentries=2)
+        for unit in units:
+            self.cache.run_filters(self.checker, unit)
+        assert self.cache.misses == 1
+        assert self.cache.hits == 2
+
+    def test_suggestions(self):
+        """units are not cached when suggestions are checked"""
+        self.checker.setsuggestionstore(po.pofile())
+        unit = make_unit(u"Hello", u"Hallo")
+        self.cache.run_filters(self.checker, unit)
+        self.cache.run_filters(self.checker, unit)
+        assert self.cache.hits == self.cache.misses == 0
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+from translate.filters import checks
+from translate.filters.checkprofiler import CheckProfiler
+from translate.storage import base
+
+
+def test_profile_checks():
+    checker = checks.TeeChecker(checkerclasses=[checks.StandardChecker,
+                                                checks.StandardUnitChecker])
+    profiler = CheckProfiler()
+    checker.setprofiler(profiler)
+    unit = base.TranslationUnit(u'Save as PDF')
+    unit.target = u'stoor as pdf'
+    failures = checker.run_filters(unit)
+    checker.run_filters(unit)
+    checker.setprofiler(None)
+    checker.run_filters(unit)
+
+    results = dict(((result["checker"], result["check"]), result)
+                   for result in profiler.checks())
+    startcaps = results[("StandardChecker", "startcaps")]
+    assert startcaps["calls"] == 2
+    assert startcaps["failures"] == 2
+    assert startcaps["max"] <= startcaps["total"]
+    assert results[("StandardChecker", "doublespacing")]["failures"] == 0
+    assert set(failures) <= set(name for checkername, name in results)
+
+    checkers = dict((result["checker"], result)
+                    for result in profiler.checkers())
+    assert set(checkers) == set(["StandardChecker", "StandardUnitChecker"])
+    assert checkers["StandardChecker"]["calls"] == \
+        2 * checkers["StandardChecker"]["checks"]
+
+    report = profiler.report()
+    assert "startcaps" in report
+    assert "StandardUnitChecker" in report
+
+
+def test_merge():
+    profiler = CheckProfiler()
+    profiler.record("StandardChecker", "startcaps", 0.5, True)
+    other = CheckProfiler()
+    other.record("StandardChecker", "startcaps", 1.0)
+    other.record("StandardChecker", "endpunc", 0.25)
+    profiler.merge(other.pop())
+    assert other.stats == {}
+    startcaps, endpunc = profiler.checks()
+    assert (startcaps["check"], startcaps["calls"], startcaps["failures"],
+            startcaps["total"], startcaps["max"]) == \
+        ("startcaps", 2, 1, 1.5, 1.0)
+    assert endpunc["mean"] == 0.25
+
+    output = io.StringIO()
+    profiler.writejson(output)
+    stats = json.loads(output.getvalue())
+    assert stats["checkers"][0]["calls"] == 3
+    assert stats["checks"][0]["check"] == "startcaps"
@@ -1709,3 +1709,112 @@ def test_category():
     assert standard_checker.categories != {}
     assert len(standard_checker.categories.values()) == standard_categories_count
     assert 'validxml' not in standard_checker.categories.keys()
+
+
+def test_check_plan():
+    """Tests that the check plan is reused and follows language changes."""
+    from translate.storage import base
+    unit = base.TranslationUnit(u'Save as PDF')
+    unit.target = u'stoor as pdf'
+
+    checker = checks.StandardChecker()
+    assert 'startcaps' in checker.run_filters(unit)
+    plan = checker._getplan()
+    assert plan.steps[0][0] == 'untranslated'
+    checker.run_filters(unit)
+    assert checker._getplan() is plan
+
+    # Arabic ignores the checks on capitals
+    checker.config.updatetargetlanguage('ar')
+    failures = checker.run_filters(unit)
+    assert 'startcaps' not in failures
+    assert 'acronyms' not in failures
+    assert checker._getplan() is not plan
+
+    # Preconditions that fail remove other checks for the unit only
+    unit.target = u''
+    assert list(checker.run_filters(unit)) == ['untranslated']
+    unit.target = u'stoor as pdf'
+    assert checker.run_filters(unit) == failures
+
+
+def test_results_cache():
+    """Tests that prefilter results are reused across units and bounded."""
+    from translate.storage import base
+    checker = checks.StandardChecker()
+    checker.results_cache_size = 4
+    checker.setconfig(checks.CheckerConfig(accelmarkers=['&']))
+    unit = base.TranslationUnit(u'Save &file')
+    unit.target = u'Stoor &lêer'
+    assert checker.filteraccelerators(u'Save &file') == u'Save file'
+    checker.run_filters(unit)
+    assert checker.results_cache.hits > 0
+    assert len(checker.results_cache) == 4
+
+    # The cached results follow the configuration
+    checker.setconfig(checks.CheckerConfig(accelmarkers=['_']))
+    assert checker.filteraccelerators(u'Save &file') == u'Save &file'
+    assert checker.results_cache.misses == 1
+
+
+def test_run_filters_batch():
+    """Tests that batches give the same results as checking every unit."""
+    from translate.storage import base
+    checker = checks.StandardChecker()
+    pairs = [(u'Save as PDF', u'stoor as pdf'),
+             (u'Open', u'Maak oop'),
+             (u'Save as PDF', u'stoor as pdf'),
+             (u'Close.', u'Maak toe')]
+    units = []
+    for source, target in pairs:
+        unit = base.TranslationUnit(source)
+        unit.target = target
+        units.append(unit)
+    results = checker.run_filters_batch(units)
+    assert results['startcaps']['indices'] == [0, 2]
+    assert results['endpunc']['indices'] == [3]
+    for name, column in results.items():
+        for index, message in zip(column['indices'], column['messages']):
+            assert checker.run_filters(units[index])[name] == message
+    failing = set(index for column in results.values()
+                  for index in column['indices'])
+    assert failing == set(index for index, unit in enumerate(units)
+                          if checker.run_filters(unit))
+
+    # Normalized strings can be passed in
+    sources = [source for source, target in pairs]
+    targets = [u'Stoor as PDF', u'Maak oop', u'Stoor as PDF', u'Maak toe.']
+    assert checker.run_filters_batch(units, sources, targets) == {}
+
+
+def test_run_filters_batch_threads():
+    """Tests that batches can be checked by several threads at once."""
+    from concurrent.futures import ThreadPoolExecutor
+    from translate.storage import base
+    checker = checks.StandardChecker()
+    batches = []
+    for batch in range(8):
+        units = []
+        for i in range(50):
+            unit = base.TranslationUnit(u'File %d.' % i)
+            unit.target = u'lêer %d%s' % (i, '.' if batch % 2 else '')
+            units.append(unit)
+        batches.append(units)
+    expected = [checker.run_filters_batch(units) for units in batches[:2]]
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(checker.run_filters_batch, batches))
+    for batch, result in enumerate(results):
+        assert result == expected[batch % 2]
+
+
+def test_teechecker_run_filters_batch():
+    from translate.storage import base
+    checker = checks.TeeChecker(checkerclasses=[checks.StandardChecker,
+                                                checks.StandardUnitChecker])
+    unit = base.TranslationUnit(u'Save as PDF')
+    unit.target = u'stoor as pdf'
+    other = base.TranslationUnit(u'Open')
+    other.target = u'Maak oop'
+    results = checker.run_filters_batch([other, unit])
+    assert set(results) == set(checker.run_filters(unit))
+    assert results['startcaps']['indices'] == [1]
@@ -2,9 +2,18 @@
 
 """tests decoration handling functions that are used by checks"""
 
+import sys
+
 from translate.filters import decoration
 
 
+def test_whitespace():
+    """test that whitespace holds exactly the characters of str.isspace()"""
+    spaces = u"".join(chr(n) for n in range(sys.maxunicode + 1)
+                      if chr(n).isspace())
+    assert decoration.whitespace == spaces
+
+
 def test_spacestart():
     """test operation of spacestart()"""
     assert decoration.spacestart("  Start") == "  "
@@ -13,6 +22,50 @@ def test_spacestart():
     assert decoration.spacestart(u"\u00a0\u202fStart") == u"\u00a0\u202f"
     # Some exotic spaces
     assert decoration.spacestart(u"\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200aStart") == u"\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    assert decoration.spacestart(u"") == u""
+    assert decoration.spacestart(u" \t\n") == u" \t\n"
+
+
+def test_spaceend():
+    """test operation of spaceend()"""
+    assert decoration.spaceend(u"End  ") == u"  "
+    assert decoration.spaceend(u"End\u00a0\u202f") == u"\u00a0\u202f"
+    assert decoration.spaceend(u"End") == u""
+    assert decoration.spaceend(u"") == u""
+    assert decoration.spaceend(u"\n \n") == u"\n \n"
+
+
+def test_puncstart():
+    """test operation of puncstart()"""
+    assert decoration.puncstart(u"...Start", u".") == u"..."
+    assert decoration.puncstart(u" . ¿Start?", u".?¿") == u" . ¿"
+    assert decoration.puncstart(u"\u00a0-Start", u"-") == u"\u00a0-"
+    assert decoration.puncstart(u"Start.", u".") == u""
+    assert decoration.puncstart(u"", u".") == u""
+    # characters that are special in regular expressions
+    assert decoration.puncstart(u"]^\\-x", u"]^\\-") == u"]^\\-"
+
+
+def test_puncend():
+    """test operation of puncend()"""
+    assert decoration.puncend(u"End...", u".") == u"..."
+    assert decoration.puncend(u"End : ", u":") == u" : "
+    # non-breaking spaces are returned as spaces
+    assert decoration.puncend(u"End\u00a0!", u"!") == u" !"
+    assert decoration.puncend(u"End.", u"!") == u""
+    assert decoration.puncend(u"", u".") == u""
+    assert decoration.puncend(u"?!", u"?!") == u"?!"
+    # sequences of punctuation only match single characters
+    assert decoration.puncend(u"End. :", (u". ", u":")) == u" :"
+
+
+def test_ispurepunctuation():
+    """test operation of ispurepunctuation()"""
+    assert decoration.ispurepunctuation(u"+") == 1
+    assert decoration.ispurepunctuation(u"-- _") == 4
+    assert not decoration.ispurepunctuation(u"")
+    assert not decoration.ispurepunctuation(u"A+")
+    assert not decoration.ispurepunctuation(u"+\u09e7")
 
 
 def test_isvalidaccelerator():
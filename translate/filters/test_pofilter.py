@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
-from translate.filters import checks, pofilter
+import json
+import os
+import shutil
+
+from translate.filters import checkcache, checks, pofilter
 from translate.misc import wStringIO
 from translate.storage import factory, xliff
 from translate.storage.test_base import first_translatable, headerless_len
@@ -375,3 +379,121 @@ msgstr "bla nicio bla"
         errors = first_translatable(filter_result).geterrors()
         assert len(errors) == 0
         assert 'niciun_nicio' not in errors
+
+
+class TestPOFilterJobs:
+    """Tests that pofilter --jobs gives the same results as a single process"""
+
+    def setup_method(self, method):
+        self.testdir = "%s_%s" % (self.__class__.__name__, method.__name__)
+        self.teardown_method(method)
+        os.mkdir(self.testdir)
+
+    def teardown_method(self, method):
+        if os.path.exists(self.testdir):
+            shutil.rmtree(self.testdir)
+
+    def writepo(self, filename, count):
+        units = ['msgid "Test %d"\nmsgstr "toets %d"\n' % (i, i)
+                 for i in range(count)]
+        units[1::3] = ['msgid "Line %d\\n"\nmsgstr "Lyn %d"\n' % (i, i)
+                       for i in range(len(units[1::3]))]
+        with open(os.path.join(self.testdir, filename), "w") as pofile:
+            pofile.write("\n".join(units))
+
+    def run_pofilter(self, inputname, outputname, *args):
+        pofilter.main([os.path.join(self.testdir, inputname),
+                       os.path.join(self.testdir, outputname),
+                       "--progress=none"] + list(args))
+
+    def read(self, filename):
+        with open(os.path.join(self.testdir, filename), "rb") as outputfile:
+            return outputfile.read()
+
+    def test_files(self):
+        os.mkdir(os.path.join(self.testdir, "input"))
+        for i in range(4):
+            self.writepo(os.path.join("input", "%d.po" % i), 10 + i)
+        self.run_pofilter("input", "serial")
+        self.run_pofilter("input", "parallel", "--jobs=2")
+        for i in range(4):
+            filename = "%d.po" % i
+            serial = self.read(os.path.join("serial", filename))
+            assert b"startcaps" in serial
+            assert serial == self.read(os.path.join("parallel", filename))
+
+    def test_units(self, monkeypatch):
+        monkeypatch.setattr(pofilter.pocheckfilter, "unitchunksize", 4)
+        self.writepo("input.po", 30)
+        self.run_pofilter("input.po", "serial.po")
+        self.run_pofilter("input.po", "parallel.po", "--jobs=3")
+        serial = self.read("serial.po")
+        assert serial.count(b"newlines") == 10
+        assert serial == self.read("parallel.po")
+        self.run_pofilter("input.po", "serial.po", "--autocorrect")
+        self.run_pofilter("input.po", "parallel.po", "--autocorrect",
+                          "--jobs=3")
+        assert self.read("serial.po") == self.read("parallel.po")
+
+    def test_checkcache(self):
+        cachefile = os.path.join(self.testdir, "checks.db")
+        self.writepo("input.po", 12)
+        self.run_pofilter("input.po", "uncached.po")
+        try:
+            self.run_pofilter("input.po", "first.po", "--checkcache", cachefile)
+            cache = checkcache.get_default_cache()
+            assert (cache.hits, cache.misses) == (0, 12)
+            self.run_pofilter("input.po", "second.po", "--checkcache",
+                              cachefile)
+            cache = checkcache.get_default_cache()
+            assert (cache.hits, cache.misses) == (12, 0)
+            os.mkdir(os.path.join(self.testdir, "input"))
+            for i in range(2):
+                self.writepo(os.path.join("input", "%d.po" % i), 12 + i)
+            self.run_pofilter("input", "parallel", "--checkcache", cachefile,
+                              "--jobs=2")
+            cache = checkcache.get_default_cache()
+            assert (cache.hits, cache.misses) == (24, 1)
+        finally:
+            checkcache.set_default_cache(None)
+        assert self.read("first.po") == self.read("uncached.po")
+        assert self.read("second.po") == self.read("uncached.po")
+        assert self.read(os.path.join("parallel", "0.po")) == \
+            self.read("uncached.po")
+
+    def test_stats(self, capsys, monkeypatch):
+        self.writepo("input.po", 30)
+        self.run_pofilter("input.po", "serial.po", "--stats")
+        serial = capsys.readouterr().err
+        assert serial.startswith("prefilter: ")
+        assert "check cache" not in serial
+        monkeypatch.setattr(pofilter.pocheckfilter, "unitchunksize", 4)
+        self.run_pofilter("input.po", "parallel.po", "--stats", "--jobs=2")
+        # The units share no strings, the workers find the same hits
+        assert capsys.readouterr().err == serial
+
+    def test_profile_checks(self, capsys):
+        self.writepo("input.po", 6)
+        profilejson = os.path.join(self.testdir, "profile.json")
+        self.run_pofilter("input.po", "output.po", "--jobs=2",
+                          "--profile-json", profilejson)
+        report = capsys.readouterr().err
+        assert "startcaps" in report
+        with open(profilejson) as jsonfile:
+            profile = json.load(jsonfile)
+        checks = dict((result["check"], result)
+                      for result in profile["checks"]
+                      if result["checker"] == "StandardChecker")
+        assert checks["newlines"]["calls"] == 6
+        assert checks["newlines"]["failures"] == 2
+
+
+def test_formatcachestats():
+    from collections import Counter
+    stats = Counter({"prefilter hits": 3, "prefilter misses": 1,
+                     "spelling hits": 90, "spelling misses": 10})
+    assert pofilter.formatcachestats(stats).split("\n") == [
+        "prefilter: 3 hits, 1 misses (75% hit rate)",
+        "spelling: 90 of 100 lookups avoided, 10 words looked up in the "
+        "spell checker",
+    ]
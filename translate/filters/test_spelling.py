@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+
+from translate.filters import spelling
+
+
+class TestWordCache:
+
+    def setup_method(self, method):
+        """sets up a test directory for the cache"""
+        self.testdir = "%s_testdir" % (self.__class__.__name__)
+        self.teardown_method(method)
+        os.mkdir(self.testdir)
+        self.cachefile = os.path.join(self.testdir, "words.db")
+        self.lookups = []
+
+    def teardown_method(self, method):
+        """removes the test directory"""
+        if os.path.exists(self.testdir):
+            shutil.rmtree(self.testdir)
+
+    def lookup(self, word):
+        self.lookups.append(word)
+        return word.islower()
+
+    def test_memory(self):
+        cache = spelling.WordCache()
+        verdicts = cache.verdicts(["dit", "Dit", "dit"], "af", self.lookup)
+        assert verdicts == {"dit": True, "Dit": False}
+        assert cache.verdicts(["dit", "is"], "af", self.lookup) == \
+            {"dit": True, "is": True}
+        # Every word is only looked up once
+        assert sorted(self.lookups) == ["Dit", "dit", "is"]
+        assert (cache.hits, cache.misses) == (1, 3)
+        # Languages don't share verdicts
+        cache.verdicts(["dit"], "nl", self.lookup)
+        assert len(self.lookups) == 4
+
+    def test_persistent(self):
+        cache = spelling.WordCache(self.cachefile)
+        cache.verdicts(["dit", "Dit"], "af", self.lookup, "hunspell af")
+        cache.close()
+        cache = spelling.WordCache(self.cachefile)
+        verdicts = cache.verdicts(["dit", "Dit", "is"], "af", self.lookup,
+                                  "hunspell af")
+        assert verdicts == {"dit": True, "Dit": False, "is": True}
+        assert sorted(self.lookups[:2]) == ["Dit", "dit"]
+        assert self.lookups[2:] == ["is"]
+        assert (cache.hits, cache.misses) == (2, 1)
+        cache.close()
+
+    def test_changed_dictionary(self):
+        cache = spelling.WordCache(self.cachefile)
+        cache.verdicts(["dit"], "af", self.lookup, "hunspell af")
+        cache.close()
+        cache = spelling.WordCache(self.cachefile)
+        cache.verdicts(["dit"], "af", self.lookup, "aspell af")
+        assert self.lookups == ["dit", "dit"]
+        cache.close()
@@ -26,9 +26,10 @@
 import re
 
 from translate.lang import common
+from translate.misc import lazyre
 
 
-articlere = re.compile(r"'n\b")
+articlere = lazyre.compile(r"'n\b")
 
 
 class af(common.Common):
@@ -39,7 +40,7 @@ class af(common.Common):
     punctuation = "".join([common.Common.commonpunc, common.Common.quotes,
                            common.Common.miscpunc])
     sentenceend = ".!?…"
-    sentencere = re.compile(r"""
+    sentencere = lazyre.compile(r"""
         (?s)        # make . also match newlines
         .*?         # anything, but match non-greedy
         [%s]        # the puntuation for sentence ending
@@ -26,6 +26,7 @@
 import re
 
 from translate.lang import common
+from translate.misc import lazyre
 
 
 class am(common.Common):
@@ -35,7 +36,7 @@ class am(common.Common):
 
     sentenceend = "።!?…"
 
-    sentencere = re.compile(r"""(?s)    #make . also match newlines
+    sentencere = lazyre.compile(r"""(?s)    #make . also match newlines
                             .*?         #anything, but match non-greedy
                             [%s]        #the puntuation for sentence ending
                             \s*         #optional spacing after the puntuation
@@ -26,6 +26,7 @@
 import re
 
 from translate.lang import common
+from translate.misc import lazyre
 
 
 class bn(common.Common):
@@ -33,7 +34,7 @@ class bn(common.Common):
 
     sentenceend = "।!?…"
 
-    sentencere = re.compile(r"""(?s)    #make . also match newlines
+    sentencere = lazyre.compile(r"""(?s)    #make . also match newlines
                             .*?         #anything, but match non-greedy
                             [%s]        #the puntuation for sentence ending
                             \s+         #the spacing after the puntuation
@@ -64,6 +64,7 @@ import logging
 import re
 
 from translate.lang import data
+from translate.misc import lazyre
 
 
 logger = logging.getLogger(__name__)
@@ -170,7 +171,7 @@ class Common:
     #what works, see test_common.py. We try to ignore abbreviations, for
     #example, by checking that the following sentence doesn't start with lower
     #case or numbers.
-    sentencere = re.compile(r"""
+    sentencere = lazyre.compile(r"""
         (?s)        # make . also match newlines
         .*?         # anything, but match non-greedy
         [%s]        # the puntuation for sentence ending
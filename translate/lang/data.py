@@ -25,10 +25,25 @@ import locale
 import os
 import re
 
-try:
-    import pycountry
-except ImportError:
-    pycountry = None
+from translate.misc import lazyre
+
+
+_pycountry = False
+
+
+def _get_pycountry():
+    """Returns the pycountry module, or None if it is not installed.
+
+    pycountry is slow to import, so it is only imported when it is needed.
+    """
+    global _pycountry
+    if _pycountry is False:
+        try:
+            import pycountry
+        except ImportError:
+            pycountry = None
+        _pycountry = pycountry
+    return _pycountry
 
 
 languages = {
@@ -575,10 +590,10 @@ expansion_factors = {
 }
 """Source to target string length expansion factors."""
 
-langcode_re = re.compile("^[a-z]{2,3}([_-][A-Z]{2,3}|)(@[a-zA-Z0-9]+|)$")
-langcode_ire = re.compile("^[a-z]{2,3}([_-][a-z]{2,3})?(@[a-z0-9]+)?$",
-                          re.IGNORECASE)
-variant_re = re.compile("^[_-][A-Z]{2,3}(@[a-zA-Z0-9]+|)$")
+langcode_re = lazyre.compile("^[a-z]{2,3}([_-][A-Z]{2,3}|)(@[a-zA-Z0-9]+|)$")
+langcode_ire = lazyre.compile("^[a-z]{2,3}([_-][a-z]{2,3})?(@[a-z0-9]+)?$",
+                              re.IGNORECASE)
+variant_re = lazyre.compile("^[_-][A-Z]{2,3}(@[a-zA-Z0-9]+|)$")
 
 
 def languagematch(languagecode, otherlanguagecode):
@@ -593,6 +608,7 @@ def languagematch(languagecode, otherlanguagecode):
 def get_country_iso_name(country_code):
     """Return country ISO name."""
     country_code = country_code.upper()
+    pycountry = _get_pycountry()
     try:
         if len(country_code) == 2:
             country = pycountry.countries.get(alpha_2=country_code)
@@ -607,6 +623,7 @@ def get_country_iso_name(country_code):
 
 def get_language_iso_name(language_code):
     """Return language ISO name."""
+    pycountry = _get_pycountry()
     try:
         if len(language_code) == 2:
             language = pycountry.languages.get(alpha_2=language_code)
@@ -641,7 +658,7 @@ def get_language_iso_fullname(language_code):
     return get_language_iso_name(language_code)
 
 
-dialect_name_re = re.compile(r"(.+)\s\(([^)\d]{,25})\)$")
+dialect_name_re = lazyre.compile(r"(.+)\s\(([^)\d]{,25})\)$")
 # The limit of 25 characters on the country name is so that "Interlingua (...)"
 # (see above) is correctly interpreted.
 
@@ -706,6 +723,7 @@ def gettext_lang(langcode=None):
     """Returns a gettext function to translate language names into the given
     language, or the system language if no language is specified.
     """
+    pycountry = _get_pycountry()
     if pycountry is None:
         return gettext_domain(langcode, 'iso_639')
     return gettext_domain(langcode, 'iso639-3', pycountry.LOCALES_DIR)
@@ -715,6 +733,7 @@ def gettext_country(langcode=None):
     """Returns a gettext function to translate country names into the given
     language, or the system language if no language is specified.
     """
+    pycountry = _get_pycountry()
     if pycountry is None:
         return gettext_domain(langcode, 'iso_3166')
     return gettext_domain(langcode, 'iso3166', pycountry.LOCALES_DIR)
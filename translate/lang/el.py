@@ -27,6 +27,7 @@ import re
 from collections import OrderedDict
 
 from translate.lang import common
+from translate.misc import lazyre
 
 
 class el(common.Common):
@@ -35,7 +36,7 @@ class el(common.Common):
     # Greek uses ; as question mark and the middot instead
     sentenceend = ".!;…"
 
-    sentencere = re.compile(r"""
+    sentencere = lazyre.compile(r"""
         (?s)        # make . also match newlines
         .*?         # anything, but match non-greedy
         [%s]        # the puntuation for sentence ending
@@ -26,6 +26,7 @@
 import re
 
 from translate.lang import common
+from translate.misc import lazyre
 
 
 class hy(common.Common):
@@ -38,7 +39,7 @@ class hy(common.Common):
 
     sentenceend = "։՝՜…"
 
-    sentencere = re.compile(r"""
+    sentencere = lazyre.compile(r"""
         (?s)        # make . also match newlines
         .*?         # anything, but match non-greedy
         [%s]        # the puntuation for sentence ending
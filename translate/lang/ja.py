@@ -26,6 +26,7 @@
 import re
 
 from translate.lang import common
+from translate.misc import lazyre
 
 
 class ja(common.Common):
@@ -37,7 +38,7 @@ class ja(common.Common):
 
     # Compared to common.py, we make the space after the sentence ending
     # optional and don't demand an uppercase letter to follow.
-    sentencere = re.compile(r"""(?s)    #make . also match newlines
+    sentencere = lazyre.compile(r"""(?s)    #make . also match newlines
                             .*?         #any text, but match non-greedy
                             [%s]        #the puntuation for sentence ending
                             \s*         #the optional space after the puntuation
@@ -28,13 +28,14 @@
 
 import glob
 import io
-import re
 import sys
 from os import path
 
+from translate.misc import lazyre
+
 
 nb_ngrams = 400
-white_space_re = re.compile(r'\s+')
+white_space_re = lazyre.compile(r'\s+')
 
 
 class _NGram:
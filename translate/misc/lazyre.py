@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Regular expressions that are only compiled when they are first used.
+
+Compiling the regular expressions of a module at import time adds to the
+start up time of every tool importing it, even if the expressions are never
+used.  :func:`compile` takes the same arguments as :func:`re.compile` but
+returns a :class:`LazyPattern` that compiles the expression on first use::
+
+    tag_re = lazyre.compile("<[^>]+>")
+
+A :class:`LazyPattern` can only be used through its methods, pass
+:meth:`LazyPattern.compiled` to functions of the :mod:`re` module.
+"""
+
+import re
+
+
+class LazyPattern:
+    """A regular expression that is compiled when it is first used."""
+
+    _methods = ("match", "fullmatch", "search", "sub", "subn", "split",
+                "findall", "finditer", "scanner")
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled = None
+
+    def compiled(self):
+        """Returns the compiled :class:`re.Pattern`."""
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern, self.flags)
+            # Later calls go straight to the compiled pattern
+            for name in self._methods:
+                setattr(self, name, getattr(self._compiled, name))
+        return self._compiled
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.compiled(), name)
+
+    def __repr__(self):
+        return "lazyre.compile(%r)" % (self.pattern,)
+
+
+def compile(pattern, flags=0):
+    """Returns a :class:`LazyPattern` for the pattern, see :func:`re.compile`.
+    """
+    return LazyPattern(pattern, flags)
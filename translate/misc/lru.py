@@ -18,7 +18,7 @@
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
 import gc
-from collections import deque
+from collections import OrderedDict, deque
 from weakref import WeakValueDictionary
 
 
@@ -129,3 +129,39 @@ class LRUCachingDict(WeakValueDictionary):
             self[key] = default
 
         return self[key]
+
+
+class LRUDict(OrderedDict):
+    """Dictionary that holds at most maxsize items and discards the least
+    recently used item when a new item doesn't fit.
+
+    Unlike :class:`LRUCachingDict` the values are ordinary references, so
+    strings and other immutable results can be cached.  Lookups through
+    :meth:`lookup` update the hits and misses counters, all operations take
+    constant time.
+    """
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = max(1, maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key, default=None):
+        """Returns the value for key, marking it as recently used, or default
+        if the key is missing.
+        """
+        try:
+            value = OrderedDict.__getitem__(self, key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        OrderedDict.__setitem__(self, key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
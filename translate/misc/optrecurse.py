@@ -17,6 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <http://www.gnu.org/licenses/>.
 
+import copy
 import fnmatch
 import logging
 import optparse
@@ -115,9 +116,51 @@ class StdoutWrapper:
             self.out.write(content)
 
 
+#: The parser and options of a worker process of ``--jobs``
+_worker = None
+
+
+def _initworker(parser, options):
+    """Sets up a worker process of ``--jobs``."""
+    global _worker
+    parser.initworker(options)
+    _worker = (parser, options)
+
+
+def _processfiletask(filetask):
+    """Processes a file task in a worker process.
+
+    :return: Whether the file was processed, the warning message if not and
+             the stats of the worker, see
+             :meth:`RecursiveOptionParser.getworkerstats`.
+    """
+    parser, options = _worker
+    inputpath, fileprocessor, fullinputpath, fulloutputpath, \
+        fulltemplatepath = filetask
+    try:
+        success = parser.processfile(fileprocessor, options, fullinputpath,
+                                     fulloutputpath, fulltemplatepath)
+        message = None
+    except Exception:
+        success = False
+        message = parser.getwarningmessage(
+            "Error processing: input %s, output %s, template %s" %
+            (fullinputpath, fulloutputpath, fulltemplatepath), options,
+            sys.exc_info())
+    return success, message, parser.getworkerstats(options)
+
+
 class RecursiveOptionParser(optparse.OptionParser, object):
     """A specialized Option Parser for recursing through directories."""
 
+    #: Whether the parser offers ``--jobs``, parsers that collect the
+    #: results of all files in the main process turn it off
+    allowjobs = True
+
+    #: A list that receives (parser, options) tuples instead of processing
+    #: the files, used by :mod:`translate.convert.pipeline`
+    capture = None
+
     def __init__(self, formats, usetemplates=False, allowmissingtemplate=False,
                  description=None):
         """Construct the specialized Option Parser.
@@ -132,6 +175,8 @@ class RecursiveOptionParser(optparse.OptionParser, object):
         self.setmanpageoption()
         self.setprogressoptions()
         self.seterrorleveloptions()
+        if self.allowjobs:
+            self.setjobsoptions()
         self.setformats(formats, usetemplates)
         self.passthrough = []
         self.allowmissingtemplate = allowmissingtemplate
@@ -199,6 +244,13 @@ class RecursiveOptionParser(optparse.OptionParser, object):
 
     def warning(self, msg, options=None, exc_info=None):
         """Print a warning message incorporating 'msg' to stderr and exit."""
+        msg = self.getwarningmessage(msg, options, exc_info)
+        logging.getLogger(self.get_prog_name()).warning(msg)
+
+    def getwarningmessage(self, msg, options=None, exc_info=None):
+        """Returns the warning message with the error information that the
+        errorlevel option asks for.
+        """
         if options:
             if options.errorlevel == "traceback":
                 errorinfo = "\n".join(traceback.format_exception(exc_info[0],
@@ -211,7 +263,7 @@ class RecursiveOptionParser(optparse.OptionParser, object):
                 errorinfo = ""
             if errorinfo:
                 msg += ": " + errorinfo
-        logging.getLogger(self.get_prog_name()).warning(msg)
+        return msg
 
     def getusagestring(self, option):
         """returns the usage string for the given option"""
@@ -341,6 +393,13 @@ class RecursiveOptionParser(optparse.OptionParser, object):
                 ", ".join(self.errorleveltypes)))
         self.define_option(errorleveloption)
 
+    def setjobsoptions(self):
+        """Sets the option to process the files in several processes."""
+        jobsoption = optparse.Option(
+            "-j", "--jobs", dest="jobs", default=1, type="int",
+            metavar="JOBS", help="process files in JOBS processes")
+        self.define_option(jobsoption)
+
     def getformathelp(self, formats):
         """Make a nice help string for describing formats..."""
         formats = sorted([f for f in formats if f is not None])
@@ -480,7 +539,99 @@ class RecursiveOptionParser(optparse.OptionParser, object):
         self.recursiveprocess(options)
 
     def recursiveprocess(self, options):
-        """Recurse through directories and process files."""
+        """Recurse through directories and process files, in a pool of
+        ``--jobs`` processes if requested.
+        """
+        if self.capture is not None:
+            self.capture.append((self, options))
+            return
+        inpool = (getattr(options, "jobs", 1) > 1 and
+                  self.canprocessinpool(options))
+        inputfiles = self.getinputfiles(options)
+        progress_bar = ProgressBar(options.progress, inputfiles)
+        filetasks = self.iterfiletasks(options, inputfiles)
+        if inpool:
+            self.processinpool(options, filetasks, progress_bar)
+        else:
+            self.processfiletasks(options, filetasks, progress_bar)
+        del progress_bar
+
+    def processfiletasks(self, options, filetasks, progress_bar):
+        """Processes the file tasks one after the other."""
+        for filetask in filetasks:
+            success = self.processfiletask(options, filetask)
+            progress_bar.report_progress(filetask[0], success)
+
+    def canprocessinpool(self, options):
+        """Returns whether the files can be processed by worker processes,
+        reading from standard input and writing to standard output can't be
+        shared.
+        """
+        return options.input is not None and bool(options.output)
+
+    def openprocesspool(self, options):
+        """Returns a pool of ``--jobs`` processes that are set up with
+        :meth:`initworker`.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(options.jobs, initializer=_initworker,
+                                   initargs=(self,
+                                             self.getworkeroptions(options)))
+
+    def processinpool(self, options, filetasks, progress_bar):
+        """Processes the file tasks in a pool of ``--jobs`` processes.
+
+        All the tasks are listed first, which creates the output directories
+        before any worker writes to them.  Warnings and progress are reported
+        in the order of the files, as when processing them one by one.
+        """
+        filetasks = list(filetasks)
+        if len(filetasks) < 2:
+            return self.processfiletasks(options, filetasks, progress_bar)
+        with self.openprocesspool(options) as pool:
+            futures = [(filetask, pool.submit(_processfiletask, filetask))
+                       for filetask in filetasks]
+            for filetask, future in futures:
+                try:
+                    success, message, workerstats = future.result()
+                except Exception:
+                    # Tasks that can't be passed to a worker are done here
+                    success = self.processfiletask(options, filetask)
+                else:
+                    self.addworkerstats(options, workerstats)
+                    if message:
+                        self.warning(message)
+                progress_bar.report_progress(filetask[0], success)
+
+    def getworkeroptions(self, options):
+        """Returns the options that are passed to the worker processes.
+
+        A worker processes one file at a time, converters that use ``--jobs``
+        themselves get a single job there.
+        """
+        workeroptions = copy.copy(options)
+        workeroptions.jobs = 1
+        return workeroptions
+
+    def initworker(self, options):
+        """Sets up a worker process with the options of
+        :meth:`getworkeroptions`.
+        """
+        pass
+
+    def getworkerstats(self, options):
+        """Returns what a worker process collected while processing a file,
+        for :meth:`addworkerstats` in the main process.
+        """
+        return None
+
+    def addworkerstats(self, options, stats):
+        """Adds the result of :meth:`getworkerstats` of a worker process."""
+        pass
+
+    def getinputfiles(self, options):
+        """Returns the input files to process, relative to ``options.input``.
+        """
         if self.isrecursive(options.input, 'input') and getattr(options, "allowrecursiveinput", True):
             if not self.isrecursive(options.output, 'output'):
                 if not options.output:
@@ -505,7 +656,13 @@ class RecursiveOptionParser(optparse.OptionParser, object):
         options.recursivetemplate = (self.usetemplates and
                                      self.isrecursive(options.template, 'template') and
                                      getattr(options, "allowrecursivetemplate", True))
-        progress_bar = ProgressBar(options.progress, inputfiles)
+        return inputfiles
+
+    def iterfiletasks(self, options, inputfiles):
+        """Iterator over (inputpath, fileprocessor, fullinputpath,
+        fulloutputpath, fulltemplatepath) tuples for the input files that can
+        be processed.
+        """
         for inputpath in inputfiles:
             try:
                 templatepath = self.gettemplatename(options, inputpath)
@@ -528,17 +685,23 @@ class RecursiveOptionParser(optparse.OptionParser, object):
                 self.warning("Couldn't handle input file %s" %
                              inputpath, options, sys.exc_info())
                 continue
-            try:
-                success = self.processfile(fileprocessor, options,
-                                           fullinputpath, fulloutputpath,
-                                           fulltemplatepath)
-            except Exception:
-                self.warning("Error processing: input %s, output %s, template %s" %
-                             (fullinputpath, fulloutputpath,
-                              fulltemplatepath), options, sys.exc_info())
-                success = False
-            progress_bar.report_progress(inputpath, success)
-        del progress_bar
+            yield (inputpath, fileprocessor, fullinputpath, fulloutputpath,
+                   fulltemplatepath)
+
+    def processfiletask(self, options, filetask):
+        """Processes a file task from :meth:`iterfiletasks`, returns whether it
+        was successful.
+        """
+        inputpath, fileprocessor, fullinputpath, fulloutputpath, \
+            fulltemplatepath = filetask
+        try:
+            return self.processfile(fileprocessor, options, fullinputpath,
+                                    fulloutputpath, fulltemplatepath)
+        except Exception:
+            self.warning("Error processing: input %s, output %s, template %s" %
+                         (fullinputpath, fulloutputpath,
+                          fulltemplatepath), options, sys.exc_info())
+            return False
 
     def openinputfile(self, options, fullinputpath):
         """Opens the input file."""
@@ -592,6 +755,8 @@ class RecursiveOptionParser(optparse.OptionParser, object):
                 self.warning("writing to temporary output...")
                 self.finalizetempoutputfile(options, outputfile,
                                             fulloutputpath)
+            elif fulloutputpath:
+                outputfile.close()
             return True
         else:
             # remove the file if it is a file (could be stdout etc)
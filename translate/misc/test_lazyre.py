@@ -0,0 +1,23 @@
+import re
+
+from translate.misc import lazyre
+
+
+def test_compiled_on_first_use():
+    pattern = lazyre.compile(r"<(\w+)>", re.IGNORECASE)
+    assert pattern._compiled is None
+    assert pattern.pattern == r"<(\w+)>"
+    assert pattern.flags == re.IGNORECASE
+    assert pattern._compiled is None
+    assert pattern.findall("<a> and <B>") == ["a", "B"]
+    assert pattern.compiled() is re.compile(r"<(\w+)>", re.IGNORECASE)
+
+
+def test_methods():
+    pattern = lazyre.compile(r"\s+")
+    assert pattern.split("a  b c") == ["a", "b", "c"]
+    assert pattern.sub(" ", "a  b") == "a b"
+    assert pattern.match(" a").end() == 1
+    assert pattern.search("a b").start() == 1
+    assert [m.start() for m in pattern.finditer("a b c")] == [1, 3]
+    assert pattern.groups == 0
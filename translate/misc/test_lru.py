@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+from translate.misc import lru
+
+
+def test_lrudict():
+    cache = lru.LRUDict(2)
+    cache["a"] = "A"
+    cache["b"] = "B"
+    assert cache.lookup("a") == "A"
+    cache["c"] = "C"
+    # b was used least recently
+    assert list(cache) == ["a", "c"]
+    assert cache.lookup("b") is None
+    assert cache.lookup("b", "missing") == "missing"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_lrudict_update():
+    cache = lru.LRUDict(2)
+    cache["a"] = "A"
+    cache["b"] = "B"
+    cache["a"] = "AA"
+    cache["c"] = "C"
+    assert dict(cache) == {"a": "AA", "c": "C"}
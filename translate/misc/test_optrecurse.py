@@ -4,6 +4,15 @@ from tempfile import NamedTemporaryFile
 from translate.misc import optrecurse
 
 
+def _upper(inputfile, outputfile, templatefile):
+    """Converts a txt file to upper case, fails on empty files."""
+    content = inputfile.read()
+    if not content:
+        return False
+    outputfile.write(content.upper())
+    return True
+
+
 class TestRecursiveOptionParser:
 
     def test_splitext(self):
@@ -32,3 +41,28 @@ class TestRecursiveOptionParser:
 
         out = parser.openoutputfile(None, None)  # To sys.stdout
         out.write(b'binary suff')
+
+    def test_jobs(self, tmpdir):
+        """files are processed the same in several processes"""
+        inputdir = tmpdir.mkdir("input")
+        inputdir.join("a.txt").write("first")
+        inputdir.mkdir("sub").join("b.txt").write("second")
+        inputdir.join("empty.txt").write("")
+        for jobs in ("1", "2"):
+            outputdir = tmpdir.join("output" + jobs)
+            parser = optrecurse.RecursiveOptionParser(
+                {"txt": ("txt", _upper)})
+            options, args = parser.parse_args(
+                ["--progress=none", "--jobs=" + jobs,
+                 str(inputdir), str(outputdir)])
+            assert options.jobs == int(jobs)
+            parser.recursiveprocess(options)
+            assert outputdir.join("a.txt").read() == "FIRST"
+            assert outputdir.join("sub", "b.txt").read() == "SECOND"
+            assert not outputdir.join("empty.txt").exists()
+
+    def test_jobs_stdout(self):
+        """output to stdout is not shared by processes"""
+        parser = optrecurse.RecursiveOptionParser({"txt": ("txt", _upper)})
+        options, args = parser.parse_args(["--jobs=2", "input.txt"])
+        assert not parser.canprocessinpool(options)
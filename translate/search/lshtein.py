@@ -69,13 +69,22 @@ def native_distance(a, b, stopvalue=0):
     return Levenshtein.distance(a, b)
 
 
-try:
-    import Levenshtein as Levenshtein
-    distance = native_distance
-except ImportError:
-    import logging
-    logging.warning("Python-Levenshtein not found. Continuing with built-in (slower) fuzzy matching.")
-    distance = python_distance
+def distance(a, b, stopvalue=-1):
+    """Calculates the distance for use in similarity calculation.
+
+    python-Levenshtein is slow to import, so the implementation is chosen on
+    the first call, which replaces this function with native_distance or
+    python_distance.
+    """
+    global distance, Levenshtein
+    try:
+        import Levenshtein as Levenshtein
+        distance = native_distance
+    except ImportError:
+        import logging
+        logging.warning("Python-Levenshtein not found. Continuing with built-in (slower) fuzzy matching.")
+        distance = python_distance
+    return distance(a, b, stopvalue)
 
 
 class LevenshteinComparer:
@@ -29,6 +29,9 @@ from translate.misc.multistring import multistring
 from translate.storage.placeables import StringElem, parse as rich_parse
 from translate.storage.workflow import StateEnum as states
 
+
+logger = logging.getLogger(__name__)
+
 # Simple BOM based encoding detection
 ENCODING_BOMS = (
     (codecs.BOM_UTF8, 'utf-8-sig'),
@@ -181,6 +184,7 @@ class TranslationUnit:
         """Set the source string to the given value."""
         self._rich_source = None
         self._source = source
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -244,6 +248,13 @@ class TranslationUnit:
         self._rich_target = list(value)
         self.target = self.rich_to_multistring(value)
 
+    def _reindex(self):
+        """Updates the indexes of the store after the source of this unit
+        changed.
+        """
+        if self._store is not None:
+            self._store.reindex_unit(self)
+
     def gettargetlen(self):
         """Returns the length of the target string.
 
@@ -504,6 +515,58 @@ class TranslationUnit:
         pass
 
 
+def _sourcekeys(unit):
+    if unit.hasplural():
+        return unit.source.strings
+    return [unit.source]
+
+
+def _locationkeys(unit):
+    return unit.getlocations()
+
+
+def _idkeys(unit):
+    return [unit.getid()]
+
+
+class _UnitIndex(dict):
+    """A dictionary of units that remembers the keys each unit was indexed
+    with, so that a unit can be removed or reindexed after it changed.
+    """
+
+    def __init__(self, getkeys, multiple=False, keepfirst=False):
+        super().__init__()
+        self.getkeys = getkeys
+        # values are lists of all units with the key
+        self.multiple = multiple
+        # if keys are not unique, keep the first unit rather than the last
+        self.keepfirst = keepfirst
+        self.unitkeys = {}
+
+    def add(self, unit):
+        keys = self.getkeys(unit)
+        self.unitkeys[id(unit)] = keys
+        for key in keys:
+            if self.multiple:
+                self.setdefault(key, []).append(unit)
+            elif not (self.keepfirst and key in self):
+                self[key] = unit
+
+    def discard(self, unit):
+        keys = self.unitkeys.pop(id(unit), ())
+        for key in keys:
+            if self.multiple:
+                units = self.get(key, [])
+                for i, indexed in enumerate(units):
+                    if indexed is unit:
+                        del units[i]
+                        break
+                if not units:
+                    self.pop(key, None)
+            elif self.get(key) is unit:
+                del self[key]
+
+
 class TranslationStore:
     """Base class for stores for multiple translation units of type UnitClass.
     """
@@ -526,6 +589,19 @@ class TranslationStore:
     sourcelanguage = None
     targetlanguage = None
 
+    linear_scans = 0
+    """The number of times the indexes had to be rebuilt from all units because
+    :attr:`units` was changed without :meth:`addunit` or :meth:`removeunit`.
+    Useful to track down accidental quadratic behaviour."""
+    _indextypes = {
+        "sourceindex": (_sourcekeys, True, False),
+        "locationindex": (_locationkeys, False, True),
+        "id_index": (_idkeys, False, False),
+    }
+    _indexes = None
+    _indexedunits = None
+    _indexedcount = 0
+
     def __init__(self, unitclass=None, encoding=None):
         """Construct a blank TranslationStore."""
         self.units = []
@@ -591,7 +667,31 @@ class TranslationStore:
         :param unit: The unit that will be added.
         """
         unit._store = self
+        indexes = self._getindexes()
         self.units.append(unit)
+        self._indexedcount += 1
+        if indexes:
+            self.add_unit_to_index(unit)
+
+    def removeunit(self, unit):
+        """Remove the given unit from the object's list of units.
+
+        This method should always be used rather than trying to modify the
+        list manually.
+
+        :type unit: :class:`TranslationUnit`
+        :param unit: The unit that will be removed.
+        """
+        indexes = self._getindexes()
+        for i, storeunit in enumerate(self.units):
+            if storeunit is unit:
+                del self.units[i]
+                break
+        else:
+            raise ValueError("unit is not in this store")
+        self._indexedcount -= 1
+        if indexes:
+            self.remove_unit_from_index(unit)
 
     def addsourceunit(self, source):
         """Add and returns a new unit with the given source string.
@@ -604,7 +704,6 @@ class TranslationStore:
 
     def findid(self, id):
         """find unit with matching id by checking id_index"""
-        self.require_index()
         return self.id_index.get(id, None)
 
     def findunit(self, source):
@@ -612,13 +711,9 @@ class TranslationStore:
 
         :rtype: :class:`TranslationUnit` or None
         """
-        if len(getattr(self, "sourceindex", [])):
-            if source in self.sourceindex:
-                return self.sourceindex[source][0]
-        else:
-            for unit in self.units:
-                if unit.source == source:
-                    return unit
+        units = self.sourceindex.get(source)
+        if units:
+            return units[0]
         return None
 
     def findunits(self, source):
@@ -626,18 +721,7 @@ class TranslationStore:
 
         :rtype: :class:`TranslationUnit` or None
         """
-        if len(getattr(self, "sourceindex", [])):
-            if source in self.sourceindex:
-                return self.sourceindex[source]
-        else:
-            #FIXME: maybe we should generate index here instead since
-            #we'll scan all units anyway
-            result = []
-            for unit in self.units:
-                if unit.source == source:
-                    result.append(unit)
-            return result
-        return None
+        return self.sourceindex.get(source)
 
     def translate(self, source):
         """Return the translated string for a given source string.
@@ -650,79 +734,122 @@ class TranslationStore:
         else:
             return None
 
-    def remove_unit_from_index(self, unit):
-        """Remove a unit from source and locaton indexes"""
+    def _getindexes(self):
+        """Returns the indexes built so far.
 
-        def remove_unit(source):
-            if source in self.sourceindex:
-                try:
-                    self.sourceindex[source].remove(unit)
-                    if len(self.sourceindex[source]) == 0:
-                        del(self.sourceindex[source])
-                except ValueError:
-                    pass
-
-        if unit.hasplural():
-            for source in unit.source.strings:
-                remove_unit(source)
-        else:
-            remove_unit(unit.source)
+        The indexes are dropped when :attr:`units` was changed directly, they
+        will then be rebuilt from all units when used again.
+        """
+        if self._indexes and (self._indexedunits is not self.units or
+                              self._indexedcount != len(self.units)):
+            self.linear_scans += 1
+            logger.debug("units of %r changed outside of the store, "
+                         "rebuilding indexes", self)
+            self._indexes = {}
+        if not self._indexes:
+            self._indexes = {}
+            self._indexedunits = self.units
+            self._indexedcount = len(self.units)
+        return self._indexes
+
+    def _getindex(self, name):
+        """Returns the named index, building it on first use."""
+        indexes = self._getindexes()
+        index = indexes.get(name)
+        if index is None:
+            index = indexes[name] = _UnitIndex(*self._indextypes[name])
+            for unit in self.units:
+                if self._isindexed(unit):
+                    index.add(unit)
+        return index
 
-        for location in unit.getlocations():
-            if (location in self.locationindex and
-                self.locationindex[location] is not None and
-                self.locationindex[location] == unit):
-                del(self.locationindex[location])
+    def _isindexed(self, unit):
+        """Whether the given unit is included in the indexes."""
+        return not (unit.isheader() or unit.isblank())
 
-    def add_unit_to_index(self, unit):
-        """Add a unit to source and location idexes"""
-        self.id_index[unit.getid()] = unit
+    @property
+    def sourceindex(self):
+        """Dictionary of lists of units keyed on source strings."""
+        return self._getindex("sourceindex")
+
+    @sourceindex.setter
+    def sourceindex(self, value):
+        self._getindexes()["sourceindex"] = value
+
+    @property
+    def locationindex(self):
+        """Dictionary of units keyed on location, the first unit is kept for
+        duplicate locations.
+        """
+        return self._getindex("locationindex")
+
+    @locationindex.setter
+    def locationindex(self, value):
+        self._getindexes()["locationindex"] = value
+
+    @property
+    def id_index(self):
+        """Dictionary of units keyed on unit id."""
+        return self._getindex("id_index")
 
-        def insert_unit(source):
-            if source not in self.sourceindex:
-                self.sourceindex[source] = [unit]
+    @id_index.setter
+    def id_index(self, value):
+        self._getindexes()["id_index"] = value
+
+    def remove_unit_from_index(self, unit):
+        """Remove a unit from source and locaton indexes"""
+        indexes = self._getindexes()
+        for name, index in list(indexes.items()):
+            if isinstance(index, _UnitIndex):
+                index.discard(unit)
             else:
-                self.sourceindex[source].append(unit)
+                # indexes assigned from outside can't be maintained
+                del indexes[name]
 
-        if unit.hasplural():
-            for source in unit.source.strings:
-                insert_unit(source)
-        else:
-            insert_unit(unit.source)
+    def add_unit_to_index(self, unit):
+        """Add a unit to source and location idexes"""
+        if not self._isindexed(unit):
+            return
+        indexes = self._getindexes()
+        for name, index in list(indexes.items()):
+            if isinstance(index, _UnitIndex):
+                index.add(unit)
+            else:
+                del indexes[name]
 
-        for location in unit.getlocations():
-            # If locations aren't unique, keep the first unit.
-            if location not in self.locationindex:
-                #FIXME: maybe better store a list of units like sourceindex in
-                # case there are several units with the same location.
-                self.locationindex[location] = unit
+    def reindex_unit(self, unit):
+        """Update the indexes after the source of a unit changed."""
+        if self._indexes:
+            self.remove_unit_from_index(unit)
+            self.add_unit_to_index(unit)
 
     def makeindex(self):
         """Indexes the items in this store. At least .sourceindex should be
         useful.
+
+        The indexes are built on first use and kept up to date by
+        :meth:`addunit` and :meth:`removeunit`, so this drops any built
+        indexes to be rebuilt when used again.
         """
-        self.locationindex = {}
-        self.sourceindex = {}
-        self.id_index = {}
         for index, unit in enumerate(self.units):
             unit.index = index
-            if not (unit.isheader() or unit.isblank()):
-                self.add_unit_to_index(unit)
+        self._indexes = None
 
     def require_index(self):
         """make sure source index exists"""
-        if not hasattr(self, "id_index"):
-            self.makeindex()
+        self._getindex("sourceindex")
 
     def getids(self, filename=None):
         """return a list of unit ids"""
-        self.require_index()
         return self.id_index.keys()
 
     def __getstate__(self):
         odict = self.__dict__.copy()
         # fileobj is generally not picklable
         odict['fileobj'] = None
+        # indexes are rebuilt when needed
+        odict.pop('_indexes', None)
+        odict.pop('_indexedunits', None)
         return odict
 
     def __bytes__(self):
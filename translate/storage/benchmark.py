@@ -23,7 +23,16 @@ import pstats
 import random
 import sys
 
-from translate.storage import factory, placeables
+from translate.lang.common import Common
+from translate.storage import factory, placeables, statsdb
+
+
+def reference_wordcount(string):
+    """counts words like statsdb.wordcount did before its fast paths"""
+    string = statsdb.brtagre.sub("\n", string)
+    string = statsdb.xmltagre.sub("", string)
+    string = statsdb.numberre.sub(" ", string)
+    return len(Common.words(string))
 
 
 class TranslateBenchmarker:
@@ -82,7 +91,7 @@ class TranslateBenchmarker:
         for dirpath, subdirs, filenames in os.walk(file_dir, topdown=False):
             for name in filenames:
                 pofilename = os.path.join(dirpath, name)
-                parsedfile = self.StoreClass(open(pofilename, 'r'))
+                parsedfile = self.StoreClass(open(pofilename, 'rb'))
                 count += len(parsedfile.units)
                 self.parsedfiles.append(parsedfile)
         print("counted %d units" % count)
@@ -97,6 +106,21 @@ class TranslateBenchmarker:
             count += len(parsedfile.units)
         print("counted %d units" % count)
 
+    def count_words(self):
+        """counts the words of all units, and checks that the counts match
+        the reference implementation
+        """
+        strings = []
+        for parsedfile in self.parsedfiles:
+            for unit in parsedfile.units:
+                for string in (unit.source, unit.target):
+                    strings.extend(getattr(string, "strings", [string or ""]))
+        counts = statsdb.wordcounts(strings)
+        mismatches = [string for string, count in zip(strings, counts)
+                      if count != reference_wordcount(string)]
+        print("counted %d words in %d strings, %d differ from the reference" %
+              (sum(counts), len(strings), len(mismatches)))
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Process some integers.')
@@ -111,12 +135,15 @@ if __name__ == "__main__":
     parser.add_argument('--check-placeables', dest='check_placeables',
                         action='store_true',
                         help='benchmark placeables')
+    parser.add_argument('--check-wordcount', dest='check_wordcount',
+                        action='store_true',
+                        help='benchmark and verify word counting')
     args = parser.parse_args()
 
     storetype = args.storetype
 
-    if storetype in factory.classes_str:
-        _module, _class = factory.classes_str[storetype]
+    if storetype in factory._classes_str:
+        _module, _class = factory._classes_str[storetype]
         module = __import__("translate.storage.%s" % _module,
                             globals(), fromlist=_module)
         storeclass = getattr(module, _class)
@@ -152,6 +179,9 @@ if __name__ == "__main__":
         if args.check_placeables:
             methods.append(("parse_placeables", ""))
 
+        if args.check_wordcount:
+            methods.append(("count_words", ""))
+
         for methodname, methodparam in methods:
             print("_______________________________________________________")
             statsfile = "%s_%s" % (methodname, storetype) + '_%d_%d_%d_%d_%d.stats' % sample_file_sizes
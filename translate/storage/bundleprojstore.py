@@ -20,10 +20,13 @@
 import os
 import shutil
 import tempfile
+import warnings
+import zlib
 from zipfile import ZipFile
 
 
 from translate.storage.projstore import *
+from translate.storage.zip import copymembers, livemembers
 
 
 __all__ = ('BundleProjectStore', 'InvalidBundleError')
@@ -34,12 +37,24 @@ class InvalidBundleError(Exception):
 
 
 class BundleProjectStore(ProjectStore):
-    """Represents a translate project bundle (zip archive)."""
+    """Represents a translate project bundle (zip archive).
+
+    Changed files are appended to the archive, the last member with a name
+    is the current one.  Removed files are only hidden until the archive is
+    compacted, which happens when the bundle is closed, or when more than
+    ``compactratio`` of the archive is taken by replaced or removed files.
+    """
+
+    #: The part of the archive that replaced and removed files may take
+    #: before it is compacted
+    compactratio = 0.5
 
     # INITIALIZERS #
     def __init__(self, fname):
         super().__init__()
         self._tempfiles = {}
+        #: Files that were removed from the archive until it is compacted
+        self._removed = set()
         if fname and os.path.isfile(fname):
             self.load(fname)
         else:
@@ -78,9 +93,9 @@ class BundleProjectStore(ProjectStore):
         .. note:: For this implementation, the appended file will be deleted
                   from disk if ``delete_orig`` is ``True``.
         """
-        if fname and fname in self.zip.namelist():
+        if fname and fname in self._zipnames():
             raise ValueError("File already in bundle archive: %s" % (fname))
-        if not fname and isinstance(afile, str) and afile in self.zip.namelist():
+        if not fname and isinstance(afile, str) and afile in self._zipnames():
             raise ValueError("File already in bundle archive: %s" % (afile))
 
         afile, fname = super().append_file(afile, fname, ftype)
@@ -98,18 +113,13 @@ class BundleProjectStore(ProjectStore):
         """Remove the file with the given project name from the project."""
         super().remove_file(fname, ftype)
         self._zip_delete([fname])
-        tempfiles = [tmpf for tmpf, prjf in self._tempfiles.items() if prjf == fname]
-        if tempfiles:
-            for tmpf in tempfiles:
-                try:
-                    os.unlink(tmpf)
-                except Exception:
-                    pass
-                del self._tempfiles[tmpf]
+        self._remove_tempfiles(fname)
 
     def close(self):
         super().close()
         self.cleanup()
+        if self._removed:
+            self.compact()
         self.zip.close()
 
     def cleanup(self):
@@ -124,7 +134,7 @@ class BundleProjectStore(ProjectStore):
         the project archive.
         """
         retfile = None
-        if fname in self._files or fname in self.zip.namelist():
+        if fname in self._files or fname in self._zipnames():
             # Check if the file has not already been extracted to a temp file
             tempfname = [tfn for tfn in self._tempfiles if self._tempfiles[tfn] == fname]
             if tempfname and os.path.isfile(tempfname[0]):
@@ -137,8 +147,9 @@ class BundleProjectStore(ProjectStore):
                 tempfname = os.path.split(fname)[-1]
                 tempfd, tempfname = tempfile.mkstemp(suffix='_' + tempfname)
                 os.close(tempfd)
-                open(tempfname, 'w').write(zfile.read())
-            retfile = open(tempfname)
+                with open(tempfname, 'wb') as tempfile_:
+                    shutil.copyfileobj(zfile, tempfile_)
+            retfile = open(tempfname, 'rb')
             self._tempfiles[tempfname] = fname
 
         if not retfile:
@@ -174,27 +185,24 @@ class BundleProjectStore(ProjectStore):
                     self._files[fname] = None
 
     def save(self, filename=None):
-        """Save all project files to the bundle zip file."""
+        """Save all project files to the bundle zip file.
+
+        Only changed files are appended to the bundle.  If ``filename`` is
+        given, a compacted copy of the bundle is written to it, and the bundle
+        continues with that file.
+        """
         self._update_from_tempfiles()
+        self._zip_write('project.xtp', self._generate_settings())
 
         if filename:
             newzip = ZipFile(filename, 'w')
+            copymembers(self.zip, newzip, exclude=self._removed)
+            newzip.close()
+            self.zip.close()
+            self.zip = ZipFile(filename, mode='a')
+            self._removed = set()
         else:
-            newzip = self._create_temp_zipfile()
-
-        # Write project file for the new zip bundle
-        newzip.writestr('project.xtp', self._generate_settings())
-        # Copy project files from project to the new zip file
-        project_files = self._sourcefiles + self._transfiles + self._targetfiles
-        for fname in project_files:
-            newzip.writestr(fname, self.get_file(fname).read())
-        # Copy any extra (non-project) files from the current zip
-        for fname in self.zip.namelist():
-            if fname in project_files or fname == 'project.xtp':
-                continue
-            newzip.writestr(fname, self.zip.read(fname))
-
-        self._replace_project_zip(newzip)
+            self._compactifwasteful()
 
     def update_file(self, pfname, infile):
         """Updates the file with the given project file name with the contents
@@ -205,15 +213,16 @@ class BundleProjectStore(ProjectStore):
         if pfname not in self._files:
             raise FileNotInProjectError(pfname)
 
-        if pfname not in self.zip.namelist():
+        if pfname not in self._zipnames():
             return super().update_file(pfname, infile)
 
-        self._zip_delete([pfname])
         self._zip_add(pfname, infile)
+        # The extracted file has the previous contents
+        self._remove_tempfiles(pfname)
 
     def _load_settings(self):
         """Grab the project.xtp file from the zip file and load it."""
-        if 'project.xtp' not in self.zip.namelist():
+        if 'project.xtp' not in self._zipnames():
             raise InvalidBundleError('Not a translate project bundle')
         super()._load_settings(self.zip.open('project.xtp').read())
 
@@ -235,44 +244,91 @@ class BundleProjectStore(ProjectStore):
         shutil.move(zfile.filename, self.zip.filename)
         self.zip = ZipFile(self.zip.filename, mode='a')
 
+    def _zipnames(self):
+        """Returns the names of the files in the zip file."""
+        return set(self.zip.namelist()).difference(self._removed)
+
+    def compact(self):
+        """Rewrite the zip file without the replaced and removed files."""
+        newzip = self._create_temp_zipfile()
+        copymembers(self.zip, newzip, exclude=self._removed)
+        self._replace_project_zip(newzip)
+        self._removed = set()
+
+    def _wastedsize(self):
+        """Returns the compressed size of the replaced and removed files, and
+        of all the files in the zip file.
+        """
+        infos = self.zip.infolist()
+        total = sum(info.compress_size for info in infos)
+        live = sum(info.compress_size for info in livemembers(self.zip)
+                   if info.filename not in self._removed)
+        return total - live, total
+
+    def _compactifwasteful(self):
+        wasted, total = self._wastedsize()
+        if wasted and wasted > self.compactratio * total:
+            self.compact()
+
     def _update_from_tempfiles(self):
         """Update project files from temporary files."""
-        for tempfname in self._tempfiles:
-            tmp = open(tempfname)
-            self.update_file(self._tempfiles[tempfname], tmp)
-            if not tmp.closed:
-                tmp.close()
+        for tempfname, pfname in self._tempfiles.items():
+            with open(tempfname, 'rb') as tmp:
+                self._zip_add(pfname, tmp)
+
+    def _remove_tempfiles(self, pfname):
+        """Remove the temporary files extracted for the given project file."""
+        tempfiles = [tmpf for tmpf, prjf in self._tempfiles.items() if prjf == pfname]
+        for tmpf in tempfiles:
+            try:
+                os.unlink(tmpf)
+            except Exception:
+                pass
+            del self._tempfiles[tmpf]
+
+    def _zip_write(self, pfname, data):
+        """Append ``data`` to the zip with file name ``pfname``, unless the
+        current file with that name has the same content.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if pfname in self._zipnames():
+            info = self.zip.getinfo(pfname)
+            if info.file_size == len(data) and info.CRC == zlib.crc32(data):
+                return
+        self._removed.discard(pfname)
+        with warnings.catch_warnings():
+            # The new file replaces the previous one with the same name
+            warnings.filterwarnings("ignore", "Duplicate name",
+                                    category=UserWarning)
+            self.zip.writestr(pfname, data)
 
     def _zip_add(self, pfname, infile):
         """Add the contents of ``infile`` to the zip with file name ``pfname``."""
         if hasattr(infile, 'seek'):
             infile.seek(0)
-        self.zip.writestr(pfname, infile.read())
+        self._zip_write(pfname, infile.read())
         # Clear the cached file object to force the file to be read from the
         # zip file.
         self._files[pfname] = None
+        self._compactifwasteful()
 
     def _zip_delete(self, fnames):
-        """Delete the files with the given names from the zip file (``self.zip``)."""
+        """Delete the files with the given names from the zip file
+        (``self.zip``).
+
+        The files are hidden until the zip file is compacted.
+        """
         # Sanity checking
         if not isinstance(fnames, (list, tuple)):
             raise ValueError("fnames must be list or tuple: %s" % (fnames))
         if not self.zip:
             raise ValueError("No zip file to work on")
-        zippedfiles = self.zip.namelist()
+        zippedfiles = self._zipnames()
         for fn in fnames:
             if fn not in zippedfiles:
                 raise KeyError("File not in zip archive: %s" % (fn))
 
-        newzip = self._create_temp_zipfile()
-        newzip.writestr('project.xtp', self._generate_settings())
-
-        for fname in zippedfiles:
-            # Copy all files from self.zip that are not project.xtp (already
-            # in the new zip file) or in fnames (they are to be removed, after
-            # all.
-            if fname in fnames or fname == 'project.xtp':
-                continue
-            newzip.writestr(fname, self.zip.read(fname))
-
-        self._replace_project_zip(newzip)
+        self._removed.update(fnames)
+        self._zip_write('project.xtp', self._generate_settings())
+        self._compactifwasteful()
@@ -185,6 +185,7 @@ class CatkeysUnit(base.TranslationUnit):
     def source(self, source):
         self._rich_source = None
         self._set_source_or_target('source', source)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
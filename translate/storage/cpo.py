@@ -378,6 +378,7 @@ class pounit(pocommon.pounit):
         else:
             gpo.po_message_set_msgid(self._gpo_message, gpo_encode(source))
             gpo.po_message_set_msgid_plural(self._gpo_message, None)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -24,17 +24,39 @@
 
 #TODO: consider also providing directories as we currently provide files
 
+import fnmatch
 import os
+from collections import OrderedDict
 
 from translate.storage import factory
 
 
+def _parsefile(filename):
+    """Parses a file in a worker process of :meth:`Directory.unit_iter`."""
+    return factory.getobject(filename)
+
+
 class Directory:
-    """This class represents a directory."""
+    """This class represents a directory.
+
+    Only files matching one of the ``includes`` glob patterns and none of the
+    ``excludes`` patterns are used, excluded directories are not scanned.  The
+    patterns are matched against the base name of the file or directory.
 
-    def __init__(self, dir=None):
+    With ``jobs`` greater than one, files are parsed in a pool of that many
+    processes.  Up to ``cachesize`` parsed stores are kept, a store is parsed
+    again when its file changed.
+    """
+
+    def __init__(self, dir=None, includes=None, excludes=None, jobs=1,
+                 cachesize=100):
         self.dir = dir
         self.filedata = []
+        self.includes = includes or []
+        self.excludes = excludes or []
+        self.jobs = jobs
+        self.cachesize = cachesize
+        self._stores = OrderedDict()
 
     def file_iter(self):
         """Iterator over (dir, filename) for all files in this directory."""
@@ -49,11 +71,70 @@ class Directory:
         """
         return [filetuple for filetuple in self.file_iter()]
 
+    def _cachedstore(self, filename):
+        """Returns the cached store of the file if the file is unchanged."""
+        if filename not in self._stores:
+            return None
+        filestat = os.stat(filename)
+        key, store = self._stores[filename]
+        if key != (filestat.st_mtime_ns, filestat.st_size):
+            del self._stores[filename]
+            return None
+        self._stores.move_to_end(filename)
+        return store
+
+    def _cachestore(self, filename, store, filestat):
+        if self.cachesize <= 0:
+            return
+        self._stores[filename] = ((filestat.st_mtime_ns, filestat.st_size),
+                                  store)
+        self._stores.move_to_end(filename)
+        while len(self._stores) > self.cachesize:
+            self._stores.popitem(last=False)
+
+    def _parsefiles(self, filenames):
+        """Iterator over the parsed stores of the files, in the given order."""
+        filestats = [os.stat(filename) for filename in filenames]
+        if self.jobs > 1 and len(filenames) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(min(self.jobs, len(filenames))) as pool:
+                futures = [pool.submit(_parsefile, filename)
+                           for filename in filenames]
+                for filename, filestat, future in zip(filenames, filestats,
+                                                      futures):
+                    try:
+                        store = future.result()
+                    except Exception:
+                        # Some stores can't be passed between processes,
+                        # parsing in this process also reports parse errors
+                        store = factory.getobject(filename)
+                    self._cachestore(filename, store, filestat)
+                    yield store
+        else:
+            for filename, filestat in zip(filenames, filestats):
+                store = factory.getobject(filename)
+                self._cachestore(filename, store, filestat)
+                yield store
+
+    def store_iter(self):
+        """Iterator over the stores of all the files in this directory, in the
+        order of :meth:`file_iter`.
+        """
+        filenames = [os.path.join(dirname, filename)
+                     for dirname, filename in self.file_iter()]
+        stores = dict((filename, self._cachedstore(filename))
+                      for filename in filenames)
+        parsed = self._parsefiles([filename for filename in filenames
+                                   if stores[filename] is None])
+        for filename in filenames:
+            store = stores[filename]
+            if store is None:
+                store = next(parsed)
+            yield store
+
     def unit_iter(self):
         """Iterator over all the units in all the files in this directory."""
-        for dirname, filename in self.file_iter():
-            store = factory.getobject(os.path.join(dirname, filename))
-            #TODO: don't regenerate all the storage objects
+        for store in self.store_iter():
             for unit in store.unit_iter():
                 yield unit
 
@@ -61,12 +142,29 @@ class Directory:
         """List of all the units in all the files in this directory."""
         return [unit for unit in self.unit_iter()]
 
+    def _isexcluded(self, name):
+        return any(fnmatch.fnmatch(name, exclude) for exclude in self.excludes)
+
+    def _isincluded(self, name):
+        if not self.includes:
+            return True
+        return any(fnmatch.fnmatch(name, include) for include in self.includes)
+
     def scanfiles(self):
         """Populate the internal file data."""
         self.filedata = []
 
-        for dirpath, dirnames, filenames in os.walk(self.dir):
-            fnames = dirnames + filenames
-            for fname in fnames:
-                if os.path.isfile(os.path.join(dirpath, fname)):
-                    self.filedata.append((dirpath, fname))
+        dirstack = [self.dir]
+        while dirstack:
+            dirpath = dirstack.pop()
+            with os.scandir(dirpath) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+            subdirs = []
+            for entry in entries:
+                if self._isexcluded(entry.name):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file() and self._isincluded(entry.name):
+                    self.filedata.append((dirpath, entry.name))
+            dirstack.extend(reversed(subdirs))
@@ -86,10 +86,6 @@ Escaping in Android DTD
 import re
 import warnings
 from io import BytesIO
-try:
-    from lxml import etree
-except ImportError:
-    etree = None
 
 from translate.misc import quote
 from translate.misc.deprecation import deprecated
@@ -104,6 +100,94 @@ accesskeysuffixes = (".accesskey", ".accessKey", ".akey")
 ending in :attr:`.labelsuffixes` into accelerator notation"""
 
 
+paramentityref_re = re.compile(r"%.*;")
+"""Lines referencing a parameter entity, e.g. ``%brandDTD;``"""
+
+locnote_re = re.compile(r"LOCALIZATION NOTE *(FILE|BEGIN|END)?")
+"""Mozilla LOCALIZATION NOTE comments and their optional FILE, BEGIN or END
+marker"""
+
+entityname_re = re.compile(r"(\s*)(%\s*)?(\S*)(\s*)")
+"""The name of an entity after ``<!ENTITY``, with an optional ``%`` marking
+a parameter entity"""
+
+entityparameter_re = re.compile(r"\s*([^\W_]*)\s*")
+"""The parameter (e.g. ``SYSTEM``) of a parameter entity"""
+
+entityclose_re = re.compile(r"[\"']\s*>", re.ASCII)
+"""Lines closing a multiline entity definition"""
+
+_commenttypes = {
+    "FILE": "locfile",
+    "BEGIN": "locgroupstart",
+    "END": "locgroupend",
+}
+
+
+def _extractcomment(line, incomment=False):
+    """Extracts the ``<!-- -->`` comments from a line, returns a tuple of
+    (comments with delimiters, still in comment at end of line).
+
+    This gives the same result as
+    ``quote.extract(line, "<!--", "-->", None, incomment)``.
+    """
+    if incomment:
+        start = 0
+        searchfrom = 0
+    else:
+        start = line.find("<!--")
+        if start == -1:
+            return ("", False)
+        searchfrom = start + 2
+    comments = []
+    while True:
+        end = line.find("-->", searchfrom)
+        if end == -1:
+            comments.append(line[start:])
+            return ("".join(comments), True)
+        end += len("-->")
+        comments.append(line[start:end])
+        start = line.find("<!--", end)
+        if start == -1:
+            return ("".join(comments), False)
+        searchfrom = start + 2
+
+
+def _extractdefinition(source, quotechar, instring):
+    """Extracts a quoted entity definition, returns a tuple of (definition
+    with quotes, still in string at end).
+
+    This gives the same result as ``quote.extract(source, quotechar,
+    quotechar, startinstring=instring, allowreentry=False)``, including
+    reentering the string once when continuing a multiline definition.
+    """
+    if not instring:
+        # source starts with the opening quote
+        end = source.find(quotechar, 1)
+        if end == -1:
+            return (source, True)
+        return (source[:end+1], False)
+    end = source.find(quotechar)
+    if end == -1:
+        return (source, True)
+    extracted = source[:end+1]
+    start = source.find(quotechar, end + 1)
+    if start == -1 or start == end + 1:
+        return (extracted, False)
+    end = source.find(quotechar, start + 1)
+    if end == -1:
+        return (extracted + source[start:], True)
+    return (extracted + source[start:end+1], False)
+
+
+def _getcommenttype(comment):
+    """Works out the type of a comment from its LOCALIZATION NOTE marker."""
+    match = locnote_re.search(comment)
+    if match is None:
+        return "comment"
+    return _commenttypes.get(match.group(1), "locnote")
+
+
 def quoteforandroid(source):
     """Escapes a line for Android DTD files."""
     # Replace "'" character with the \u0027 escape. Other possible replaces are
@@ -259,6 +343,7 @@ class dtdunit(base.TranslationUnit):
         else:
             self.definition = quotefordtd(source)
         self._rich_source = None
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -317,58 +402,44 @@ class dtdunit(base.TranslationUnit):
 
     def parse(self, dtdsrc):
         """read the first dtd element from the source code into this object, return linesprocessed"""
+        lines = dtdsrc.split("\n") if dtdsrc else []
+        return self._parselines(lines, 0, len(lines))
+
+    def _parselines(self, lines, start, end):
+        """read the first dtd element from lines[start:end] into this object,
+        return linesprocessed
+
+        The lines are expected without their trailing newline, as produced by
+        splitting the whole DTD source once.
+        """
         self.comments = []
         # make all the lists the same
         self._locfilenotes = self.comments
         self._locgroupstarts = self.comments
         self._locgroupends = self.comments
         self._locnotes = self.comments
-        # self._locfilenotes = []
-        # self._locgroupstarts = []
-        # self._locgroupends = []
-        # self._locnotes = []
-        # self.comments = []
         self.entity = None
         self.definition = ''
-        if not dtdsrc:
+        if start >= end or (end - start == 1 and not lines[start]):
             return 0
-        lines = dtdsrc.split("\n")
         linesprocessed = 0
-        comment = ""
-        for line in lines:
-            line += "\n"
+        for index in range(start, end):
+            line = lines[index] + "\n"
             linesprocessed += 1
             if not self.incomment:
-                if (line.find('<!--') != -1):
+                if '<!--' in line:
                     self.incomment = True
                     self.continuecomment = False
                     # now work out the type of comment, and save it (remember we're not in the comment yet)
-                    (comment, dummy) = quote.extract(line, "<!--", "-->", None, 0)
-                    if comment.find('LOCALIZATION NOTE') != -1:
-                        l = quote.findend(comment, 'LOCALIZATION NOTE')
-                        while (comment[l] == ' '):
-                            l += 1
-                        if comment.find('FILE', l) == l:
-                            self.commenttype = "locfile"
-                        elif comment.find('BEGIN', l) == l:
-                            self.commenttype = "locgroupstart"
-                        elif comment.find('END', l) == l:
-                            self.commenttype = "locgroupend"
-                        else:
-                            self.commenttype = "locnote"
-                    else:
-                        # plain comment
-                        self.commenttype = "comment"
+                    self.commenttype = _getcommenttype(_extractcomment(line)[0])
                 #FIXME: bloody entity might share a line with something important
-                elif not self.inentity and re.search("%.*;", line):
-                    # now work out the type of comment, and save it (remember we're not in the comment yet)
+                elif not self.inentity and paramentityref_re.search(line):
                     self.comments.append(("comment", line))
-                    line = ""
                     continue
 
             if self.incomment:
                 # some kind of comment
-                (comment, self.incomment) = quote.extract(line, "<!--", "-->", None, self.continuecomment)
+                (comment, self.incomment) = _extractcomment(line, self.continuecomment)
                 self.continuecomment = self.incomment
                 # strip the comment out of what will be parsed
                 line = line.replace(comment, "", 1)
@@ -379,24 +450,9 @@ class dtdunit(base.TranslationUnit):
                         line = ''
                     else:
                         comment += '\n'
-                # check if there's actually an entity definition that's commented out
-                # TODO: parse these, store as obsolete messages
-                # if comment.find('<!ENTITY') != -1:
-                #     # remove the entity from the comment
-                #     comment, dummy = quote.extractwithoutquotes(comment, ">", "<!ENTITY", None, 1)
-                # depending on the type of comment (worked out at the start), put it in the right place
-                # make it record the comment and type as a tuple
-                commentpair = (self.commenttype, comment)
-                if self.commenttype == "locfile":
-                    self._locfilenotes.append(commentpair)
-                elif self.commenttype == "locgroupstart":
-                    self._locgroupstarts.append(commentpair)
-                elif self.commenttype == "locgroupend":
-                    self._locgroupends.append(commentpair)
-                elif self.commenttype == "locnote":
-                    self._locnotes.append(commentpair)
-                elif self.commenttype == "comment":
-                    self.comments.append(commentpair)
+                # TODO: parse commented out entity definitions, store as obsolete messages
+                # all the comment lists are the same, record the comment and type as a tuple
+                self.comments.append((self.commenttype, comment))
 
             if not self.inentity and not self.incomment:
                 entitypos = line.find('<!ENTITY')
@@ -412,33 +468,18 @@ class dtdunit(base.TranslationUnit):
             if self.inentity:
                 if self.entitypart == "start":
                     # the entity definition
-                    e = quote.findend(line, '<!ENTITY')
-                    line = line[e:]
+                    line = line[line.find('<!ENTITY') + len('<!ENTITY'):]
                     self.entitypart = "name"
                     self.entitytype = "internal"
                 if self.entitypart == "name":
-                    s = 0
-                    e = 0
-                    while (e < len(line) and line[e].isspace()):
-                        e += 1
-                    self.space_pre_entity = ' ' * (e - s)
-                    s = e
-                    self.entity = ''
-                    if (e < len(line) and line[e] == '%'):
+                    match = entityname_re.match(line)
+                    (prespace, parameterentity, self.entity, postspace) = match.groups()
+                    self.space_pre_entity = ' ' * len(prespace)
+                    if parameterentity:
                         self.entitytype = "external"
                         self.entityparameter = ""
-                        e += 1
-                        while (e < len(line) and line[e].isspace()):
-                            e += 1
-                    while (e < len(line) and not line[e].isspace()):
-                        self.entity += line[e]
-                        e += 1
-                    s = e
-
-                    assert quote.rstripeol(self.entity) == self.entity
-                    while (e < len(line) and line[e].isspace()):
-                        e += 1
-                    self.space_pre_definition = ' ' * (e - s)
+                    self.space_pre_definition = ' ' * len(postspace)
+                    e = match.end()
                     if self.entity:
                         if self.entitytype == "external":
                             self.entitypart = "parameter"
@@ -453,15 +494,9 @@ class dtdunit(base.TranslationUnit):
                             self.entityhelp = (e, line[e])
                             self.instring = False
                 if self.entitypart == "parameter":
-                    while (e < len(line) and line[e].isspace()):
-                        e += 1
-                    paramstart = e
-                    while (e < len(line) and line[e].isalnum()):
-                        e += 1
-                    self.entityparameter += line[paramstart:e]
-                    while (e < len(line) and line[e].isspace()):
-                        e += 1
-                    line = line[e:]
+                    match = entityparameter_re.match(line, e)
+                    self.entityparameter += match.group(1)
+                    line = line[match.end():]
                     e = 0
                     if not line:
                         continue
@@ -471,23 +506,17 @@ class dtdunit(base.TranslationUnit):
                         self.instring = False
                 if self.entitypart == "definition":
                     if self.entityhelp is None:
-                        e = 0
-                        while (e < len(line) and line[e].isspace()):
-                            e += 1
+                        e = len(line) - len(line.lstrip())
                         if e == len(line):
                             continue
                         self.entityhelp = (e, line[e])
                         self.instring = False
-                    # actually the lines below should remember instring, rather than using it as dummy
-                    e = self.entityhelp[0]
-                    if (self.entityhelp[1] == "'"):
-                        (defpart, self.instring) = quote.extract(line[e:], "'", "'", startinstring=self.instring, allowreentry=False)
-                    elif (self.entityhelp[1] == '"'):
-                        (defpart, self.instring) = quote.extract(line[e:], '"', '"', startinstring=self.instring, allowreentry=False)
-                    else:
-                        raise ValueError("Unexpected quote character... %r" % (self.entityhelp[1]))
+                    (e, quotechar) = self.entityhelp
+                    if quotechar not in ('"', "'"):
+                        raise ValueError("Unexpected quote character... %r" % (quotechar))
+                    (defpart, self.instring) = _extractdefinition(line[e:], quotechar, self.instring)
                     # for any following lines, start at the beginning of the line. remember the quote character
-                    self.entityhelp = (0, self.entityhelp[1])
+                    self.entityhelp = (0, quotechar)
                     self.definition += defpart
                     if not self.instring:
                         self.closing = line[e+len(defpart):].rstrip("\n\r")
@@ -536,23 +565,22 @@ class dtdfile(base.TranslationStore):
         if inputfile is not None:
             dtdsrc = inputfile.read()
             self.parse(dtdsrc)
-            self.makeindex()
 
     def parse(self, dtdsrc):
         """read the source code of a dtd file in and include them as dtdunits in self.units"""
+        # The source is decoded and split once, units then consume the lines
+        # of each block in turn without the source being joined again.
+        lines, decodeerrors = self._decodelines(dtdsrc)
         start = 0
         end = 0
-        lines = dtdsrc.split(b"\n")
         while end < len(lines):
             if (start == end):
                 end += 1
             foundentity = False
             while end < len(lines):
-                if end >= len(lines):
-                    break
-                if lines[end].find(b'<!ENTITY') > -1:
+                if '<!ENTITY' in lines[end]:
                     foundentity = True
-                if foundentity and re.match(br"[\"']\s*>", lines[end]):
+                if foundentity and entityclose_re.match(lines[end]):
                     end += 1
                     break
                 end += 1
@@ -561,13 +589,38 @@ class dtdfile(base.TranslationStore):
             while linesprocessed >= 1:
                 newdtd = dtdunit(android=self.android)
                 try:
-                    linesprocessed = newdtd.parse((b"\n".join(lines[start:end])).decode(self.encoding))
+                    for index, error in decodeerrors.items():
+                        if start <= index < end:
+                            raise error
+                    linesprocessed = newdtd._parselines(lines, start, end)
                     if linesprocessed >= 1 and (not newdtd.isnull() or newdtd.unparsedlines):
                         self.units.append(newdtd)
                 except Exception as e:
-                    warnings.warn("%s\nError occured between lines %d and %d:\n%s" % (e, start + 1, end, b"\n".join(lines[start:end])))
+                    warnings.warn("%s\nError occured between lines %d and %d:\n%s" % (e, start + 1, end, "\n".join(lines[start:end])))
                 start += linesprocessed
 
+    def _decodelines(self, dtdsrc):
+        """Returns the decoded lines of the source and the errors of the lines
+        that can't be decoded, keyed on their index.
+
+        The lines that can't be decoded are kept undecoded, the blocks
+        containing them are skipped with a warning.
+        """
+        try:
+            return dtdsrc.decode(self.encoding).split("\n"), {}
+        except UnicodeDecodeError:
+            pass
+        lines = []
+        decodeerrors = {}
+        for index, line in enumerate(dtdsrc.split(b"\n")):
+            try:
+                line = line.decode(self.encoding)
+            except UnicodeDecodeError as e:
+                decodeerrors[index] = e
+                line = str(line)
+            lines.append(line)
+        return lines, decodeerrors
+
     def serialize(self, out):
         """Write content to file"""
         content = b''
@@ -579,12 +632,9 @@ class dtdfile(base.TranslationStore):
             warnings.warn("DTD file '%s' does not validate" % self.filename)
             out.truncate(0)
 
-    def makeindex(self):
-        """makes self.id_index dictionary keyed on entities"""
-        self.id_index = {}
-        for dtd in self.units:
-            if not dtd.isnull():
-                self.id_index[dtd.entity] = dtd
+    def _isindexed(self, unit):
+        """index all units with an entity, the id_index is keyed on entities"""
+        return not unit.isnull()
 
     def _valid_store(self, content):
         """Validate the store to determine if it is valid
@@ -595,12 +645,18 @@ class dtdfile(base.TranslationStore):
         :rtype: Boolean
         """
         # Android files are invalid DTDs
-        if etree is not None and not self.android:
-            # #expand is a Mozilla hack and are removed as they are not valid in DTDs
-            _input = re.sub(b"#expand", b"", content)
-            try:
-                dtd = etree.DTD(BytesIO(_input))
-            except etree.DTDParseError as e:
-                warnings.warn("DTD parse error: %s" % e.error_log)
-                return False
+        if self.android:
+            return True
+        # lxml is slow to import, only do so when a store is validated
+        try:
+            from lxml import etree
+        except ImportError:
+            return True
+        # #expand is a Mozilla hack and are removed as they are not valid in DTDs
+        _input = re.sub(b"#expand", b"", content)
+        try:
+            etree.DTD(BytesIO(_input))
+        except etree.DTDParseError as e:
+            warnings.warn("DTD parse error: %s" % e.error_log)
+            return False
         return True
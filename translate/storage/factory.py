@@ -20,6 +20,9 @@
 """factory methods to build real storage objects that conform to base.py"""
 
 import os
+import time
+
+from translate.storage import storecache
 
 
 #TODO: Monolingual formats (with template?)
@@ -177,6 +180,19 @@ def getclass(storefile, localfiletype=None, ignore=None, classes=None,
     return storeclass
 
 
+def _isondisk(storefile, storefilename):
+    """Returns whether storefile is the file storefilename on disk, and not
+    for example an in-memory file with the same name.
+    """
+    if isinstance(storefile, str):
+        return os.path.isfile(storefilename)
+    try:
+        filestat = os.fstat(storefile.fileno())
+        return os.path.samestat(filestat, os.stat(storefilename))
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
 def getobject(storefile, localfiletype=None, ignore=None, classes=None,
               classes_str=None, hiddenclasses=None):
     """Factory that returns a usable object for the type of file presented.
@@ -185,6 +201,9 @@ def getobject(storefile, localfiletype=None, ignore=None, classes=None,
     :param storefile: File object or file name.
 
     Specify ignore to ignore some part at the back of the name (like .gz).
+
+    If a :mod:`store cache <translate.storage.storecache>` is enabled, stores
+    of unchanged files are loaded from the cache instead of parsed again.
     """
     if classes_str is None:
         classes_str = _classes_str
@@ -198,6 +217,20 @@ def getobject(storefile, localfiletype=None, ignore=None, classes=None,
     storeclass = getclass(storefile, localfiletype, ignore, classes=classes,
                           classes_str=classes_str, hiddenclasses=hiddenclasses)
     if os.path.exists(storefilename) or not getattr(storefile, "closed", True):
+        cache = storecache.get_default_cache()
+        if cache is not None and _isondisk(storefile, storefilename):
+            store = cache.getstore(storefilename, storeclass)
+            if store is not None:
+                if isinstance(storefile, str):
+                    store.filename = storefilename
+                else:
+                    storefile.close()
+                    store.fileobj = storefile
+                    store._assignname()
+                return store
+        else:
+            cache = None
+        start = time.time()
         name, ext = os.path.splitext(storefilename)
         ext = ext[len(os.path.extsep):].lower()
         if ext in decompressclass:
@@ -206,6 +239,8 @@ def getobject(storefile, localfiletype=None, ignore=None, classes=None,
             _file = getattr(module, _class)
             storefile = _file(storefilename)
         store = storeclass.parsefile(storefile)
+        if cache is not None:
+            cache.putstore(storefilename, storeclass, store, time.time() - start)
     else:
         store = storeclass()
         store.filename = storefilename
@@ -51,6 +51,7 @@ class FlatXMLUnit(base.TranslationUnit):
     def source(self, source):
         """Updates the unique identifier of this unit."""
         self.xmlelement.set(self.attribute_name, source)
+        self._reindex()
 
     @property
     def target(self):
@@ -99,6 +99,7 @@ class pounit(pocommon.pounit):
             self._source = source
         else:  # If it is unicode, list or dict.
             self._source = multistring(source)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
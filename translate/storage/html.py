@@ -34,6 +34,12 @@ from translate.storage.base import ParseError
 # within the processing instructions
 html.parser.piclose = re.compile(r'\?>')
 
+pi_re = re.compile(r'(?s)<\?(.*?)\?>')
+only_pi_re = re.compile(r'(?s)^<\?.*?\?>$')
+lazy_pi_re = re.compile(r'<\?.*?\?>')
+charset_re = re.compile('(?i).*(charset.*=.*)')
+tag_re = re.compile('<[^>]*>')
+
 
 strip_html_re = re.compile(r'''
 (?s)^       # We allow newlines, and match start of line
@@ -67,7 +73,7 @@ def strip_html(text):
     text = text.strip()
 
     # If all that is left is PHP, return ""
-    result = re.findall(r'(?s)^<\?.*?\?>$', text)
+    result = only_pi_re.findall(text)
     if len(result) == 1:
         return ""
 
@@ -111,6 +117,7 @@ class htmlunit(base.TranslationUnit):
     def source(self, source):
         self._rich_source = None
         self._text = safe_escape(source)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -184,7 +191,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         self.currentpos = -1
         self.currentoffset = -1
         self.tag_path = []
-        self.filesrc = u""
+        self._filesrc = []
         self.currentsrc = u""
         self.pidict = {}
         if callback is None:
@@ -199,6 +206,17 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             inputfile.close()
             self.parse(htmlsrc)
 
+    @property
+    def filesrc(self):
+        """The source of the file, with the blocks replaced by the callback."""
+        if len(self._filesrc) > 1:
+            self._filesrc = [u"".join(self._filesrc)]
+        return u"".join(self._filesrc)
+
+    @filesrc.setter
+    def filesrc(self, value):
+        self._filesrc = [value]
+
     def _simple_callback(self, string):
         return string
 
@@ -245,11 +263,13 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         strings to help our regexes out.
 
         """
-        result = re.findall(r'(?s)<\?(.*?)\?>', text)
+        result = pi_re.findall(text)
         for pi in result:
             pi_escaped = pi.replace("<", "%lt;").replace(">", "%gt;")
-            self.pidict[pi_escaped] = pi
-            text = text.replace(pi, pi_escaped)
+            # Instructions without < or > stay as they are
+            if pi_escaped != pi:
+                self.pidict[pi_escaped] = pi
+                text = text.replace(pi, pi_escaped)
         return text
 
     def pi_unescape(self, text):
@@ -279,7 +299,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         translated.
         """
         text = text.strip()
-        result = re.findall('(?i).*(charset.*=.*)', text)
+        result = charset_re.findall(text)
         if len(result) == 1:
             return False
 
@@ -287,10 +307,8 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
         if text == '&nbsp;':
             return False
 
-        pattern = r'<\?.*?\?>'  # Lazily strip all PHP
-        result = re.sub(pattern, '', text).strip()
-        pattern = '<[^>]*>'  # Strip all HTML tags
-        result = re.sub(pattern, '', result).strip()
+        result = lazy_pi_re.sub('', text).strip()  # Lazily strip all PHP
+        result = tag_re.sub('', result).strip()  # Strip all HTML tags
         if result:
             return True
         else:
@@ -313,13 +331,25 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
 
 #From here on below, follows the methods of the HTMLParser
 
+    def _translatedsrc(self, callback_result):
+        """Returns the source of the current block with its text replaced by
+        the callback.
+
+        :param callback_result: Decides whether the text is replaced, given
+                                the result of the callback on the text.
+        """
+        stripped = strip_html(self.currentsrc)
+        normalized = normalize_html(stripped)
+        result = self.callback(normalized)
+        if not callback_result(result):
+            return self.currentsrc
+        if "\n" in normalized:
+            result = self.callback(normalized.replace("\n", " "))
+        return self.currentsrc.replace(stripped, result)
+
     def startblock(self, tag, attrs=None):
         self.addhtmlblock(self.currentblock)
-        if self.callback(normalize_html(strip_html(self.currentsrc))):
-            self.filesrc += self.currentsrc.replace(strip_html(self.currentsrc),
-                                                    self.callback(normalize_html(strip_html(self.currentsrc)).replace("\n", " ")))
-        else:
-            self.filesrc += self.currentsrc
+        self._filesrc.append(self._translatedsrc(bool))
         self.currentblock = ""
         self.currentcomment = ""
         self.currenttag = tag
@@ -329,11 +359,8 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
 
     def endblock(self):
         self.addhtmlblock(self.currentblock)
-        if self.callback(normalize_html(strip_html(self.currentsrc))) is not None:
-            self.filesrc += self.currentsrc.replace(strip_html(self.currentsrc),
-                                                    self.callback(normalize_html(strip_html(self.currentsrc).replace("\n", " "))))
-        else:
-            self.filesrc += self.currentsrc
+        self._filesrc.append(
+            self._translatedsrc(lambda result: result is not None))
         self.currentblock = ""
         self.currentcomment = ""
         self.currenttag = None
@@ -364,7 +391,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             self.currentblock += self.get_starttag_text()
             self.currentsrc += self.get_starttag_text()
         else:
-            self.filesrc += self.buildtag(tag, attrs)
+            self._filesrc.append(self.buildtag(tag, attrs))
 
     def handle_startendtag(self, tag, attrs):
         for i, attr in enumerate(attrs):
@@ -377,7 +404,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             self.currentblock += self.get_starttag_text()
             self.currentsrc += self.get_starttag_text()
         else:
-            self.filesrc += self.buildtag(tag, attrs, startend=True)
+            self._filesrc.append(self.buildtag(tag, attrs, startend=True))
 
     def handle_endtag(self, tag):
         if tag == self.currenttag:
@@ -387,7 +414,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             self.currentblock += '</%s>' % tag
             self.currentsrc += '</%s>' % tag
         else:
-            self.filesrc += '</%s>' % tag
+            self._filesrc.append('</%s>' % tag)
         try:
             popped = self.tag_path.pop()
         except IndexError:
@@ -409,7 +436,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             self.currentblock += data
             self.currentsrc += data
         else:
-            self.filesrc += self.callback(data)
+            self._filesrc.append(self.callback(data))
 
     def handle_charref(self, name):
         """Handle entries in the form &#NNNN; e.g. &#8417;"""
@@ -428,7 +455,7 @@ class htmlfile(html.parser.HTMLParser, base.TranslationStore):
             self.currentcomment = data
         else:
             self.currentcomment += u'\n' + data
-        self.filesrc += "<!--%s-->" % data
+        self._filesrc.append("<!--%s-->" % data)
 
     def handle_pi(self, data):
         self.handle_data("<?%s?>" % self.pi_unescape(data))
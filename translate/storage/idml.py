@@ -19,6 +19,8 @@
 
 import zipfile
 
+from translate.storage.zip import copymembers
+
 
 # Tags to be extracted as placeables (tags that are within translatable texts).
 INLINE_ELEMENTS = [
@@ -93,7 +95,4 @@ def open_idml(filename):
 
 
 def copy_idml(input_zip, output_zip, exclusion_list):
-    for name in [name for name in input_zip.namelist()
-                 if name not in exclusion_list]:
-        output_zip.writestr(name, input_zip.read(name))
-    return output_zip
+    return copymembers(input_zip, output_zip, exclude=exclusion_list)
@@ -105,6 +105,7 @@ class JsonUnit(base.TranslationUnit):
     @source.setter
     def source(self, source):
         self.target = source
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -59,6 +59,7 @@ class l20nunit(base.TranslationUnit):
     @source.setter
     def source(self, source):
         self.value = source
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
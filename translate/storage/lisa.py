@@ -126,6 +126,7 @@ class LISAunit(base.TranslationUnit):
         self._rich_source = None
         text = data.forceunicode(text)
         self.source_dom = self.createlanguageNode(sourcelang, text, "source")
+        self._reindex()
 
     def set_target_dom(self, dom_node, append=False):
         languageNodes = self.getlanguageNodes()
@@ -315,6 +316,12 @@ class LISAfile(base.TranslationStore):
         if new:
             self.body.append(unit.xmlelement)
 
+    def removeunit(self, unit):
+        super().removeunit(unit)
+        parent = unit.xmlelement.getparent()
+        if parent is not None:
+            parent.remove(unit.xmlelement)
+
     def serialize(self, out=None):
         """Converts to a string containing the file's XML"""
         self.document.write(out, pretty_print=True, xml_declaration=True,
@@ -19,15 +19,18 @@
 
 import zipfile
 
+from translate.storage.zip import copymembers
+
 
 def open_odf(filename):
-    z = zipfile.ZipFile(filename, 'r')
-    return {'content.xml': z.read("content.xml"),
-            'meta.xml': z.read("meta.xml"),
-            'styles.xml': z.read("styles.xml")}
+    names = ("content.xml", "meta.xml", "styles.xml")
+    with zipfile.ZipFile(filename, 'r') as z:
+        # Read the parts in the order they are stored in the package
+        infos = sorted((z.getinfo(name) for name in names),
+                       key=lambda info: info.header_offset)
+        data = dict((info.filename, z.read(info)) for info in infos)
+    return dict((name, data[name]) for name in names)
 
 
 def copy_odf(input_zip, output_zip, exclusion_list):
-    for name in [name for name in input_zip.namelist() if name not in exclusion_list]:
-        output_zip.writestr(name, input_zip.read(name))
-    return output_zip
+    return copymembers(input_zip, output_zip, exclude=exclusion_list)
@@ -120,6 +120,7 @@ class OmegaTUnit(base.TranslationUnit):
     def source(self, source):
         self._rich_source = None
         self._set_field('source', source)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -349,17 +349,24 @@ class oomultifile:
         self.multifilename = os.path.splitext(filename)[0]
         self.multifile = open(filename, mode)
         self.subfilelines = {}
+        self._subfilesrc = {}
         if mode.startswith("r"):
             self.createsubfileindex()
 
     def createsubfileindex(self):
-        """reads in all the lines and works out the subfiles"""
+        """reads in all the lines and works out the subfiles
+
+        The lines of every subfile are kept, so that the file is only read
+        once instead of once for every subfile.
+        """
         linenum = 0
         for line in self.multifile:
             subfile = self.getsubfilename(line)
             if subfile not in self.subfilelines:
                 self.subfilelines[subfile] = []
+                self._subfilesrc[subfile] = []
             self.subfilelines[subfile].append(linenum)
+            self._subfilesrc[subfile].append(line)
             linenum += 1
 
     def getsubfilename(self, line):
@@ -393,15 +400,7 @@ class oomultifile:
 
     def getsubfilesrc(self, subfile):
         """returns the list of lines matching the subfile"""
-        lines = []
-        requiredlines = dict.fromkeys(self.subfilelines[subfile])
-        linenum = 0
-        self.multifile.seek(0)
-        for line in self.multifile:
-            if linenum in requiredlines:
-                lines.append(line)
-            linenum += 1
-        return "".join(lines)
+        return "".join(self._subfilesrc[subfile])
 
     def openinputfile(self, subfile):
         """returns a pseudo-file object for the given subfile"""
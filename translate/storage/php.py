@@ -240,6 +240,7 @@ class phpunit(base.TranslationUnit):
         """Set the source AND the target to be equal."""
         self._rich_source = None
         self.value = source
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
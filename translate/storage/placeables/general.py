@@ -25,6 +25,7 @@ fit into any other sub-category.
 import re
 
 
+from translate.misc import lazyre
 from translate.storage.placeables.base import G, Ph, StringElem
 
 
@@ -54,7 +55,7 @@ def regex_parse(cls, pstr):
 class AltAttrPlaceable(G):
     """Placeable for the "alt=..." attributes inside XML tags."""
 
-    regex = re.compile(r'alt=".*?"')
+    regex = lazyre.compile(r'alt=".*?"')
     parse = classmethod(regex_parse)
 
 
@@ -64,7 +65,7 @@ class NewlinePlaceable(Ph):
     iseditable = False
     isfragile = True
     istranslatable = False
-    regex = re.compile(r'\r\n|\n|\r')
+    regex = lazyre.compile(r'\r\n|\n|\r')
     parse = classmethod(regex_parse)
 
 
@@ -72,7 +73,7 @@ class NumberPlaceable(Ph):
     """Placeable for numbers."""
 
     istranslatable = False
-    regex = re.compile(u"[-+]?[0-9]+([\u00a0.,][0-9]+)*")
+    regex = lazyre.compile(u"[-+]?[0-9]+([\u00a0.,][0-9]+)*")
     parse = classmethod(regex_parse)
 
 
@@ -92,7 +93,7 @@ class QtFormattingPlaceable(Ph):
 
     iseditable = False
     istranslatable = False
-    regex = re.compile(r"""(?x)
+    regex = lazyre.compile(r"""(?x)
                        %                 # Start of a place marker
                        L?                # The sequence is replaced with a localized representation (optional)
                        [1-9]\d{0,1}      # Place marker numbers must be in the range 1 to 99.
@@ -111,7 +112,7 @@ class PythonFormattingPlaceable(Ph):
     iseditable = False
     istranslatable = False
     # Need to correctly define a python identifier.
-    regex = re.compile(r"""(?x)
+    regex = lazyre.compile(r"""(?x)
                        %                     # Start of formatting specifier
                        (%|                   # No argument converted %% creates a %
                        (\([^)]+\)){0,1}      # Mapping key value (optional)
@@ -138,7 +139,7 @@ class JavaMessageFormatPlaceable(Ph):
     iseditable = False  # TODO: Technically incorrect as you need to change
     istranslatable = False
     # things in a choice entry
-    regex = re.compile(r"""(?x)
+    regex = lazyre.compile(r"""(?x)
       {                      # Start of MessageFormat
       [0-9]+                 # Number, positive array reference
       (,\s*                  # FormatType (optional) one of number,date,time,choice
@@ -158,7 +159,7 @@ class FormattingPlaceable(Ph):
 
     iseditable = False
     istranslatable = False
-    regex = re.compile(r"""
+    regex = lazyre.compile(r"""
         %                         # introduction
         (\d+\$)?                  # selection of non-next variable (reordering)
         [\-\+0 \#'I]?             # optional flag
@@ -174,7 +175,7 @@ class DoubleAtPlaceable(Ph):
     istranslatable = False
     iseditable = False
     # Matches placeholders that use two at symbols @@placeable@@.
-    regex = re.compile(r"@@.*?@@", re.VERBOSE)
+    regex = lazyre.compile(r"@@.*?@@", re.VERBOSE)
     parse = classmethod(regex_parse)
 
 
@@ -184,7 +185,7 @@ class BracePlaceable(Ph):
     # Matches placeholders that use two braces {{placeable}} or one brace {placeable}.
     # The negative character groups with closing brace [^}] stop the regex from counting several placeholders
     # as one (e.g. '{open}something{closed}' should produce two distinct BracePlaceables '{open}' and '{closed}')
-    regex = re.compile(r"{{[^}]*}}|{[^}]*}", re.VERBOSE)
+    regex = lazyre.compile(r"{{[^}]*}}|{[^}]*}", re.VERBOSE)
     parse = classmethod(regex_parse)
 
 
@@ -192,7 +193,7 @@ class UrlPlaceable(Ph):
     """Placeable handling URI."""
 
     istranslatable = False
-    regex = re.compile(r"""
+    regex = lazyre.compile(r"""
     ((((news|nttp|file|https?|ftp|irc)://)       # has to start with a protocol
     |((www|ftp)[-A-Za-z0-9]*\.))                 # or www... or ftp... hostname
     ([-A-Za-z0-9]+(\.[-A-Za-z0-9]+)*)            # hostname
@@ -208,7 +209,7 @@ class FilePlaceable(Ph):
     """Placeable handling file locations."""
 
     istranslatable = False
-    regex = re.compile(r"(~/|/|\./)([-A-Za-z0-9_\$\.\+\!\*\(\),;:@&=\?/~\#\%]|\\){3,}")
+    regex = lazyre.compile(r"(~/|/|\./)([-A-Za-z0-9_\$\.\+\!\*\(\),;:@&=\?/~\#\%]|\\){3,}")
     # TODO: Handle Windows drive letters. Some common Windows paths won't be
     # handled correctly while not allowing spaces, such as
     #     "C:\Documents and Settings"
@@ -220,7 +221,7 @@ class EmailPlaceable(Ph):
     """Placeable handling emails."""
 
     istranslatable = False
-    regex = re.compile(r"((mailto:)|)[A-Za-z0-9]+[-a-zA-Z0-9._%]*@(([-A-Za-z0-9]+)\.)+[a-zA-Z]{2,4}")
+    regex = lazyre.compile(r"((mailto:)|)[A-Za-z0-9]+[-a-zA-Z0-9._%]*@(([-A-Za-z0-9]+)\.)+[a-zA-Z]{2,4}")
     # TODO: What about internationalised domain names? ;-)
     parse = classmethod(regex_parse)
 
@@ -233,7 +234,7 @@ class PunctuationPlaceable(Ph):
     # FIXME this should really be a list created as being the inverse of what
     # is available on the translators keyboard.  Or easily expanded by their
     # configuration.
-    regex = re.compile(
+    regex = lazyre.compile(
         u'''([™©®]|          # Marks
              [℃℉°]|          # Degree related
              [±πθ×÷−√∞∆Σ′″]| # Maths
@@ -255,7 +256,7 @@ class XMLEntityPlaceable(Ph):
 
     iseditable = False
     istranslatable = False
-    regex = re.compile(r'''&(
+    regex = lazyre.compile(r'''&(
         ([a-zA-Z][a-zA-Z0-9\.-]*)            #named entity
          |([#](\d{1,5}|x[a-fA-F0-9]{1,5})+)  #numeric entity
         );''', re.VERBOSE)
@@ -266,7 +267,7 @@ class CapsPlaceable(Ph):
     """Placeable handling long all-caps strings."""
 
     iseditable = True
-    regex = re.compile(r'\b[A-Z][A-Z_/\-:*0-9]{2,}\b[+]?')
+    regex = lazyre.compile(r'\b[A-Z][A-Z_/\-:*0-9]{2,}\b[+]?')
     parse = classmethod(regex_parse)
 
 
@@ -274,7 +275,7 @@ class CamelCasePlaceable(Ph):
     """Placeable handling camel case strings."""
 
     iseditable = True
-    regex = re.compile(r'''(?x)
+    regex = lazyre.compile(r'''(?x)
             \b(
                [a-z]+[A-Z]|         #Not that strict if we start with lower (iPod)
                [A-Z]+[a-z]+[A-Z]|   #One capital at the start is not enough (OpenTran)
@@ -289,7 +290,7 @@ class SpacesPlaceable(Ph):
 
     iseditable = True
     istranslatable = False
-    regex = re.compile(r"""(?m)  #Multiline expression
+    regex = lazyre.compile(r"""(?m)  #Multiline expression
         [ ]{2,}|     #More than two consecutive
         ^[ ]+|       #At start of a line
         [ ]+$        #At end of line""", re.VERBOSE)
@@ -302,7 +303,7 @@ class XMLTagPlaceable(Ph):
 
     iseditable = True
     istranslatable = False
-    regex = re.compile(r'''
+    regex = lazyre.compile(r'''
         <                         # start of opening tag
         ([\w.:]+)                 # tag name, possibly namespaced
         (\s([\w.:]+=              # space and attribute name followed by =
@@ -317,7 +318,7 @@ class OptionPlaceable(Ph):
     """Placeble handling command line options e.g. --help"""
 
     istranslatable = False
-    regex = re.compile(r'''(?x)
+    regex = lazyre.compile(r'''(?x)
                       \B(             # Empty string at the start of a non-word, ensures [space]-
                         -[a-zA-Z]|    # Single letter options: -i, -I
                         --[a-z\-]+    # Word options: --help
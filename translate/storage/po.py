@@ -28,12 +28,12 @@ tested).
 
 import logging
 import os
-import platform
+import sys
 
 
 usecpo = os.getenv('USECPO')
 
-if platform.python_implementation() == "CPython":
+if sys.implementation.name == "cpython":
     if usecpo == "1":
         from translate.storage.cpo import *  # pylint: disable=W0401,W0614
     elif usecpo == "2":
@@ -43,5 +43,5 @@ if platform.python_implementation() == "CPython":
 else:
     if usecpo:
         logging.error("cPO and fPO do not work on %s defaulting to PyPO" %
-                      platform.python_implementation())
+                      sys.implementation.name)
     from translate.storage.pypo import *  # pylint: disable=W0401
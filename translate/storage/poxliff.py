@@ -121,6 +121,7 @@ class PoXliffUnit(xliff.xliffunit):
                 self.units.append(newunit)
                 self.xmlelement.append(newunit.xmlelement)
             self.target = target
+            self._reindex()
 
     # We don't support any rich strings yet
     multistring_to_rich = base.TranslationUnit.multistring_to_rich
@@ -516,6 +516,7 @@ class propunit(base.TranslationUnit):
         self._rich_source = None
         self.value = self.personality.encode(data.forceunicode(source) or u"",
                                              self.encoding)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -295,6 +295,7 @@ class pounit(pocommon.pounit):
         """
         self._rich_source = None
         self.msgid, self.msgid_plural = self._set_source_vars(source)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
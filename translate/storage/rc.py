@@ -71,6 +71,7 @@ class rcunit(base.TranslationUnit):
         """Sets the source AND the target to be equal"""
         self._rich_source = None
         self._value = source or ""
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
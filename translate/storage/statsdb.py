@@ -20,6 +20,15 @@
 
 """Module to provide a cache of statistics in a database.
 
+Cached statistics are used as long as the size and modification time of the
+file are unchanged.  Checkouts and copies change the modification time of
+every file, set ``TRANSLATE_STATS_CONTENTHASH`` (or the ``contenthash``
+attribute of a :class:`StatsCache`) to also store a hash of the content and
+keep using the statistics of files with the same content.
+
+Paths below the directory in ``TRANSLATE_STATS_ROOT`` (or the ``root``
+attribute) are stored relative to it, so that a database can be used for a
+copy of the files in another directory or on another machine.
 """
 
 import logging
@@ -32,7 +41,9 @@ import _thread
 from sqlite3 import dbapi2
 
 from translate import __version__ as toolkitversion
+from translate.filters import checkcache
 from translate.lang.common import Common
+from translate.misc import lru
 from translate.misc.multistring import multistring
 from translate.storage import factory
 from translate.storage.workflow import StateEnum
@@ -40,6 +51,12 @@ from translate.storage.workflow import StateEnum
 
 logger = logging.getLogger(__name__)
 
+CONTENTHASH_ENVIRONMENT_VARIABLE = "TRANSLATE_STATS_CONTENTHASH"
+"""The environment variable that enables content hashes"""
+
+ROOT_ENVIRONMENT_VARIABLE = "TRANSLATE_STATS_ROOT"
+"""The environment variable with the directory paths are relative to"""
+
 #kdepluralre = re.compile("^_n: ") #Restore this if you really need support for old kdeplurals
 brtagre = re.compile(r"<br\s*?/?>")
 # xmltagre is a direct copy of the from placeables/general.py
@@ -73,36 +90,85 @@ state_strings = {
 }
 
 
-def wordcount(string):
+#: The counts of recently counted strings, keyed by (language, string), the
+#: same source strings are counted in the files of every language
+_wordcounts = lru.LRUDict(100000)
+
+
+def _language(lang):
+    """Returns the language class to count words with for a language code or
+    class, None counts like :class:`~translate.lang.common.Common`.
+    """
+    if lang is None:
+        return Common
+    if isinstance(lang, str):
+        from translate.lang import factory as langfactory
+        return langfactory.getlanguage(lang)
+    return lang
+
+
+def _countwords(string, language):
     # TODO: po class should understand KDE style plurals ##
     #string = kdepluralre.sub("", string) #Restore this if you really need support for old kdeplurals
-    string = brtagre.sub("\n", string)
-    string = xmltagre.sub("", string)
-    string = numberre.sub(" ", string)
-    # TODO: This should still use the correct language to count in the target
-    # language
-    return len(Common.words(string))
+    # Tags and numbers are rare, only substitute them when they can match
+    if "<" in string:
+        string = brtagre.sub("\n", string)
+        string = xmltagre.sub("", string)
+    if "." in string:
+        string = numberre.sub(" ", string)
+    if language.word_iter.__func__ is not Common.word_iter.__func__:
+        return len(language.words(string))
+    # Common.words() without building the list of words
+    punctuation = language.punctuation
+    count = 0
+    for word in string.split():
+        if word.strip(punctuation):
+            count += 1
+    return count
+
+
+def wordcounts(strings, lang=None):
+    """Returns a list with the number of words in each of the strings.
+
+    :param lang: The code or class of the language of the strings, by default
+                 words are counted like in English.
+    """
+    language = _language(lang)
+    counts = []
+    for string in strings:
+        key = (language, string)
+        count = _wordcounts.lookup(key)
+        if count is None:
+            count = _wordcounts[key] = _countwords(string, language)
+        counts.append(count)
+    return counts
+
+
+def wordcount(string, lang=None):
+    """Returns the number of words in the string, see :func:`wordcounts`."""
+    return wordcounts([string], lang)[0]
 
 
-def wordsinunit(unit):
+def wordsinunit(unit, targetlang=None):
     """Counts the words in the unit's source and target, taking plurals into
     account. The target words are only counted if the unit is translated.
+
+    :param targetlang: The code or class of the language that the target words
+                       are counted in, by default like in English.
     """
     (sourcewords, targetwords) = (0, 0)
     if isinstance(unit.source, multistring):
         sourcestrings = unit.source.strings
     else:
         sourcestrings = [unit.source or ""]
-    for s in sourcestrings:
-        sourcewords += wordcount(s)
+    sourcewords = sum(wordcounts(sourcestrings))
     if not unit.istranslated():
         return sourcewords, targetwords
     if isinstance(unit.target, multistring):
         targetstrings = unit.target.strings
     else:
         targetstrings = [unit.target or ""]
-    for s in targetstrings:
-        targetwords += wordcount(s)
+    targetwords = sum(wordcounts(targetstrings, targetlang))
     return sourcewords, targetwords
 
 
@@ -169,6 +235,54 @@ def statefordb(unit):
     return UNTRANSLATED
 
 
+def _dbstring(string):
+    if string is None:
+        return None
+    return str(string)
+
+
+def unitvalues(units):
+    """Returns the rows of the units table for the translatable units, without
+    the fileid, and a tuple of the file totals.
+    """
+    values = []
+    totals = FileTotals.new_record()
+    for index, unit in enumerate(units):
+        if unit.istranslatable():
+            sourcewords, targetwords = wordsinunit(unit)
+            state = statefordb(unit)
+            values.append((unit.getid(), index, _dbstring(unit.source),
+                           _dbstring(unit.target), sourcewords, targetwords,
+                           state, unit.get_state_id()))
+            totals = totals + FileTotals.new_record(state, sourcewords,
+                                                    targetwords)
+    return values, totals.to_tuple()
+
+
+def filehash(filename):
+    """Returns a hex digest of the content of the given file."""
+    import hashlib
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as fileobj:
+        for block in iter(lambda: fileobj.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _primefile(task):
+    """Parses and counts a file for :meth:`StatsCache.prime`, in a worker
+    process.
+    """
+    realpath, contenthash = task
+    try:
+        mod_info = get_mod_info(realpath)
+        store = factory.getobject(realpath)
+        filehashvalue = contenthash and filehash(realpath) or None
+        return realpath, mod_info, filehashvalue, unitvalues(store.units)
+    except Exception as e:
+        return realpath, None, None, str(e)
+
+
 class FileTotals:
     keys = ['translatedsourcewords',
             'fuzzysourcewords',
@@ -291,6 +405,12 @@ class StatsCache:
     """This cache's connection"""
     cur = None
     """The current cursor"""
+    contenthash = False
+    """Whether files with a cached hash of their content stay fresh when
+    their modification time changes"""
+    root = None
+    """The directory that the paths of the files below it are stored
+    relative to"""
 
     def __new__(cls, statsfile=None):
         current_thread = _thread.get_ident()
@@ -300,6 +420,9 @@ class StatsCache:
             def connect(cache):
                 # sqlite needs to get the name in utf-8 on all platforms
                 cache.con = dbapi2.connect(statsfile)
+                # Readers don't block the writer of prime() and vice versa
+                cache.con.execute("PRAGMA journal_mode=WAL;")
+                cache.con.execute("PRAGMA synchronous=NORMAL;")
                 cache.cur = cache.con.cursor()
 
             def clear_old_data(cache):
@@ -321,6 +444,9 @@ class StatsCache:
             connect(cache)
             if clear_old_data(cache):
                 connect(cache)
+            cache.contenthash = bool(
+                os.environ.get(CONTENTHASH_ENVIRONMENT_VARIABLE))
+            cache.root = os.environ.get(ROOT_ENVIRONMENT_VARIABLE)
             cache.create()
             return cache
 
@@ -356,7 +482,14 @@ class StatsCache:
             path VARCHAR NOT NULL UNIQUE,
             st_mtime INTEGER NOT NULL,
             st_size INTEGER NOT NULL,
-            toolkitbuild INTEGER NOT NULL);""")
+            toolkitbuild INTEGER NOT NULL,
+            hash VARCHAR);""")
+
+        # Databases of earlier versions don't have hashes yet
+        columns = [row[1] for row in
+                   self.cur.execute("PRAGMA table_info(files);")]
+        if "hash" not in columns:
+            self.cur.execute("ALTER TABLE files ADD COLUMN hash VARCHAR;")
 
         self.cur.execute("""CREATE UNIQUE INDEX IF NOT EXISTS filepathindex
             ON files (path);""")
@@ -409,8 +542,8 @@ class StatsCache:
         if isinstance(filename, bytes):
             filename = str(filename, sys.getfilesystemencoding())
         realpath = os.path.realpath(filename)
-        self.cur.execute("""SELECT fileid, st_mtime, st_size FROM files
-                WHERE path=?;""", (realpath,))
+        self.cur.execute("""SELECT fileid, st_mtime, st_size, hash FROM files
+                WHERE path=?;""", (self._dbpath(realpath),))
         filerow = self.cur.fetchone()
         mod_info = get_mod_info(realpath)
         if filerow:
@@ -421,7 +554,7 @@ class StatsCache:
                         SET st_mtime=?, st_size=?
                         WHERE fileid=?;""", (mod_info[0], mod_info[1], fileid))
                 return fileid
-            if (filerow[1], filerow[2]) == mod_info:
+            if self._isfresh(filerow, realpath, mod_info):
                 return fileid
 
         # file wasn't in db at all, lets recache it
@@ -432,6 +565,33 @@ class StatsCache:
 
         return self._cachestore(store, realpath, mod_info)
 
+    def _dbpath(self, realpath):
+        """Returns the path of the file in the database, relative to the root
+        if the file is below it.
+        """
+        if self.root:
+            root = os.path.realpath(self.root)
+            if realpath.startswith(os.path.join(root, "")):
+                return os.path.relpath(realpath, root).replace(os.sep, "/")
+        return realpath
+
+    def _isfresh(self, filerow, realpath, mod_info):
+        """Returns whether the cached statistics of a (fileid, st_mtime,
+        st_size, hash) row of the files table are still valid for the file.
+
+        With content hashes a file with a new modification time is fresh if
+        its content is unchanged, the new time is stored.
+        """
+        fileid, st_mtime, st_size, cachedhash = filerow
+        if (st_mtime, st_size) == mod_info:
+            return True
+        if (not self.contenthash or cachedhash is None or
+                st_size != mod_info[1] or cachedhash != filehash(realpath)):
+            return False
+        self.cur.execute("""UPDATE files SET st_mtime=? WHERE fileid=?;""",
+                         (mod_info[0], fileid))
+        return True
+
     def _getstoredcheckerconfig(self, checker):
         """See if this checker configuration has been used before."""
         config = str(checker.config.__dict__)
@@ -476,19 +636,97 @@ class StatsCache:
         """Calculates and caches the statistics of the given store
         unconditionally.
         """
+        filehashvalue = self.contenthash and filehash(realpath) or None
+        return self._storestats(realpath, mod_info, filehashvalue,
+                                *unitvalues(store.units))
+
+    def _storestats(self, realpath, mod_info, filehashvalue, values, totals):
+        """Replaces the statistics of a file with the output of
+        :func:`unitvalues`.
+        """
+        dbpath = self._dbpath(realpath)
         self.cur.execute("""DELETE FROM files WHERE
-            path=?;""", (realpath,))
+            path=?;""", (dbpath,))
         self.cur.execute(
             """INSERT INTO files
-            (fileid, path, st_mtime, st_size, toolkitbuild) values (NULL, ?, ?, ?, ?);""",
-            (realpath, mod_info[0], mod_info[1], toolkitversion.build))
+            (fileid, path, st_mtime, st_size, toolkitbuild, hash) values (NULL, ?, ?, ?, ?, ?);""",
+            (dbpath, mod_info[0], mod_info[1], toolkitversion.build,
+             filehashvalue))
         # Unusual capitalisation intended. See bug 2073.
         fileid = self.cur.lastrowid
         self.cur.execute("""DELETE FROM units WHERE
             fileid=?""", (fileid,))
-        self._cacheunitstats(store.units, fileid)
+        # XXX: executemany is non-standard
+        self.cur.executemany(
+            """INSERT INTO units
+            (unitid, fileid, unitindex, source, target, sourcewords, targetwords, state, e_state)
+            values (?, ?, ?, ?, ?, ?, ?, ?, ?);""",
+            [(value[0], fileid) + value[1:] for value in values])
+        self.file_totals[fileid] = Record(
+            FileTotals.keys, totals, FileTotals._compute_derived_values)
         return fileid
 
+    def _stalefiles(self, paths):
+        """Returns the real paths of the files that are not in the cache or
+        changed since they were cached.
+        """
+        cached = dict((row[0], row[1:]) for row in self.cur.execute(
+            """SELECT path, fileid, st_mtime, st_size, hash FROM files;"""))
+        stale = []
+        for filename in paths:
+            if isinstance(filename, bytes):
+                filename = str(filename, sys.getfilesystemencoding())
+            realpath = os.path.realpath(filename)
+            filerow = cached.get(self._dbpath(realpath))
+            try:
+                if filerow and self._isfresh(filerow, realpath,
+                                             get_mod_info(realpath)):
+                    continue
+            except OSError:
+                # Reported when the file is counted
+                pass
+            stale.append(realpath)
+        return stale
+
+    #: The number of files that :meth:`prime` writes in one transaction
+    primebatchsize = 500
+
+    @transaction
+    def prime(self, paths, jobs=1):
+        """Caches the statistics of all the given files that are not cached
+        yet or that changed, and returns the number of files cached.
+
+        The files are parsed and counted in a pool of jobs processes, while
+        this process writes the results in large transactions.  Files that
+        can not be parsed are logged and skipped.
+        """
+        stale = list(dict.fromkeys(self._stalefiles(paths)))
+        if not stale:
+            return 0
+        tasks = [(realpath, self.contenthash) for realpath in stale]
+        if jobs > 1 and len(stale) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(min(jobs, len(stale)))
+            results = pool.map(_primefile, tasks,
+                               chunksize=max(1, len(stale) // (jobs * 4)))
+        else:
+            pool = None
+            results = map(_primefile, tasks)
+        cached = 0
+        try:
+            for realpath, mod_info, filehashvalue, values in results:
+                if mod_info is None:
+                    logger.warning("could not count %s: %s", realpath, values)
+                    continue
+                self._storestats(realpath, mod_info, filehashvalue, *values)
+                cached += 1
+                if not cached % self.primebatchsize:
+                    self.con.commit()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return cached
+
     def file_extended_totals(self, filename, store=None):
         stats = {}
         fileid = self._getfileid(filename, store=store)
@@ -523,12 +761,16 @@ class StatsCache:
         unitvalues = [dummy]
         # if we are doing a single unit, we want to return the checknames
         errornames = []
+        cache = checkcache.get_default_cache()
         for index, unit in enumerate(units):
             if unit.istranslatable():
                 # Correctly assign the unitindex
                 if unitindex:
                     index = unitindex
-                failures = checker.run_filters(unit)
+                if cache is not None:
+                    failures = cache.run_filters(checker, unit)
+                else:
+                    failures = checker.run_filters(unit)
                 for checkname, checkmessage in failures.items():
                     unitvalues.append((index, fileid, configid, checkname, checkmessage))
                     errornames.append("check-" + checkname)
@@ -745,4 +987,5 @@ class StatsCache:
         for threads in self._caches.values():
             for cache in threads.values():
                 cache.con.close()
-        self._caches = {}
+        # Later instances open new connections
+        StatsCache._caches = {}
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""A cache of parsed stores shared between runs of the tools.
+
+The cache is opt-in: set the ``TRANSLATE_STORE_CACHE`` environment variable
+to a directory, or call :func:`set_default_cache`.  :func:`factory.getobject
+<translate.storage.factory.getobject>` then stores a pickled snapshot of every
+store it parses and loads the snapshot instead of parsing the file again, as
+long as the path, size, modification time, content, store class and toolkit
+version are unchanged.
+
+.. warning::
+
+   Snapshots are loaded with :mod:`pickle`, only point the cache to a
+   directory that is not writable by untrusted users.
+"""
+
+import atexit
+import logging
+import os
+import time
+
+from translate import __version__ as toolkitversion
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENVIRONMENT_VARIABLE = "TRANSLATE_STORE_CACHE"
+"""The environment variable that enables the default cache"""
+
+
+def _hashfile(filename):
+    """Returns a hex digest of the content of the given file."""
+    import hashlib
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as fileobj:
+        for block in iter(lambda: fileobj.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _classname(storeclass):
+    return "%s.%s" % (storeclass.__module__, storeclass.__qualname__)
+
+
+class StoreCache:
+    """A directory of parsed store snapshots.
+
+    Every tool imports this module through the store factory, the modules
+    that are only needed when a cache is used are imported on first use.
+    """
+
+    def __init__(self, cachedir):
+        self.cachedir = os.path.abspath(cachedir)
+        if not os.path.isdir(self.cachedir):
+            os.makedirs(self.cachedir)
+        self.hits = 0
+        self.misses = 0
+        self.timesaved = 0.0
+        self._unpicklable = set()
+        #: Whether writing a snapshot failed, it is only reported once
+        self._writefailed = False
+
+    def _snapshotname(self, filename, storeclass):
+        import hashlib
+        key = "\0".join([filename, _classname(storeclass)])
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cachedir, name + ".pickle")
+
+    def _fileinfo(self, filename, storeclass, contenthash=None):
+        """Returns the information a snapshot of the file is keyed on."""
+        filestat = os.stat(filename)
+        return {
+            "path": filename,
+            "size": filestat.st_size,
+            "mtime": filestat.st_mtime_ns,
+            "hash": contenthash,
+            "class": _classname(storeclass),
+            "version": (toolkitversion.sver, toolkitversion.build),
+        }
+
+    def getstore(self, filename, storeclass):
+        """Returns the cached store for the file, or None if there is no valid
+        snapshot.
+        """
+        import pickle
+        filename = os.path.abspath(filename)
+        start = time.time()
+        snapshot = self._snapshotname(filename, storeclass)
+        try:
+            with open(snapshot, 'rb') as snapshotfile:
+                info = pickle.load(snapshotfile)
+                expected = self._fileinfo(filename, storeclass, info.get("hash"))
+                parsetime = info.pop("parsetime", 0.0)
+                if info != expected or info["hash"] != _hashfile(filename):
+                    self.misses += 1
+                    return None
+                store = pickle.load(snapshotfile)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.debug("ignoring unusable snapshot %s: %s", snapshot, e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.timesaved += parsetime - (time.time() - start)
+        logger.debug("loaded %s from the store cache", filename)
+        return store
+
+    def putstore(self, filename, storeclass, store, parsetime):
+        """Stores a snapshot of the store parsed from the file."""
+        if storeclass in self._unpicklable:
+            return
+        import pickle
+        import tempfile
+        filename = os.path.abspath(filename)
+        info = self._fileinfo(filename, storeclass, _hashfile(filename))
+        info["parsetime"] = parsetime
+        snapshot = self._snapshotname(filename, storeclass)
+        tmpname = None
+        try:
+            handle, tmpname = tempfile.mkstemp(dir=self.cachedir,
+                                               suffix=".tmp")
+            with os.fdopen(handle, 'wb') as snapshotfile:
+                pickle.dump(info, snapshotfile, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(store, snapshotfile, pickle.HIGHEST_PROTOCOL)
+            # Atomic, several tools can share the cache at the same time
+            os.replace(tmpname, snapshot)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug("can not cache stores of %s: %s",
+                         _classname(storeclass), e)
+            self._unpicklable.add(storeclass)
+            os.unlink(tmpname)
+        except OSError as e:
+            # The cache only saves time, the store was parsed fine
+            if not self._writefailed:
+                logger.warning("can not write to the store cache %s: %s",
+                               self.cachedir, e)
+                self._writefailed = True
+            if tmpname is not None and os.path.exists(tmpname):
+                os.unlink(tmpname)
+
+    def logsummary(self):
+        """Logs the hit rate and time saved by the cache."""
+        lookups = self.hits + self.misses
+        if lookups:
+            logger.info("%d of %d stores loaded from the cache (%.0f%%), "
+                        "saved %.2fs of parsing",
+                        self.hits, lookups, 100.0 * self.hits / lookups,
+                        self.timesaved)
+
+
+_default_cache = None
+_default_cache_set = False
+
+
+def set_default_cache(cachedir):
+    """Sets the directory of the cache used by
+    :func:`~translate.storage.factory.getobject`, None disables the cache.
+    """
+    global _default_cache, _default_cache_set
+    _default_cache_set = True
+    if cachedir:
+        _default_cache = StoreCache(cachedir)
+        atexit.register(_default_cache.logsummary)
+    else:
+        _default_cache = None
+    return _default_cache
+
+
+def get_default_cache():
+    """Returns the cache used by :func:`~translate.storage.factory.getobject`
+    if it was enabled, otherwise None.
+    """
+    if not _default_cache_set:
+        cachedir = os.environ.get(CACHE_ENVIRONMENT_VARIABLE)
+        # Make the summary visible with the default logging setup of the tools
+        if cachedir:
+            logger.setLevel(logging.INFO)
+        try:
+            set_default_cache(cachedir)
+        except OSError as e:
+            logger.warning("can not use the store cache %s: %s", cachedir, e)
+            set_default_cache(None)
+    return _default_cache
@@ -236,6 +236,31 @@ class TestTranslationStore:
         assert store.findunit("Blessed String") == unit2
         assert store.findunit("Nest String") is None
 
+    def test_find_updated_index(self):
+        """Tests that searching keeps working while units change"""
+        store = self.StoreClass()
+        unit1 = store.addsourceunit("Test String")
+        assert store.findunit("Test String") == unit1
+        assert store.linear_scans == 0
+        unit2 = store.addsourceunit("Blessed String")
+        assert store.findunit("Blessed String") == unit2
+        unit2.source = "Cursed String"
+        assert store.findunit("Blessed String") is None
+        assert store.findunit("Cursed String") == unit2
+        store.removeunit(unit1)
+        assert store.findunit("Test String") is None
+        assert store.findunit("Cursed String") == unit2
+        assert store.linear_scans == 0
+
+    def test_find_units_changed(self):
+        """Tests that changing the units directly is detected"""
+        store = self.StoreClass()
+        unit1 = store.addsourceunit("Test String")
+        assert store.findunit("Test String") == unit1
+        store.units.remove(unit1)
+        assert store.findunit("Test String") is None
+        assert store.linear_scans == 1
+
     def test_translate(self):
         """Tests the translate method and non-ascii characters."""
         store = self.StoreClass()
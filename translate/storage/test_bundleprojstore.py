@@ -0,0 +1,71 @@
+from io import BytesIO
+from zipfile import ZipFile
+
+from translate.storage.bundleprojstore import BundleProjectStore
+
+
+def test_append_and_reopen(tmpdir):
+    bundlename = str(tmpdir.join("bundle.zip"))
+    bundle = BundleProjectStore(bundlename)
+    bundle.append_file(BytesIO(b"source"), "a.txt", ftype="src")
+    bundle.append_file(BytesIO(b"translation"), "a.po")
+    bundle.close()
+
+    bundle = BundleProjectStore(bundlename)
+    assert list(bundle.sourcefiles) == ["sources/a.txt"]
+    assert bundle.get_file("trans/a.po").read() == b"translation"
+    bundle.close()
+
+
+def test_update_appends(tmpdir):
+    """updating a file appends it, the other files stay where they are"""
+    bundlename = str(tmpdir.join("bundle.zip"))
+    bundle = BundleProjectStore(bundlename)
+    bundle.append_file(BytesIO(b"source" * 100), "a.txt", ftype="src")
+    bundle.append_file(BytesIO(b"translation"), "a.po")
+    offset = bundle.zip.getinfo("sources/a.txt").header_offset
+    bundle.update_file("trans/a.po", BytesIO(b"updated"))
+    assert bundle.zip.getinfo("sources/a.txt").header_offset == offset
+    bundle.save()
+    assert bundle.zip.getinfo("sources/a.txt").header_offset == offset
+    bundle.close()
+
+    bundle = BundleProjectStore(bundlename)
+    assert bundle.get_file("trans/a.po").read() == b"updated"
+    bundle.close()
+
+
+def test_remove_compacts(tmpdir):
+    bundlename = str(tmpdir.join("bundle.zip"))
+    bundle = BundleProjectStore(bundlename)
+    bundle.append_file(BytesIO(b"source"), "a.txt", ftype="src")
+    bundle.append_file(BytesIO(b"translation"), "a.po")
+    bundle.remove_file("trans/a.po")
+    assert "trans/a.po" not in bundle.transfiles
+    # The removed file can be added again before the bundle is compacted
+    bundle.append_file(BytesIO(b"again"), "a.po")
+    bundle.remove_file("trans/a.po")
+    bundle.close()
+
+    with ZipFile(bundlename) as zipfile:
+        names = zipfile.namelist()
+    assert sorted(names) == ["project.xtp", "sources/a.txt"]
+    bundle = BundleProjectStore(bundlename)
+    assert not bundle.transfiles
+    bundle.close()
+
+
+def test_compactratio(tmpdir):
+    """the bundle is compacted when replaced files take too much space"""
+    bundlename = str(tmpdir.join("bundle.zip"))
+    bundle = BundleProjectStore(bundlename)
+    bundle.append_file(BytesIO(b"first"), "a.po")
+    for number in range(20):
+        bundle.update_file("trans/a.po", BytesIO(b"version %d" % number))
+        wasted, total = bundle._wastedsize()
+        assert wasted <= bundle.compactratio * total
+    bundle.compact()
+    assert len(bundle.zip.infolist()) == len(set(bundle.zip.namelist()))
+    bundle.close()
+    with ZipFile(bundlename) as zipfile:
+        assert zipfile.read("trans/a.po") == b"version 19"
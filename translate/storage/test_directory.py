@@ -81,3 +81,73 @@ class TestDirectory:
         for unit in d.getunits():
             assert unit.target == "blabla"
         assert len(d.getunits()) == 3
+
+    def test_include_exclude(self):
+        """Tests the include and exclude patterns."""
+        self.touchfiles(self.testdir, ["a.po", "b.pot", "c.xlf"])
+        self.mkdir("bla")
+        self.touchfiles(os.path.join(self.testdir, "bla"), ["d.po"])
+        self.mkdir("CVS")
+        self.touchfiles(os.path.join(self.testdir, "CVS"), ["e.po"])
+
+        d = directory.Directory(self.testdir, includes=["*.po", "*.pot"],
+                                excludes=["CVS", "b.*"])
+        assert d.getfiles() == [(self.testdir, "a.po"),
+                                (os.path.join(self.testdir, "bla"), "d.po")]
+
+    def test_order(self):
+        """Tests that files are listed in a deterministic order."""
+        files = ["c.po", "a.po", "b.po"]
+        self.touchfiles(self.testdir, files)
+        for dirname in ["z", "y"]:
+            self.mkdir(dirname)
+            self.touchfiles(os.path.join(self.testdir, dirname), files)
+
+        d = directory.Directory(self.testdir)
+        dirnames = [self.testdir, os.path.join(self.testdir, "y"),
+                    os.path.join(self.testdir, "z")]
+        assert d.getfiles() == [(dirname, name)
+                                for dirname in dirnames
+                                for name in ["a.po", "b.po", "c.po"]]
+
+    def writepofiles(self, count):
+        for i in range(count):
+            posource = 'msgid "bla%d"\nmsgstr "blabla%d"\n' % (i, i)
+            self.touchfiles(self.testdir, ["%02d.po" % i], posource)
+
+    def test_store_cache(self):
+        """Tests that unchanged files are not parsed again."""
+        self.writepofiles(3)
+        d = directory.Directory(self.testdir, cachesize=2)
+        stores = list(d.store_iter())
+        assert len(stores) == 3
+        # Only the last two stores are kept
+        cached = list(d.store_iter())
+        assert cached[0] is not stores[0]
+        assert cached[1:] == stores[1:]
+        assert len(d._stores) == 2
+
+    def test_store_cache_changed(self):
+        """Tests that changed files are parsed again."""
+        self.writepofiles(1)
+        d = directory.Directory(self.testdir)
+        store = next(d.store_iter())
+        filename = os.path.join(self.testdir, "00.po")
+        filestat = os.stat(filename)
+        self.touchfiles(self.testdir, ["00.po"], 'msgid "bla"\nmsgstr "changed"\n')
+        os.utime(filename, ns=(filestat.st_atime_ns,
+                               filestat.st_mtime_ns + 10 ** 9))
+        assert [unit.target for unit in d.getunits()] == ["changed"]
+        assert next(d.store_iter()) is not store
+
+    def test_jobs(self):
+        """Tests that parsing in processes yields the units in order."""
+        self.writepofiles(6)
+        self.touchfiles(self.testdir, ["06.xlf"], '''<?xml version="1.0"?>
+<xliff version="1.1" xmlns="urn:oasis:names:tc:xliff:document:1.1">
+<file original="test" source-language="en" datatype="plaintext"><body>
+<trans-unit id="1"><source>bla6</source><target>blabla6</target></trans-unit>
+</body></file></xliff>''')
+        d = directory.Directory(self.testdir, jobs=3)
+        assert [unit.target for unit in d.getunits()] == [
+            "blabla%d" % i for i in range(7)]
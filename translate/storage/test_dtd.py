@@ -21,6 +21,7 @@ from io import BytesIO
 from pytest import mark
 
 
+from translate.misc import quote
 from translate.storage import dtd, test_monolingual
 
 
@@ -176,6 +177,55 @@ def test_removeinvalidamp(recwarn):
     assert recwarn.pop(UserWarning)
 
 
+def test_extractcomment():
+    """Test that comment extraction matches quote.extract"""
+    lines = [
+        '<!-- comment -->\n',
+        'text <!-- comment -->\n',
+        '<!-- open comment\n',
+        'closed comment -->\n',
+        '<!-- one --> and <!-- two -->\n',
+        '<!-- one --><!-- two\n',
+        '<!-->\n',
+        '--> <!-- -->\n',
+        'no comment\n',
+    ]
+    for line in lines:
+        for incomment in (False, True):
+            assert (dtd._extractcomment(line, incomment) ==
+                    quote.extract(line, "<!--", "-->", None, incomment))
+
+
+def test_extractdefinition():
+    """Test that definition extraction matches quote.extract"""
+    sources = [
+        '"value">\n',
+        '"value\n',
+        '"">\n',
+        'end of value">\n',
+        'value" "other">\n',
+        'value"" more\n',
+        'value" "open\n',
+        'no quote\n',
+    ]
+    for source in sources:
+        for instring in (False, True):
+            if not instring and source[0] != '"':
+                continue
+            assert (dtd._extractdefinition(source, '"', instring) ==
+                    quote.extract(source, '"', '"', startinstring=instring,
+                                  allowreentry=False))
+
+
+def test_getcommenttype():
+    """Test working out the type of a comment"""
+    assert dtd._getcommenttype("<!-- plain -->") == "comment"
+    assert dtd._getcommenttype("<!-- LOCALIZATION NOTE FILE: x -->") == "locfile"
+    assert dtd._getcommenttype("<!-- LOCALIZATION NOTE BEGIN x -->") == "locgroupstart"
+    assert dtd._getcommenttype("<!-- LOCALIZATION NOTE   END -->") == "locgroupend"
+    assert dtd._getcommenttype("<!-- LOCALIZATION NOTE (x): -->") == "locnote"
+
+
 class TestDTDUnit(test_monolingual.TestMonolingualUnit):
     UnitClass = dtd.dtdunit
 
@@ -334,6 +384,21 @@ certificate.">
         print(dtdregen)
         assert dtdsource == dtdregen
 
+    def test_many_entities(self):
+        """checks that units are split correctly in a larger file"""
+        dtdsource = ''.join(
+            '<!-- LOCALIZATION NOTE (entity%d.label): note -->\n'
+            '<!ENTITY entity%d.label "Label %d">\n'
+            '<!ENTITY entity%d.accesskey "L">\n'
+            '\n'
+            '<!ENTITY entity%d.text "multiline\n  text">\n' % ((i,) * 5)
+            for i in range(100))
+        dtdfile = self.dtdparse(dtdsource)
+        assert len(dtdfile.units) == 300
+        assert dtdfile.units[-1].entity == "entity99.text"
+        assert dtdfile.units[-1].source == "multiline\n  text"
+        assert bytes(dtdfile).decode('utf-8') == dtdsource
+
     @mark.xfail(reason="Not Implemented")
     def test_comment_following(self):
         """check that comments that appear after and entity are not pushed onto another line"""
@@ -366,6 +431,13 @@ certificate.">
         assert len(dtdfile.units) == 1
         assert recwarn.pop(Warning)
 
+    def test_invalid_byte(self, recwarn):
+        """test that entities after an undecodable line are still parsed"""
+        dtdsource = b'<!ENTITY a "A">\n<!ENTITY b "B\xff">\n<!ENTITY c "C">\n'
+        dtdfile = dtd.dtdfile(BytesIO(dtdsource))
+        assert [unit.entity for unit in dtdfile.units] == ["c"]
+        assert recwarn.pop(Warning)
+
     # Test for bug #68
     def test_entity_escaping(self):
         """Test entities escaping (&amp; &quot; &lt; &gt; &apos;) (bug #68)"""
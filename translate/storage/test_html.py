@@ -19,6 +19,8 @@
 
 """Tests for the HTML classes"""
 
+from io import BytesIO
+
 from pytest import raises
 
 from translate.storage import base, html
@@ -55,6 +57,21 @@ def test_normalize_html():
 def test_pi_escaping():
     h = html.htmlfile()
     assert h.pi_escape('<a href="<?=($a < $b ? $foo : ($b > c ? $bar : $cat))?>">') == '<a href="<?=($a %lt; $b ? $foo : ($b %gt; c ? $bar : $cat))?>">'
+    # Only instructions that change are remembered for unescaping
+    assert h.pi_escape('<?php echo $a; ?>') == '<?php echo $a; ?>'
+    assert list(h.pidict.values()) == [
+        '=($a < $b ? $foo : ($b > c ? $bar : $cat))']
+
+
+def test_callback():
+    """the blocks and the text outside blocks go through the callback"""
+    h = html.htmlfile(inputfile=BytesIO(b"<html><head><title>A title</title>"
+                                        b"</head><body><p>First\nline</p>"
+                                        b"text</body></html>"),
+                      callback=lambda text: text.upper())
+    assert h.filesrc == ("<html><head><title>A TITLE</title></head><body>"
+                         "<p>FIRST LINE</p>TEXT</body></html>")
+    assert [unit.source for unit in h.units] == ["A title", "First line"]
 
 
 class TestHTMLParsing:
@@ -2,8 +2,9 @@ import os
 import os.path
 import shutil
 
-from translate.filters import checks
-from translate.storage import factory, statsdb
+from translate.filters import checkcache, checks
+from translate.lang import factory as factory_lang
+from translate.storage import factory, po, statsdb
 
 
 fr_terminology_extract = r"""
@@ -72,6 +73,26 @@ msgstr ""
 """
 
 
+def test_wordcount():
+    """the fast paths count like the three substitutions they replace"""
+    from translate.storage.benchmark import reference_wordcount
+    for string in [u"", u"One two three", u"Line<br/>break", u"<b>Bold</b>",
+                   u"a<b>c</b>d", u"3.14 and end.Next", u"a.b", u"(a.b)",
+                   u"a  .b", u"Ellipsis... and — dash", u"¿Qué?",
+                   u"x <br > y.<i>z</i>"]:
+        assert statsdb.wordcount(string) == reference_wordcount(string)
+    assert statsdb.wordcounts([u"One", u"Two words", u"One"]) == [1, 2, 1]
+
+
+def test_wordsinunit_targetlang():
+    unit = po.pounit(u"Hello world .")
+    # Armenian punctuation is only punctuation in Armenian
+    unit.target = u"Բարեւ աշխարհ ։"
+    assert statsdb.wordsinunit(unit) == (2, 3)
+    assert statsdb.wordsinunit(unit, "hy") == (2, 2)
+    assert statsdb.wordsinunit(unit, factory_lang.getlanguage("hy")) == (2, 2)
+
+
 class TestStatsDb:
 
     def remove_dirs(self, path):
@@ -147,3 +168,90 @@ class TestStatsDb:
         assert cache1 == cache2
         cache1.close()
         cache2.close()
+
+    def test_prime(self):
+        f, cache = self.setup_file_and_db(jtoolkit_extract)
+        filenames = [f.filename]
+        for n in range(3):
+            filename = os.path.join(self.path, "test%d.po" % n)
+            with open(filename, "w") as fh:
+                fh.write(fr_terminology_extract)
+            filenames.append(filename)
+        missing = os.path.join(self.path, "missing.po")
+        assert cache.prime(filenames + [missing], jobs=2) == 4
+        fileid = self.make_file_and_return_id(cache, f.filename)[0]
+        totals = cache.filetotals(f.filename)
+        assert self.make_file_and_return_id(cache, f.filename)[0] == fileid
+        assert totals["translated"] == 3
+        assert totals["fuzzy"] == 2
+        assert totals["untranslated"] == 1
+        assert cache.unitstats(f.filename)["sourcewordcount"] == [3, 8, 11, 2, 9, 3]
+        # Only changed files are counted again
+        assert cache.prime(filenames) == 0
+        with open(filenames[1], "a") as fh:
+            fh.write('\nmsgid "new"\nmsgstr ""\n')
+        assert cache.prime(filenames) == 1
+        assert cache.filetotals(filenames[1])["untranslated"] == 1
+        cache.close()
+
+    def test_contenthash(self):
+        f, cache = self.setup_file_and_db(jtoolkit_extract)
+        cache.contenthash = True
+        assert cache.prime([f.filename]) == 1
+        fileid = self.make_file_and_return_id(cache, f.filename)[0]
+        # A new modification time with the same content keeps the statistics
+        mtime = os.stat(f.filename).st_mtime + 10
+        os.utime(f.filename, (mtime, mtime))
+        assert cache.filetotals(f.filename)["translated"] == 3
+        assert self.make_file_and_return_id(cache, f.filename)[:2] == \
+            (fileid, mtime)
+        # Different content of the same size is counted again
+        with open(f.filename, "w") as fh:
+            fh.write(jtoolkit_extract.replace("Verlaat", "verlaat"))
+        os.utime(f.filename, (mtime + 10, mtime + 10))
+        assert cache.prime([f.filename]) == 1
+        assert self.make_file_and_return_id(cache, f.filename)[0] != fileid
+        # Without content hashes only the modification time counts
+        cache.contenthash = False
+        os.utime(f.filename, (mtime + 20, mtime + 20))
+        assert cache.prime([f.filename]) == 1
+        cache.close()
+
+    def test_root(self):
+        original = os.path.join(self.path, "original")
+        os.makedirs(original)
+        with open(os.path.join(original, "test.po"), "w") as fh:
+            fh.write(jtoolkit_extract)
+        cache = statsdb.StatsCache(os.path.join(self.path, "stats.db"))
+        cache.contenthash = True
+        cache.root = original
+        assert cache.prime([os.path.join(original, "test.po")]) == 1
+        paths = [row[0] for row in cache.cur.execute("SELECT path FROM files")]
+        assert paths == ["test.po"]
+        # A copy with new modification times uses the same statistics
+        copy = os.path.join(self.path, "copy")
+        shutil.copytree(original, copy, copy_function=shutil.copyfile)
+        cache.root = copy
+        assert cache.prime([os.path.join(copy, "test.po")]) == 0
+        assert cache.filetotals(os.path.join(copy, "test.po"))["fuzzy"] == 2
+        cache.close()
+
+    def test_filechecks_checkcache(self):
+        checkcache.set_default_cache(os.path.join(self.path, "checks.db"))
+        try:
+            f, cache = self.setup_file_and_db(jtoolkit_extract)
+            checker = checks.StandardChecker()
+            first = cache.filechecks(f.filename, checker)
+            checkresults = checkcache.get_default_cache()
+            assert (checkresults.hits, checkresults.misses) == (0, 6)
+            # Only the changed unit is checked again
+            with open(f.filename, "w") as fh:
+                fh.write(jtoolkit_extract.replace("Verlaat toepassing",
+                                                  "verlaat toepassing"))
+            second = cache.filechecks(f.filename, checker)
+            assert (checkresults.hits, checkresults.misses) == (5, 7)
+            assert "check-startcaps" not in first
+            assert second["check-startcaps"] == [4]
+            cache.close()
+        finally:
+            checkcache.set_default_cache(None)
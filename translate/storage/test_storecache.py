@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+from io import BytesIO
+
+from translate.storage import factory, storecache
+
+
+POSOURCE = u'''msgid "Hello"
+msgstr "Hallo"
+
+msgid "World"
+msgstr "Wêreld"
+'''.encode('utf-8')
+
+
+class TestStoreCache:
+
+    def setup_method(self, method):
+        """sets up a test directory with a cache directory"""
+        self.testdir = "%s_testdir" % (self.__class__.__name__)
+        self.teardown_method(method)
+        os.mkdir(self.testdir)
+        self.cachedir = os.path.join(self.testdir, "cache")
+        self.cache = storecache.set_default_cache(self.cachedir)
+
+    def teardown_method(self, method):
+        """removes the test directory and disables the cache"""
+        storecache.set_default_cache(None)
+        if os.path.exists(self.testdir):
+            shutil.rmtree(self.testdir)
+
+    def writefile(self, name, content):
+        filename = os.path.join(self.testdir, name)
+        with open(filename, 'wb') as fileobj:
+            fileobj.write(content)
+        return filename
+
+    def test_disabled(self):
+        storecache.set_default_cache(None)
+        filename = self.writefile("test.po", POSOURCE)
+        factory.getobject(filename)
+        assert self.cache.hits == self.cache.misses == 0
+
+    def test_hit(self):
+        filename = self.writefile("test.po", POSOURCE)
+        store = factory.getobject(filename)
+        assert (self.cache.hits, self.cache.misses) == (0, 1)
+        cached = factory.getobject(filename)
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+        assert cached is not store
+        assert cached.filename == filename
+        assert bytes(cached) == bytes(store)
+        assert cached.findunit("World").target == u"Wêreld"
+        assert cached.units[1]._store is cached
+
+    def test_hit_fileobj(self):
+        filename = self.writefile("test.po", POSOURCE)
+        factory.getobject(filename)
+        with open(filename, 'rb') as fileobj:
+            cached = factory.getobject(fileobj)
+        assert self.cache.hits == 1
+        assert cached.filename == filename
+        assert cached.units[1].target == u"Wêreld"
+
+    def test_named_memory_file(self):
+        """in-memory files are parsed even if a file with their name is
+        cached"""
+        filename = self.writefile("test.po", POSOURCE)
+        factory.getobject(filename)
+        memoryfile = BytesIO(POSOURCE.replace(b"Hallo", b"Goeie dag"))
+        memoryfile.name = filename
+        store = factory.getobject(memoryfile)
+        assert self.cache.hits == 0
+        assert store.units[0].target == "Goeie dag"
+        assert factory.getobject(filename).units[0].target == "Hallo"
+        assert self.cache.hits == 1
+
+    def test_changed_file(self):
+        filename = self.writefile("test.po", POSOURCE)
+        factory.getobject(filename)
+        self.writefile("test.po", POSOURCE.replace(b"Hallo", b"Goeie dag"))
+        store = factory.getobject(filename)
+        assert (self.cache.hits, self.cache.misses) == (0, 2)
+        assert store.units[0].target == "Goeie dag"
+        assert factory.getobject(filename).units[0].target == "Goeie dag"
+        assert self.cache.hits == 1
+
+    def test_same_metadata_changed_content(self):
+        """a snapshot is only used if the content is unchanged"""
+        filename = self.writefile("test.po", POSOURCE)
+        factory.getobject(filename)
+        filestat = os.stat(filename)
+        self.writefile("test.po", POSOURCE.replace(b"Hallo", b"Hallx"))
+        os.utime(filename, ns=(filestat.st_atime_ns, filestat.st_mtime_ns))
+        store = factory.getobject(filename)
+        assert self.cache.hits == 0
+        assert store.units[0].target == "Hallx"
+
+    def test_unwritable_cache(self, caplog):
+        """stores are loaded even if the cache can't be written to"""
+        filename = self.writefile("test.po", POSOURCE)
+        shutil.rmtree(self.cachedir)
+        for i in range(2):
+            store = factory.getobject(filename)
+            assert store.units[1].target == u"Wêreld"
+        assert self.cache.hits == 0
+        assert caplog.text.count("can not write to the store cache") == 1
+        assert [name for name in os.listdir(self.testdir)] == ["test.po"]
+
+    def test_unpicklable_store(self):
+        """stores that can't be pickled are simply parsed every time"""
+        filename = self.writefile("test.xlf", b'''<?xml version="1.0"?>
+<xliff version="1.1" xmlns="urn:oasis:names:tc:xliff:document:1.1">
+<file original="test" source-language="en" datatype="plaintext"><body>
+<trans-unit id="1"><source>Hello</source><target>Hallo</target></trans-unit>
+</body></file></xliff>''')
+        for i in range(2):
+            store = factory.getobject(filename)
+            assert store.units[0].target == "Hallo"
+        assert self.cache.hits == 0
+        assert os.listdir(self.cachedir) == []
@@ -84,3 +84,39 @@ class TestZIPFile:
             assert len(d.getunits()) == 3
         finally:
             d.close()
+
+
+def test_copymembers(tmpdir):
+    """members are copied in order, with their compression, without
+    replaced, excluded and superseded members
+    """
+    import warnings
+    from zipfile import ZIP_DEFLATED, ZIP_STORED
+
+    inputname = str(tmpdir.join("input.zip"))
+    with ZipFile(inputname, "w") as input_zip:
+        input_zip.writestr("mimetype", "application/test",
+                           compress_type=ZIP_STORED)
+        input_zip.writestr("content.xml", "<old/>", compress_type=ZIP_DEFLATED)
+        input_zip.writestr("styles.xml", "<styles/>",
+                           compress_type=ZIP_DEFLATED)
+        input_zip.writestr("unwanted", "unwanted")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            input_zip.writestr("styles.xml", "<newstyles/>",
+                               compress_type=ZIP_DEFLATED)
+
+    outputname = str(tmpdir.join("output.zip"))
+    with ZipFile(inputname) as input_zip, \
+            ZipFile(outputname, "w") as output_zip:
+        zip.copymembers(input_zip, output_zip,
+                        replacements={"content.xml": b"<new/>"},
+                        exclude=["unwanted"])
+
+    with ZipFile(outputname) as output_zip:
+        assert output_zip.namelist() == ["mimetype", "content.xml",
+                                         "styles.xml"]
+        assert output_zip.getinfo("mimetype").compress_type == ZIP_STORED
+        assert output_zip.getinfo("content.xml").compress_type == ZIP_DEFLATED
+        assert output_zip.read("content.xml") == b"<new/>"
+        assert output_zip.read("styles.xml") == b"<newstyles/>"
@@ -145,6 +145,7 @@ class UtxUnit(base.TranslationUnit):
     def source(self, source):
         self._rich_source = None
         self._set_field('src', source)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
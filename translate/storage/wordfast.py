@@ -336,6 +336,7 @@ class WordfastUnit(base.TranslationUnit):
     def source(self, source):
         self._rich_source = None
         self._set_source_or_target('source', source)
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -280,6 +280,12 @@ class IdMaker:
     def has_id(self, obj):
         return obj in self._obj_id_map
 
+    def forget(self):
+        """Forget the objects that were given ids, new objects still get new
+        ids.
+        """
+        self._obj_id_map = {}
+
 
 def _to_placeables(parent_translatable, translatable, id_maker):
     """Convert the translatable object to a list of strings and XLIFF
@@ -299,12 +305,12 @@ def _to_placeables(parent_translatable, translatable, id_maker):
     return result
 
 
-def _make_store_adder(store):
+def _make_store_adder(store, id_maker=None):
     """Return a function which, when called with a Translatable will add
     a unit to 'store'. The placeables will be represented as strings according
     to 'placeable_quoter'.
     """
-    id_maker = IdMaker()
+    id_maker = id_maker or IdMaker()
 
     def add_translatable_to_store(parent_translatable, translatable):
         """Construct a new translation unit, set its source and location
@@ -407,3 +413,116 @@ def build_store(odf_file, store, parse_state, store_adder=None):
     translatables = find_translatable_dom_nodes(root, parse_state)
     _walk_translatable_tree(translatables, store_adder, None)
     return tree
+
+
+def _free_dom_node(dom_node):
+    """Free a processed DOM node and its preceding siblings."""
+    dom_node.clear()
+    parent = dom_node.getparent()
+    if parent is not None:
+        while dom_node.getprevious() is not None:
+            del parent[0]
+
+
+def _has_text(text):
+    return text is not None and text.strip() != u""
+
+
+def _find_text_elements(xml_file, parse_state):
+    """Return which elements of the XML file, in document order, will have
+    translatable text in their :class:`Translatable`.
+
+    This is known once an element and the tails of its children are parsed,
+    the DOM nodes are freed as soon as they were checked.
+    """
+    text_elements = bytearray()
+    # The indexes of the enclosing elements, and whether they have text
+    enclosing = []
+    for event, dom_node in etree.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            if enclosing:
+                # The tails of the preceding siblings are complete
+                for sibling in dom_node.itersiblings(preceding=True):
+                    enclosing[-1][1] = (enclosing[-1][1] or
+                                        _has_text(sibling.tail))
+                parent = dom_node.getparent()
+                while dom_node.getprevious() is not None:
+                    del parent[0]
+            enclosing.append([len(text_elements), False])
+            text_elements.append(False)
+            continue
+        index, has_text = enclosing.pop()
+        namespace, tag = misc.parse_tag(dom_node.tag)
+        if (namespace, tag) not in parse_state.no_translate_content_elements:
+            text_elements[index] = (
+                has_text or _has_text(dom_node.text) or
+                any(_has_text(child.tail) for child in dom_node))
+        # The tail may be parsed already, the parent still needs it
+        del dom_node[:]
+    return text_elements
+
+
+def iter_translatables(xml_file, parse_state):
+    """Yield the outermost translatables of the given XML file that have
+    translatable text, while the file is parsed.
+
+    Walking these translatables adds the same units as walking the
+    translatables of :func:`find_translatable_dom_nodes` on the whole DOM.
+    The file is read twice: once to find the elements with text, then to
+    build every translatable once its DOM node is complete.  Processed DOM
+    nodes are freed after the translatable was used, so only one
+    translatable subtree is kept in memory at a time.
+    """
+    text_elements = _find_text_elements(xml_file, parse_state)
+    xml_file.seek(0)
+    index = 0
+    # The DOM node of the translatable being parsed
+    translatable_node = None
+    # The placeable names and inline status of the enclosing DOM nodes
+    enclosing = []
+    for event, dom_node in etree.iterparse(xml_file, events=("start", "end")):
+        if translatable_node is not None and dom_node is not translatable_node:
+            continue
+        if event == "start":
+            if not enclosing:
+                parse_state.nsmap = reverse_map(dom_node.nsmap)
+            # The same state as parse_status_set gives the DOM node
+            namespace, tag = misc.parse_tag(dom_node.tag)
+            parse_state.xpath_breadcrumb.start_tag(
+                compact_tag(parse_state.nsmap, namespace, tag))
+            enclosing.append((parse_state.placeable_name,
+                              parse_state.is_inline))
+            parse_state.placeable_name = tag
+            parse_state.is_inline = ((namespace, tag) in
+                                     parse_state.inline_elements)
+            if text_elements[index]:
+                translatable_node = dom_node
+            else:
+                # Elements without text are skipped like their translatables
+                # would be, the children are looked at one by one
+                index += 1
+            continue
+        if dom_node is translatable_node:
+            for translatable in process_translatable(dom_node, parse_state):
+                yield translatable
+            # Skip the indexes of the elements of the subtree
+            index += sum(1 for _node in dom_node.iter(etree.Element))
+            translatable_node = None
+        parse_state.placeable_name, parse_state.is_inline = enclosing.pop()
+        parse_state.xpath_breadcrumb.end_tag()
+        _free_dom_node(dom_node)
+
+
+def build_store_incrementally(xml_file, store, parse_state, store_adder=None):
+    """Build a store for the given XML file, like :func:`build_store`, while
+    the file is parsed.
+
+    The units are added as every translatable is parsed, see
+    :func:`iter_translatables`, without keeping the DOM in memory.
+    """
+    id_maker = IdMaker()
+    store_adder = store_adder or _make_store_adder(store, id_maker)
+    for translatable in iter_translatables(xml_file, parse_state):
+        _walk_translatable_tree([translatable], store_adder, None)
+        # A translatable is only given an id once, the processed ones can go
+        id_maker.forget()
@@ -0,0 +1,45 @@
+from io import BytesIO
+
+from translate.storage import xliff
+from translate.storage.odf_shared import (inline_elements,
+                                          no_translate_content_elements)
+from translate.storage.xml_extract import extract
+
+
+ODF_CONTENT = b'''<?xml version="1.0" encoding="UTF-8"?>
+<office:document-content
+    xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+    xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+    office:version="1.2">
+  <office:body>
+    <office:text>
+      <text:h text:outline-level="1">A heading</text:h>
+      <text:p>Some <text:span>inline</text:span> text<text:note><text:note-body><text:p>A note</text:p></text:note-body></text:note> after the note.</text:p>
+      <text:p><text:span>Only a span</text:span></text:p>
+      <text:list><text:list-item><text:p>An item</text:p></text:list-item></text:list>
+      <text:p>   </text:p>
+      <text:p>Last</text:p>
+    </office:text>
+  </office:body>
+</office:document-content>
+'''
+
+
+def build(build_function):
+    store = xliff.xlifffile()
+    parse_state = extract.ParseState(no_translate_content_elements,
+                                     inline_elements)
+    build_function(BytesIO(ODF_CONTENT), store, parse_state)
+    return store
+
+
+def test_build_store_incrementally():
+    """the incremental build makes the same units as the DOM build"""
+    expected = build(extract.build_store)
+    store = build(extract.build_store_incrementally)
+    assert [unit.source for unit in store.units] == [
+        unit.source for unit in expected.units]
+    assert [unit.getid() for unit in store.units] == [
+        unit.getid() for unit in expected.units]
+    assert bytes(store) == bytes(expected)
+    assert len(store.units) > 4
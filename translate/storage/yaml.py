@@ -48,6 +48,7 @@ class YAMLUnit(base.TranslationUnit):
     @source.setter
     def source(self, source):
         self.target = source
+        self._reindex()
 
     # Deprecated on 2.3.1
     @deprecated("Use `source` property instead")
@@ -24,12 +24,58 @@
 
 # TODO: consider also providing directories as we currently provide files
 
-from zipfile import ZipFile
+import shutil
+from zipfile import ZipFile, ZipInfo
 
 from translate.misc import wStringIO
 from translate.storage import directory, factory
 
 
+COPY_BLOCKSIZE = 1 << 16
+"""The size of the blocks in which members are copied between archives"""
+
+
+def livemembers(archive):
+    """Returns the ZipInfo of the members of the archive in the order they are
+    stored, only the last member of names that were added several times.
+    """
+    return [info for info in archive.infolist()
+            if archive.getinfo(info.filename) is info]
+
+
+def _copyinfo(info):
+    """Returns a ZipInfo for writing a copy of the member."""
+    copied = ZipInfo(info.filename, info.date_time)
+    for attribute in ("compress_type", "comment", "extra", "create_system",
+                      "external_attr", "internal_attr", "file_size"):
+        setattr(copied, attribute, getattr(info, attribute))
+    return copied
+
+
+def copymembers(input_zip, output_zip, replacements=None, exclude=()):
+    """Copies the members of input_zip to output_zip in one sequential pass.
+
+    The members keep their order, compression and attributes, and are copied
+    in blocks, so output_zip can be a stream.
+
+    :param replacements: A dictionary with the new content of members, as
+                         bytes.
+    :param exclude: The names of members that are not copied.
+    """
+    replacements = replacements or {}
+    for info in livemembers(input_zip):
+        if info.filename in exclude:
+            continue
+        copied = _copyinfo(info)
+        if info.filename in replacements:
+            output_zip.writestr(copied, replacements[info.filename])
+            continue
+        with input_zip.open(info) as source, \
+                output_zip.open(copied, "w") as target:
+            shutil.copyfileobj(source, target, COPY_BLOCKSIZE)
+    return output_zip
+
+
 class ZIPFile(directory.Directory):
     """This class represents a ZIP file like a directory."""
 
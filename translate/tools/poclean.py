@@ -66,7 +66,7 @@ def runclean(inputfile, outputfile, templatefile):
     return True
 
 
-def main():
+def main(argv=None):
     from translate.convert import convert
     formats = {
         "po": ("po", runclean),
@@ -75,7 +75,7 @@ def main():
         None: ("po", runclean),
     }
     parser = convert.ConvertOptionParser(formats, usetemplates=False, description=__doc__)
-    parser.run()
+    parser.run(argv)
 
 
 if __name__ == '__main__':
@@ -71,7 +71,7 @@ def convertmo(inputfile, outputfile, templatefile, includefuzzy=False):
     return 1
 
 
-def main():
+def main(argv=None):
     from translate.convert import convert
     formats = {
         "po": ("mo", convertmo),
@@ -80,7 +80,7 @@ def main():
     }
     parser = convert.ConvertOptionParser(formats, usepots=False, description=__doc__)
     parser.add_fuzzy_option()
-    parser.run()
+    parser.run(argv)
 
 
 if __name__ == '__main__':
@@ -122,6 +122,23 @@ def calcstats(filename):
     return statscache.filetotals(filename, extended=True)
 
 
+def _initworker(statsfile):
+    """Makes a worker process of ``pocount --jobs`` use the stats cache of
+    the main process, every worker opens one connection to it.
+    """
+    statsdb.StatsCache.defaultfile = statsfile
+
+
+def _calcstats(filename):
+    """Returns the statistics of the file and None, or None and the error, in
+    a worker process.
+    """
+    try:
+        return dict(calcstats(filename)), None
+    except Exception as e:  # This happens if we have a broken file.
+        return None, str(e)
+
+
 def summarize(title, stats, style=style_full, indent=8, incomplete_only=False):
     """Print summary for a .po file in specified format.
 
@@ -247,7 +264,8 @@ def untranslatedmessages(units):
 
 class summarizer:
 
-    def __init__(self, filenames, style=default_style, incomplete_only=False):
+    def __init__(self, filenames, style=default_style, incomplete_only=False,
+                 jobs=1):
         self.totals = {}
         self.filecount = 0
         self.longestfilename = 0
@@ -264,13 +282,10 @@ Review Messages, Review Source Words""")
             for filename in filenames:  # find longest filename
                 if (len(filename) > self.longestfilename):
                     self.longestfilename = len(filename)
-        for filename in filenames:
-            if not os.path.exists(filename):
-                logger.error("cannot process %s: does not exist", filename)
-                continue
-            elif os.path.isdir(filename):
-                self.handledir(filename)
-            else:
+        if jobs > 1:
+            self.handlefilesinpool(list(self.iterfiles(filenames)), jobs)
+        else:
+            for filename in self.iterfiles(filenames):
                 self.handlefile(filename)
         if self.filecount > 1 and (self.style == style_full):
             if self.incomplete_only:
@@ -292,31 +307,72 @@ Review Messages, Review Source Words""")
                 self.totals[key] = 0
             self.totals[key] += stats[key]
 
+    def iterfiles(self, filenames):
+        """Iterates over the given files and the files in the given
+        directories.
+        """
+        for filename in filenames:
+            if not os.path.exists(filename):
+                logger.error("cannot process %s: does not exist", filename)
+                continue
+            elif os.path.isdir(filename):
+                yield from self.iterdir(filename)
+            else:
+                yield filename
+
+    def iterdir(self, dirname):
+        """Iterates over the files in the directory and its subdirectories."""
+        path, name = os.path.split(dirname)
+        if name in ["CVS", ".svn", "_darcs", ".git", ".hg", ".bzr"]:
+            return
+        for entry in os.listdir(dirname):
+            pathname = os.path.join(dirname, entry)
+            if os.path.isdir(pathname):
+                yield from self.iterdir(pathname)
+            else:
+                yield pathname
+
+    def handlestats(self, filename, stats):
+        """Adds the statistics of the file to the totals and prints them."""
+        self.updatetotals(stats)
+        self.complete_count += summarize(filename, stats, self.style,
+                                         self.longestfilename,
+                                         self.incomplete_only)
+        self.filecount += 1
+
     def handlefile(self, filename):
         try:
-            stats = calcstats(filename)
-            self.updatetotals(stats)
-            self.complete_count += summarize(filename, stats, self.style,
-                                             self.longestfilename,
-                                             self.incomplete_only)
-            self.filecount += 1
+            self.handlestats(filename, calcstats(filename))
         except Exception:  # This happens if we have a broken file.
             logger.error(sys.exc_info()[1])
 
-    def handlefiles(self, dirname, filenames):
-        for filename in filenames:
-            pathname = os.path.join(dirname, filename)
-            if os.path.isdir(pathname):
-                self.handledir(pathname)
-            else:
-                self.handlefile(pathname)
+    def handlefilesinpool(self, filenames, jobs):
+        """Counts the files in a pool of jobs processes.
+
+        The totals are updated and the files are printed as the results
+        arrive, in the same order as when counting in a single process.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        statscache = statsdb.StatsCache()
+        statsfile = statsdb.StatsCache.defaultfile
+        # Create or upgrade the database once, the workers open their own
+        # connections
+        statscache.close()
+        with ProcessPoolExecutor(jobs, initializer=_initworker,
+                                 initargs=(statsfile,)) as pool:
+            for filename, (stats, error) in zip(
+                    filenames, pool.map(_calcstats, filenames)):
+                if error is not None:
+                    logger.error(error)
+                    continue
+                try:
+                    self.handlestats(filename, stats)
+                except Exception:
+                    logger.error(sys.exc_info()[1])
 
     def handledir(self, dirname):
-        path, name = os.path.split(dirname)
-        if name in ["CVS", ".svn", "_darcs", ".git", ".hg", ".bzr"]:
-            return
-        entries = os.listdir(dirname)
-        self.handlefiles(dirname, entries)
+        for filename in self.iterdir(dirname):
+            self.handlefile(filename)
 
 
 def main():
@@ -352,6 +408,10 @@ def main():
         help="show output without color"
     )
 
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, metavar="N",
+        help="count the files in N processes (default: %(default)s)")
+
     parser.add_argument("files", nargs="+")
 
     args = parser.parse_args()
@@ -359,7 +419,7 @@ def main():
     logging.basicConfig(format="%(name)s: %(levelname)s: %(message)s")
     ConsoleColor.color_mode = not args.no_color
 
-    summarizer(args.files, args.style, args.incomplete_only)
+    summarizer(args.files, args.style, args.incomplete_only, args.jobs)
 
 
 if __name__ == '__main__':
@@ -358,7 +358,7 @@ def convertpo(inputfile, outputfile, templatefile, format=None, rewritestyle=Non
     return 1
 
 
-def main():
+def main(argv=None):
     from translate.convert import convert
     formats = {
         "po": ("po", convertpo),
@@ -389,7 +389,7 @@ def main():
     parser.passthrough.append("rewritestyle")
     parser.passthrough.append("ignoreoption")
     parser.passthrough.append("preserveplaceholders")
-    parser.run()
+    parser.run(argv)
 
 
 if __name__ == '__main__':
@@ -102,7 +102,7 @@ def mergestore(inputfile, outputfile, templatefile, mergeblanks="no", mergefuzzy
     return 1
 
 
-def main():
+def main(argv=None):
     from translate.convert import convert
     formats = {
         ("po", "po"): ("po", mergestore),
@@ -140,7 +140,7 @@ def main():
     parser.passthrough.append("mergefuzzy")
     parser.add_option(mergecommentsoption)
     parser.passthrough.append("mergecomments")
-    parser.run()
+    parser.run(argv)
 
 
 if __name__ == '__main__':
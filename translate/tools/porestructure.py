@@ -35,6 +35,9 @@ from translate.storage import po
 class SplitOptionParser(optrecurse.RecursiveOptionParser):
     """a specialized Option Parser for posplit"""
 
+    #: The units of all files are collected by the main process
+    allowjobs = False
+
     def parse_args(self, args=None, values=None):
         """parses the command line options, handling implicit input/output args"""
         (options, args) = optrecurse.RecursiveOptionParser.parse_args(self, args, values)
@@ -88,7 +88,7 @@ def segmentfile(inputfile, outputfile, templatefile, sourcelanguage="en", target
     return 1
 
 
-def main():
+def main(argv=None):
     from translate.convert import convert
     formats = {
         "po": ("po", segmentfile),
@@ -113,7 +113,7 @@ def main():
         "", "--only-aligned", dest="onlyaligned", action="store_true",
         default=False, help="Removes units where sentence number does not correspond")
     parser.passthrough.append("onlyaligned")
-    parser.run()
+    parser.run(argv)
 
 
 if __name__ == '__main__':
@@ -100,14 +100,39 @@ def match_source(input_unit, template_store):
 
 def match_fuzzy(input_unit, matchers):
     """Return a fuzzy match from a queue of matchers."""
+    return match_fuzzy_source(input_unit.source, matchers)
+
+
+def match_fuzzy_source(source, matchers):
+    """Return a fuzzy match for the source text from a queue of matchers."""
     for matcher in matchers:
-        fuzzycandidates = matcher.matches(input_unit.source)
+        fuzzycandidates = matcher.matches(source)
         if fuzzycandidates:
             return fuzzycandidates[0]
 
 
+def match_template(input_unit, template_store, merge_on='id'):
+    """Returns a matching unit from a template, by id or location."""
+    # :param:`merge_on` supports `location` and `id` for now
+    if merge_on == 'location':
+        return match_template_location(input_unit, template_store)
+    return match_template_id(input_unit, template_store)
+
+
+def needs_fuzzy_match(input_unit, template_store, merge_on='id'):
+    """Returns whether :func:`pretranslate_unit` looks for a fuzzy match for
+    the unit, because it has no translation in the template.
+    """
+    if template_store:
+        matching_unit = match_template(input_unit, template_store, merge_on)
+        if matching_unit and matching_unit.gettargetlen() > 0:
+            return False
+    matching_unit = match_source(input_unit, template_store)
+    return not matching_unit or not matching_unit.gettargetlen()
+
+
 def pretranslate_unit(input_unit, template_store, matchers=None,
-                      mark_reused=False, merge_on='id'):
+                      mark_reused=False, merge_on='id', fuzzy_matches=None):
     """Pretranslate a unit or return unchanged if no translation was found.
 
     :param input_unit: Unit that will be pretranslated.
@@ -116,16 +141,14 @@ def pretranslate_unit(input_unit, template_store, matchers=None,
         objects.
     :param mark_reused: Whether to mark old translations as reused or not.
     :param merge_on: Where will the merge matching happen on.
+    :param fuzzy_matches: Fuzzy matches found beforehand, keyed on the source
+        text, used instead of the matchers for the sources in it.
     """
     matching_unit = None
 
     # Do template matching
     if template_store:
-        # :param:`merge_on` supports `location` and `id` for now
-        if merge_on == 'location':
-            matching_unit = match_template_location(input_unit, template_store)
-        else:
-            matching_unit = match_template_id(input_unit, template_store)
+        matching_unit = match_template(input_unit, template_store, merge_on)
 
     if matching_unit and matching_unit.gettargetlen() > 0:
         input_unit.merge(matching_unit, authoritative=True)
@@ -135,7 +158,10 @@ def pretranslate_unit(input_unit, template_store, matchers=None,
 
         if not matching_unit or not matching_unit.gettargetlen():
             # do fuzzy matching
-            matching_unit = match_fuzzy(input_unit, matchers)
+            if fuzzy_matches is not None and input_unit.source in fuzzy_matches:
+                matching_unit = fuzzy_matches[input_unit.source]
+            else:
+                matching_unit = match_fuzzy(input_unit, matchers)
 
         if matching_unit and matching_unit.gettargetlen() > 0:
             # FIXME: should we dispatch here instead of this crude attr check
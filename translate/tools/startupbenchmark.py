@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2026 Zuza Software Foundation
+#
+# This file is part of translate.
+#
+# translate is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# translate is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>.
+
+"""Measures the import time of the command line tools.
+
+Every entry point of the toolkit is imported in a fresh interpreter with
+``python -X importtime``.  The benchmark fails if an entry point takes longer
+than the budget to import, or if it imports a module that should only be
+imported when it is used::
+
+    python -m translate.tools.startupbenchmark --budget 150
+"""
+
+import os
+import re
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+
+DEFAULT_BUDGET = 200
+"""The default import time budget of an entry point in milliseconds"""
+
+DEFAULT_FORBIDDEN = ["Levenshtein", "lxml.etree", "phply", "pycountry"]
+"""Modules that slow down the start up of tools that don't use them"""
+
+DEFAULT_ALLOWED = {
+    "lxml.etree": ["csv2tbx", "flatxml2po", "idml2po", "odf2xliff",
+                   "oo2xliff", "po2flatxml", "po2idml", "po2resx", "po2tmx",
+                   "po2ts", "po2xliff", "tbx2po", "ts2po", "xliff2odf",
+                   "xliff2po"],
+    "phply": ["php2po", "po2php"],
+}
+"""The entry points that need a module of ``DEFAULT_FORBIDDEN`` at start up"""
+
+importtime_re = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+"""A line of ``-X importtime`` output: self time, cumulative time, module"""
+
+entrypoint_re = re.compile(r"\('([\w-]+)', '([\w.]+):(\w+)'\)")
+"""An entry point in the ``translatescripts`` list of ``setup.py``"""
+
+
+def entrypoints(setupfile=None):
+    """Returns (name, module) tuples of the console scripts of the toolkit.
+
+    The entry points are read from ``setup.py`` if it is available, otherwise
+    from the metadata of the installed package.
+    """
+    if setupfile is None:
+        setupfile = os.path.join(os.path.dirname(__file__), os.pardir,
+                                 os.pardir, "setup.py")
+    if os.path.exists(setupfile):
+        with open(setupfile) as setup:
+            return [(name, module) for name, module, function
+                    in entrypoint_re.findall(setup.read())]
+    from importlib import metadata
+    return sorted((entry.name, entry.module)
+                  for entry in metadata.entry_points(group="console_scripts")
+                  if entry.module.startswith("translate."))
+
+
+def parse_importtime(output):
+    """Parses ``-X importtime`` output into a list of
+    (selftime, cumulativetime, depth, module) tuples, times in microseconds.
+    """
+    imports = []
+    for line in output.splitlines():
+        match = importtime_re.match(line)
+        if match:
+            selftime, cumulative, indent, module = match.groups()
+            imports.append((int(selftime), int(cumulative),
+                            len(indent) // 2, module))
+    return imports
+
+
+def importtime(module, repeat=3):
+    """Imports the module in a fresh interpreter and returns the parsed import
+    times of the fastest of the runs.
+    """
+    best = None
+    for i in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True)
+        if process.returncode:
+            raise ImportError("could not import %s:\n%s" %
+                              (module, process.stderr))
+        imports = parse_importtime(process.stderr)
+        if best is None or total(imports, module) < total(best, module):
+            best = imports
+    return best
+
+
+def total(imports, module):
+    """Returns the cumulative import time of the module in microseconds."""
+    for selftime, cumulative, depth, name in imports:
+        if name == module and depth == 0:
+            return cumulative
+    return 0
+
+
+def slowest(imports, count=5):
+    """Returns the modules with the highest self time."""
+    return sorted(imports, reverse=True)[:count]
+
+
+def forbidden_imports(imports, name, forbidden=DEFAULT_FORBIDDEN,
+                      allowed=DEFAULT_ALLOWED):
+    """Returns the forbidden modules in imports that the entry point name is
+    not allowed to import at start up.
+    """
+    imported = set(module for selftime, cumulative, depth, module in imports)
+    return [module for module in forbidden
+            if module in imported and name not in allowed.get(module, [])]
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("names", metavar="NAME", nargs="*",
+                        help="entry points to measure (default: all)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="import time budget in milliseconds "
+                             "(default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of measurements, the fastest is used "
+                             "(default: %(default)s)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="show the slowest modules of every entry point")
+    args = parser.parse_args()
+
+    failures = 0
+    for name, module in entrypoints():
+        if args.names and name not in args.names:
+            continue
+        try:
+            imports = importtime(module, args.repeat)
+        except ImportError as e:
+            print("%-16s skipped: %s" % (name, str(e).splitlines()[-1]))
+            continue
+        milliseconds = total(imports, module) / 1000.0
+        problems = []
+        if milliseconds > args.budget:
+            problems.append("over budget")
+        forbidden = forbidden_imports(imports, name)
+        if forbidden:
+            problems.append("imports %s" % ", ".join(forbidden))
+        print("%-16s %7.1fms %s" % (name, milliseconds, "; ".join(problems)))
+        if args.verbose or problems:
+            for selftime, cumulative, depth, slowmodule in slowest(imports):
+                print("    %7.1fms %s" % (selftime / 1000.0, slowmodule))
+        failures += bool(problems)
+    if failures:
+        print("%d entry points failed" % failures)
+    return failures and 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
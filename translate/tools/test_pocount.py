@@ -157,3 +157,28 @@ msgstr ""
         pofile = BytesIO(self.inputdata)
         stats = pocount.calcstats_old(pofile)
         assert stats['totalsourcewords'] == 6
+
+
+def test_summarizer_jobs(tmpdir, capsys, caplog, monkeypatch):
+    """pocount --jobs prints the same files and totals in the same order"""
+    monkeypatch.setattr(statsdb.StatsCache, "defaultfile",
+                        str(tmpdir.join("stats.db")))
+    for n in range(4):
+        tmpdir.mkdir("dir%d" % n).join("test.po").write_binary(
+            TestPOCount.inputdata * (n + 1))
+    tmpdir.join("broken.po").write_binary(b'msgid "x"\nmsgstr "y"\nmsgstr "z"\n')
+    filenames = [str(tmpdir.join("dir%d" % n)) for n in range(4)]
+    filenames.append(str(tmpdir.join("broken.po")))
+    pocount.summarizer(filenames, pocount.style_csv)
+    serial = capsys.readouterr()
+    serialerrors = [record.getMessage() for record in caplog.records]
+    caplog.clear()
+    statsdb.StatsCache().close()
+    counter = pocount.summarizer(filenames, pocount.style_csv, jobs=2)
+    parallel = capsys.readouterr()
+    assert parallel.out == serial.out
+    assert counter.filecount == 4
+    assert counter.totals["translated"] == 10
+    # Broken files are reported like when counting in a single process
+    assert [record.getMessage() for record in caplog.records] == serialerrors
+    assert len(serialerrors) == 1
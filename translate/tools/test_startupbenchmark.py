@@ -0,0 +1,42 @@
+from translate.tools import startupbenchmark
+
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       150 |        150 |   _io
+import time:      1200 |       1200 |     pycountry
+import time:       300 |       1500 |   translate.lang.data
+import time:       100 |       1750 | translate.tools.pocount
+"""
+
+
+def test_parse_importtime():
+    imports = startupbenchmark.parse_importtime(IMPORTTIME)
+    assert imports == [
+        (150, 150, 1, "_io"),
+        (1200, 1200, 2, "pycountry"),
+        (300, 1500, 1, "translate.lang.data"),
+        (100, 1750, 0, "translate.tools.pocount"),
+    ]
+    assert startupbenchmark.total(imports, "translate.tools.pocount") == 1750
+    assert startupbenchmark.slowest(imports, 1) == [imports[1]]
+
+
+def test_forbidden_imports():
+    imports = startupbenchmark.parse_importtime(IMPORTTIME)
+    assert startupbenchmark.forbidden_imports(imports, "pocount") == ["pycountry"]
+    assert startupbenchmark.forbidden_imports(
+        imports, "pocount", allowed={"pycountry": ["pocount"]}) == []
+
+
+def test_entrypoints():
+    entrypoints = dict(startupbenchmark.entrypoints())
+    assert entrypoints["pocount"] == "translate.tools.pocount"
+    assert entrypoints["po2prop"] == "translate.convert.po2prop"
+
+
+def test_no_heavy_imports():
+    """the tools don't import modules they might not use"""
+    for name in ("pocount", "pofilter", "pot2po", "moz2po"):
+        module = dict(startupbenchmark.entrypoints())[name]
+        imports = startupbenchmark.importtime(module, repeat=1)
+        assert startupbenchmark.forbidden_imports(imports, name) == []